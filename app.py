@@ -4,7 +4,8 @@
 app.py – Macro Dashboard Overlay (SP500 integrated)
 ──────────────────────────────────────────────────
 """
-import numpy as np
+import os
+
 import pandas as pd
 import streamlit as st
 import plotly.graph_objects as go
@@ -12,6 +13,12 @@ import plotly.express as px
 from pathlib import Path
 from dateutil.relativedelta import relativedelta
 
+import backtest
+import downsample
+import panel
+import signals
+import sweep
+
 # ----------------------------------------------------------------
 st.set_page_config(
     page_title="Macro Dashboard Overlay",
@@ -99,83 +106,55 @@ with st.sidebar.expander("ℹ️ 도움말 · Help", expanded=False):
 # ───────────────────────────────────────────────────────────────
 # 1. 데이터 로드
 # ----------------------------------------------------------------
-DATA_FP = Path("data/all_data.csv")
-if not DATA_FP.exists():
-    st.error("❌ data/all_data.csv 파일을 찾을 수 없습니다. 경로를 확인해 주세요.")
+DATA_DIR = Path("data")
+if not panel.available(DATA_DIR):
+    st.error("❌ data/native.parquet 또는 data/all_data.parquet(.csv) 파일을 찾을 수 없습니다. 경로를 확인해 주세요.")
     st.stop()
+DATA_START = pd.Timestamp("2008-01-01")
+# 대시보드가 쓰는 컬럼 – 저장소에서 이것만 읽는다 (탭·점수·스냅샷)
+PANEL_COLUMNS = (
+    "FX", "Gold", "Gold_KRWg",
+    "Rate", "Bond10", "Rate_US", "Bond10_US", "Spread5D",
+    "M2_D", "M2_US_D", "CPI_D", "CoreCPI_D", "RealRate_D",
+    "SP500", "KODEX200", "Bitcoin",
+)
+# 세션마다 패널 사본을 두지 않고, 압축 패널 한 벌을 공유해 필요한 구간만 펼친다.
+PANEL_COMPACT = os.getenv("PANEL_COMPACT", "") == "1"
+# 저장소 변경 확인 주기(초) – 이 간격으로 새 데이터를 확인해 화면을 다시 그린다 (0 이면 끔)
+DATA_POLL_S = float(os.getenv("DATA_POLL_S", "10"))
 
 
-@st.cache_data(show_spinner=False)
-def load_df(path: Path) -> pd.DataFrame:
-    """CSV 로드 및 컬럼 정리 과정을 캐시합니다."""
-    try:
-        df = pd.read_csv(path, index_col=0, parse_dates=True)
-    except Exception as exc:
-        raise RuntimeError(f"CSV 로드 실패: {path}") from exc
-
-    df = df.ffill().loc["2008-01-01":]
-
-    # Gold 원화 환산 – CSV에 없을 때만 계산
-    a0_cols = df.columns
-    if "Gold_KRWg" not in a0_cols and {"Gold", "FX"}.issubset(a0_cols):
-        df["Gold_KRWg"] = df["Gold"] * df["FX"] / 31.1035
-
-    # KODEX 200 컬럼 정규화
-    for c in df.columns:
-        if c.lower().replace(" ", "").startswith("kodex200") or "069500" in c.lower():
-            df.rename(columns={c: "KODEX200"}, inplace=True)
-            break
-
-    # S&P 500 컬럼 정규화
-    for c in df.columns:
-        if c.lower() in {"sp500", "^gspc"} or "sp500" in c.lower():
-            df.rename(columns={c: "SP500"}, inplace=True)
-            break
-
-    # M2 일별 보간
-    after_cols = df.columns
-    if "M2_D" not in after_cols and "M2" in after_cols:
-        df["M2_D"] = df["M2"].resample("D").interpolate("linear")
-    if "M2_US_D" not in after_cols and "M2_US" in after_cols:
-        df["M2_US_D"] = df["M2_US"].resample("D").interpolate("linear")
-
-    # CPI 및 Core CPI 컬럼 정규화
-    for c in list(df.columns):
-        uc = c.upper()
-        if uc.startswith("CPIAUCSL"):
-            df.rename(
-                columns={c: "CPI" if not uc.endswith("_D") else "CPI_D"}, inplace=True
-            )
-        elif uc.startswith("CPILFESL"):
-            df.rename(
-                columns={c: "CoreCPI" if not uc.endswith("_D") else "CoreCPI_D"},
-                inplace=True,
-            )
-
-    # CPI 일별 보간
-    after_cols = df.columns
-    if "CPI_D" not in after_cols and "CPI" in after_cols:
-        df["CPI_D"] = df["CPI"].resample("D").ffill()
-    if "CoreCPI_D" not in after_cols and "CoreCPI" in after_cols:
-        df["CoreCPI_D"] = df["CoreCPI"].resample("D").ffill()
-
-    # Real Rate 계산 (정책금리 - CPI YoY)
-    if "RealRate_D" not in after_cols and {"Rate", "CPI_D"}.issubset(after_cols):
-        cpi_yoy = df["CPI_D"].resample("ME").last().pct_change(12) * 100
-        rr = (df["Rate"].resample("ME").last() - cpi_yoy).reindex(
-            df.index, method="ffill"
-        )
-        df["RealRate_D"] = rr
+@st.cache_resource(show_spinner=False)
+def live_panel(path: Path, compact: bool) -> panel.LivePanel:
+    """모든 세션이 함께 쓰는 패널 – 요청 컬럼만 읽고, 저장소가 바뀌면 새 행만 붙입니다.
 
-    return df
+    컬럼 이름 정리와 파생 컬럼은 저장소 쪽에서 이미 끝나 있다 (native 는 수집 시,
+    예전 all_data 는 panel.prepare_legacy 가 처음 한 번).
+    """
+    return panel.LivePanel(path, columns=PANEL_COLUMNS, start=DATA_START, compact=compact)
 
 
 try:
-    df: pd.DataFrame = load_df(DATA_FP)
+    live = live_panel(DATA_DIR, PANEL_COMPACT)
+    live.refresh()  # 재실행마다 stat 한 번 – 새로 받은 데이터가 있으면 꼬리만 읽어 붙인다
 except Exception as exc:
-    st.error("❌ 데이터 로딩 중 오류가 발생했습니다. CSV 형식/인코딩을 확인해 주세요.")
+    st.error("❌ 데이터 로딩 중 오류가 발생했습니다. 파일 형식/인코딩을 확인해 주세요.")
     st.exception(exc)
     st.stop()
+if len(live.index) == 0:
+    st.warning("표시할 데이터가 없습니다.")
+    st.stop()
+first_date, last_date = live.index[0], live.index[-1]
+
+
+if DATA_POLL_S > 0:
+    @st.fragment(run_every=DATA_POLL_S)
+    def watch_data():
+        """사용자 입력이 없어도 주기적으로 저장소를 확인해, 바뀌었으면 앱을 다시 그린다."""
+        if live.refresh():
+            st.rerun()
+
+    watch_data()
 
 # ───────────────────────────────────────────────────────────────
 # 2. 기간 슬라이더 & View DF
@@ -183,9 +162,16 @@ except Exception as exc:
 with st.sidebar:
     st.markdown("### 📅 표시 기간")
 
-    end_date = df.index.max().date()
-    start_date = df.index.min().date()
-    mid_date = df.index.max().date() - relativedelta(years=3)
+    end_date = last_date.date()
+    start_date = first_date.date()
+    mid_date = last_date.date() - relativedelta(years=3)
+
+    # 데이터가 늘었을 때 최신일까지 보고 있던 사용자는 새 마지막 날까지 따라간다.
+    seen_end = st.session_state.get("data_end")
+    selected = st.session_state.get("date_slider_3y")
+    if seen_end is not None and seen_end != end_date and selected and selected[1] == seen_end:
+        st.session_state["date_slider_3y"] = (selected[0], end_date)
+    st.session_state["data_end"] = end_date
 
     d0, d1, d2 = start_date, end_date, mid_date
     _date = st.slider(
@@ -193,7 +179,7 @@ with st.sidebar:
     )
     d_from, d_to = _date
 
-view = df.loc[pd.to_datetime(d_from) : pd.to_datetime(d_to)].copy()
+view = live.frame(start=d_from, end=d_to)
 if view.empty:
     st.warning("선택한 기간에 데이터가 없습니다.")
     st.stop()
@@ -205,58 +191,17 @@ sig_dt = view.index[-1].strftime("%Y-%m-%d")
 # ----------------------------------------------------------------
 
 
-def trend_score(series, short: int = 20, long: int = 50):
-    ma_s, ma_l = series.rolling(short).mean(), series.rolling(long).mean()
-    cross = np.sign(ma_s - ma_l)
-    mom_1m = np.sign(series.pct_change(21))
-    return (cross + mom_1m).clip(-2, 2)
-
-
-trend = {}
-if "Gold_KRWg" in view:
-    trend["Gold"] = trend_score(view["Gold_KRWg"])
-if "KODEX200" in view:
-    trend["KODEX"] = trend_score(view["KODEX200"])
-if "SP500" in view:
-    trend["SP500"] = trend_score(view["SP500"])
-if "Bitcoin" in view:
-    trend["BTC"] = trend_score(view["Bitcoin"])
-if "FX" in view:
-    trend["USDKRW"] = trend_score(view["FX"])
-
-# Macro score (M2 YoY + 금리 스프레드)
-macro = pd.Series(0, index=view.index)
-if "M2_D" in view:
-    month = view["M2_D"].resample("ME").last()
-    m2_yoy = (month.pct_change(12) * 100).rename("M2_YoY")
-
-    def m2_cls(x):
-        if pd.isna(x):
-            return -1
-        if x > 9:
-            return 2
-        if x >= 6:
-            return 1
-        if x >= 3:
-            return -1
-        return -2
-
-    m2_score = m2_yoy.apply(m2_cls).reindex(view.index, method="ffill")
-    macro = macro.add(m2_score, fill_value=0)
-    s_m2 = m2_score
-else:
-    s_m2 = pd.Series(dtype=float)
-
-if "Spread5D" in view.columns:
-    spread = view["Spread5D"]
-    spread_score = spread.apply(lambda x: 1 if x > 0.5 else -1 if x < 0 else 0)
-    macro = macro.add(spread_score, fill_value=0)
-elif {"Rate", "Bond10"}.issubset(view.columns):
-    spread = (view["Bond10"] - view["Rate"]).rolling(5).mean()
-    spread_score = spread.apply(lambda x: 1 if x > 0.5 else -1 if x < 0 else 0)
-    macro = macro.add(spread_score, fill_value=0)
-
-macro = macro.clip(-3, 3)
+@st.cache_resource(show_spinner=False, max_entries=2)
+def signal_store(version) -> signals.SignalStore:
+    """데이터 버전마다 한 번 – 전체 이력 점수표를 만들어 모든 세션이 함께 씁니다.
+
+    이동평균·YoY 워밍업이 보이는 구간 앞부분을 비우지 않아, 시그널이 시작일과 무관하다.
+    슬라이더를 움직이면 위치 슬라이스만 다시 한다.
+    """
+    return signals.SignalStore(live.frame())
+
+
+store = signal_store(live.version)
 
 # ───────────────────────────────────────────────────────────────
 # 4. 색상·유틸 및 월별 세로선 함수
@@ -275,23 +220,25 @@ def vlines(*args, **kwargs):
     return []
 
 
-# 매월 1일에 얇은 세로선 추가 – 한 번만 실행
+# 매월 1일에 얇은 세로선 – 달마다 도형을 쌓지 않고 x축 보조 격자 하나로 그린다.
 
 
-def add_monthly_guides(fig: go.Figure, start: pd.Timestamp, end: pd.Timestamp):
-    """주어진 구간의 매월 1일에 세로선을 한 번씩 추가합니다."""
-    for dt in pd.date_range(start=start.normalize(), end=end.normalize(), freq="MS"):
-        fig.add_shape(
-            type="line",
-            x0=dt,
-            x1=dt,
-            yref="paper",
-            y0=0,
-            y1=1,
-            line=dict(color="#bdc3c7", width=1, dash="dot"),
-            opacity=0.3,
-            layer="below",
+def add_monthly_guides(fig: go.Figure):
+    """x축 보조 격자(1개월 간격)로 매월 1일 세로 점선을 그립니다.
+
+    도형(shape)은 달마다 하나씩 레이아웃에 쌓여 추가·직렬화·재배치 비용이 기간에
+    비례하지만, 격자는 축 설정 하나라 기간과 무관하고 확대할 때도 브라우저가 다시 긋는다.
+    """
+    fig.update_xaxes(
+        minor=dict(
+            dtick="M1",
+            tick0="2000-01-01",
+            showgrid=True,
+            gridcolor="rgba(189, 195, 199, 0.3)",
+            griddash="dot",
+            gridwidth=1,
         )
+    )
 
 
 # ───────────────────────────────────────────────────────────────
@@ -357,6 +304,12 @@ if not selected_tabs:
 
 st.sidebar.markdown("### ⚖️ 값 스케일")
 scale_mode = st.sidebar.radio("값 스케일", ("원본 값", "표준화 (0‑1 Min‑Max)"), index=1)
+fast_chart = st.sidebar.toggle(
+    "긴 기간 빠른 렌더링",
+    value=True,
+    help="트레이스마다 화면 폭 수준의 점만 남기고(구간별 최소·최대) WebGL 로 그리며, "
+    "범위 슬라이더는 끕니다. 기간을 좁히면 그 구간을 원래 해상도로 다시 그립니다.",
+)
 
 # ───────────────────────────────────────────────────────────────
 # 5‑1. 보조 지표 토글 섹션
@@ -377,8 +330,8 @@ for k in selected_tabs:
 # ----------------------------------------------------------------
 
 
-def scaler(series: pd.Series):
-    if scale_mode.startswith("표준화"):
+def scaler(series: pd.Series, scale: str):
+    if scale.startswith("표준화"):
         rng = series.max() - series.min()
 
         if rng != 0:
@@ -388,294 +341,302 @@ def scaler(series: pd.Series):
     return series
 
 
-# ───────────────────────────────────────────────────────────────
-# 7. Figure – 선택 탭 Trace 합성
-# ----------------------------------------------------------------
-fig = go.Figure()
-color_iter = iter(COLORS)
-
-for tab in selected_tabs:
-    # Gold (원/g)
-    if tab == "Gold" and "Gold_KRWg" in view:
-        g = view[["Gold_KRWg"]].rename(columns={"Gold_KRWg": "Gold"})
-        if aux_enabled["Gold"]:
-            for ma in (20, 50, 120):
-                g[f"MA{ma}"] = g["Gold"].rolling(ma).mean()
-        for col in g.columns:
-            fig.add_scatter(
-                x=g.index,
-                y=scaler(g[col]),
-                name=f"Gold {col}" if col != "Gold" else "Gold",
-                mode="lines",
-                line=dict(width=2, color=next(color_iter)),
-            )
-
-    # KODEX 200
-    elif tab == "KODEX" and "KODEX200" in view:
-        k = view[["KODEX200"]]
-        if aux_enabled["KODEX"]:
-            for ma in (20, 50, 120):
-                k[f"MA{ma}"] = k["KODEX200"].rolling(ma).mean()
-        for col in k.columns:
-            fig.add_scatter(
-                x=k.index,
-                y=scaler(k[col]),
-                name=f"KODEX {col}" if col != "KODEX200" else "KODEX200",
-                mode="lines",
-                line=dict(width=2, color=next(color_iter)),
-            )
+# 긴 기간에도 트레이스마다 점 수를 화면 폭 수준으로 유지하고, 점이 많으면 WebGL 로 그린다.
+CHART_POINTS = int(os.getenv("CHART_POINTS", str(downsample.MAX_POINTS)))
+CHART_GL_POINTS = int(os.getenv("CHART_GL_POINTS", "1000"))
 
-    # S&P 500
-    elif tab == "SP500" and "SP500" in view:
-        s = view[["SP500"]]
-        if aux_enabled["SP500"]:
-            for ma in (20, 50, 120):
-                s[f"MA{ma}"] = s["SP500"].rolling(ma).mean()
-        for col in s.columns:
-            fig.add_scatter(
-                x=s.index,
-                y=scaler(s[col]),
-                name=f"S&P500 {col}" if col != "SP500" else "S&P 500",
-                mode="lines",
-                line=dict(width=2, color=next(color_iter)),
-            )
 
-    # Bitcoin
-    elif tab == "BTC" and "Bitcoin" in view:
-        b = view[["Bitcoin"]]
-        if aux_enabled["BTC"]:
-            for ma in (20, 50, 120):
-                b[f"MA{ma}"] = b["Bitcoin"].rolling(ma).mean()
-        for col in b.columns:
-            fig.add_scatter(
-                x=b.index,
-                y=scaler(b[col]),
-                name=f"BTC {col}" if col != "Bitcoin" else "Bitcoin",
-                mode="lines",
-                line=dict(width=2, color=next(color_iter)),
-            )
+def add_line(fig: go.Figure, series: pd.Series, *, name: str, line: dict, fast: bool):
+    """선 트레이스 하나 – 빠른 렌더링(``fast``)이면 다운샘플링하고, 점이 많으면 Scattergl 로."""
+    if fast:
+        x, y = downsample.series(series, CHART_POINTS)
+    else:
+        x, y = series.index, series
+    trace = go.Scattergl if len(x) > CHART_GL_POINTS else go.Scatter
+    fig.add_trace(trace(x=x, y=y, name=name, mode="lines", line=line))
 
-    # M2
-    elif tab == "M2" and "M2_D" in view:
-        m = view["M2_D"].resample("ME").last().to_frame("M2_M")
-        if aux_enabled["M2"]:
-            m["MA6"] = m.M2_M.rolling(6).mean()
-            m["MA12"] = m.M2_M.rolling(12).mean()
-            yoy = (m.M2_M.pct_change(12) * 100).rename("YoY%")
-            fig.add_bar(
-                x=yoy.index,
-                y=scaler(yoy),
-                name="M2 YoY% (bar)",
-                opacity=0.45,
-                marker_color=next(color_iter),
-            )
-        for col in m.columns:
-            fig.add_scatter(
-                x=m.index,
-                y=scaler(m[col]),
-                name=f"{col}",
-                mode="lines",
-                line=dict(width=2, color=next(color_iter)),
-            )
 
-    # M2US
-    elif tab == "M2US" and "M2_US_D" in view:
-        m = view["M2_US_D"].resample("ME").last().to_frame("M2US_M")
-        if aux_enabled["M2US"]:
-            m["MA6"] = m.M2US_M.rolling(6).mean()
-            m["MA12"] = m.M2US_M.rolling(12).mean()
-            yoy = (m.M2US_M.pct_change(12) * 100).rename("YoY%")
-            fig.add_bar(
-                x=yoy.index,
-                y=scaler(yoy),
-                name="US M2 YoY% (bar)",
-                opacity=0.45,
-                marker_color=next(color_iter),
-            )
-        for col in m.columns:
-            fig.add_scatter(
-                x=m.index,
-                y=scaler(m[col]),
-                name=f"{col}",
-                mode="lines",
-                line=dict(width=2, color=next(color_iter)),
-            )
+# ───────────────────────────────────────────────────────────────
+# 7. Figure – 선택 탭 Trace 합성
+# ----------------------------------------------------------------
+# 같은 조건(탭·보조 지표·스케일·렌더링·기간·데이터 버전)의 그림은 세션끼리 공유한다.
+FIGURE_CACHE = int(os.getenv("FIGURE_CACHE", "32"))
 
-    # USDKRW
-    elif tab == "USDKRW" and "FX" in view:
-        fx = view[["FX"]]
-        if aux_enabled["USDKRW"]:
-            for ma in (20, 50, 120):
-                fx[f"MA{ma}"] = fx["FX"].rolling(ma).mean()
-        for col in fx.columns:
-            fig.add_scatter(
-                x=fx.index,
-                y=scaler(fx[col]),
-                name=f"FX {col}" if col != "FX" else "USD/KRW",
-                mode="lines",
-                line=dict(width=2, color=next(color_iter)),
-            )
 
-    # CPI · Core CPI
-    elif tab == "CPI" and {"CPI_D", "CoreCPI_D"}.issubset(view.columns):
-        df_cpi = pd.DataFrame({
-            "CPI": view["CPI_D"].resample("ME").last(),
-            "CoreCPI": view["CoreCPI_D"].resample("ME").last(),
-        })
-        if aux_enabled.get("CPI"):
-            yoy = (df_cpi["CPI"].pct_change(12) * 100).rename("CPI YoY%")
-            fig.add_bar(
-                x=yoy.index,
-                y=scaler(yoy),
-                name="CPI YoY% (bar)",
-                opacity=0.45,
-                marker_color=next(color_iter),
-            )
-            yoy2 = (df_cpi["CoreCPI"].pct_change(12) * 100).rename("Core CPI YoY%")
-            fig.add_bar(
-                x=yoy2.index,
-                y=scaler(yoy2),
-                name="Core CPI YoY% (bar)",
-                opacity=0.45,
-                marker_color=next(color_iter),
-            )
-        for col in df_cpi.columns:
-            fig.add_scatter(
-                x=df_cpi.index,
-                y=scaler(df_cpi[col]),
-                name=col,
-                mode="lines",
-                line=dict(width=2, color=next(color_iter)),
-            )
+@st.cache_resource(show_spinner=False, max_entries=FIGURE_CACHE)
+def overlay_figure(tabs, aux, scale, fast, start, end, version) -> dict:
+    """선택 탭 Overlay 그림의 dict – 인자가 같으면 모든 세션이 같은 객체를 받습니다.
 
-    # Real Rate
-    elif tab == "RealRate" and {"RealRate_D"}.issubset(view.columns):
-        rr = view["RealRate_D"].resample("ME").last().to_frame(name="RealRate")
-        for col in rr.columns:
-            fig.add_scatter(
-                x=rr.index,
-                y=scaler(rr[col]),
-                name=col,
-                mode="lines",
-                line=dict(width=2, color=next(color_iter)),
-            )
+    인자는 캐시 키이고 그림은 인자만으로 그립니다. 공유 객체라 세션마다 ``go.Figure`` 로
+    새로 만들어 그리며, 돌려받은 dict 는 고치지 않습니다.
+    """
+    view = live.frame(start=start, end=end)
+    aux_enabled = dict(aux)
+    fig = go.Figure()
+    color_iter = iter(COLORS)
+
+    for tab in tabs:
+        # Gold (원/g)
+        if tab == "Gold" and "Gold_KRWg" in view:
+            g = view[["Gold_KRWg"]].rename(columns={"Gold_KRWg": "Gold"})
+            if aux_enabled["Gold"]:
+                for ma in (20, 50, 120):
+                    g[f"MA{ma}"] = g["Gold"].rolling(ma).mean()
+            for col in g.columns:
+                add_line(
+                    fig,
+                    scaler(g[col], scale),
+                    name=f"Gold {col}" if col != "Gold" else "Gold",
+                    line=dict(width=2, color=next(color_iter)),
+                    fast=fast,
+                )
+
+        # KODEX 200
+        elif tab == "KODEX" and "KODEX200" in view:
+            k = view[["KODEX200"]]
+            if aux_enabled["KODEX"]:
+                for ma in (20, 50, 120):
+                    k[f"MA{ma}"] = k["KODEX200"].rolling(ma).mean()
+            for col in k.columns:
+                add_line(
+                    fig,
+                    scaler(k[col], scale),
+                    name=f"KODEX {col}" if col != "KODEX200" else "KODEX200",
+                    line=dict(width=2, color=next(color_iter)),
+                    fast=fast,
+                )
+
+        # S&P 500
+        elif tab == "SP500" and "SP500" in view:
+            s = view[["SP500"]]
+            if aux_enabled["SP500"]:
+                for ma in (20, 50, 120):
+                    s[f"MA{ma}"] = s["SP500"].rolling(ma).mean()
+            for col in s.columns:
+                add_line(
+                    fig,
+                    scaler(s[col], scale),
+                    name=f"S&P500 {col}" if col != "SP500" else "S&P 500",
+                    line=dict(width=2, color=next(color_iter)),
+                    fast=fast,
+                )
+
+        # Bitcoin
+        elif tab == "BTC" and "Bitcoin" in view:
+            b = view[["Bitcoin"]]
+            if aux_enabled["BTC"]:
+                for ma in (20, 50, 120):
+                    b[f"MA{ma}"] = b["Bitcoin"].rolling(ma).mean()
+            for col in b.columns:
+                add_line(
+                    fig,
+                    scaler(b[col], scale),
+                    name=f"BTC {col}" if col != "Bitcoin" else "Bitcoin",
+                    line=dict(width=2, color=next(color_iter)),
+                    fast=fast,
+                )
+
+        # M2
+        elif tab == "M2" and "M2_D" in view:
+            m = view["M2_D"].resample("ME").last().to_frame("M2_M")
+            if aux_enabled["M2"]:
+                m["MA6"] = m.M2_M.rolling(6).mean()
+                m["MA12"] = m.M2_M.rolling(12).mean()
+                yoy = (m.M2_M.pct_change(12) * 100).rename("YoY%")
+                fig.add_bar(
+                    x=yoy.index,
+                    y=scaler(yoy, scale),
+                    name="M2 YoY% (bar)",
+                    opacity=0.45,
+                    marker_color=next(color_iter),
+                )
+            for col in m.columns:
+                add_line(
+                    fig,
+                    scaler(m[col], scale),
+                    name=f"{col}",
+                    line=dict(width=2, color=next(color_iter)),
+                    fast=fast,
+                )
+
+        # M2US
+        elif tab == "M2US" and "M2_US_D" in view:
+            m = view["M2_US_D"].resample("ME").last().to_frame("M2US_M")
+            if aux_enabled["M2US"]:
+                m["MA6"] = m.M2US_M.rolling(6).mean()
+                m["MA12"] = m.M2US_M.rolling(12).mean()
+                yoy = (m.M2US_M.pct_change(12) * 100).rename("YoY%")
+                fig.add_bar(
+                    x=yoy.index,
+                    y=scaler(yoy, scale),
+                    name="US M2 YoY% (bar)",
+                    opacity=0.45,
+                    marker_color=next(color_iter),
+                )
+            for col in m.columns:
+                add_line(
+                    fig,
+                    scaler(m[col], scale),
+                    name=f"{col}",
+                    line=dict(width=2, color=next(color_iter)),
+                    fast=fast,
+                )
+
+        # USDKRW
+        elif tab == "USDKRW" and "FX" in view:
+            fx = view[["FX"]]
+            if aux_enabled["USDKRW"]:
+                for ma in (20, 50, 120):
+                    fx[f"MA{ma}"] = fx["FX"].rolling(ma).mean()
+            for col in fx.columns:
+                add_line(
+                    fig,
+                    scaler(fx[col], scale),
+                    name=f"FX {col}" if col != "FX" else "USD/KRW",
+                    line=dict(width=2, color=next(color_iter)),
+                    fast=fast,
+                )
+
+        # CPI · Core CPI
+        elif tab == "CPI" and {"CPI_D", "CoreCPI_D"}.issubset(view.columns):
+            df_cpi = pd.DataFrame({
+                "CPI": view["CPI_D"].resample("ME").last(),
+                "CoreCPI": view["CoreCPI_D"].resample("ME").last(),
+            })
+            if aux_enabled.get("CPI"):
+                yoy = (df_cpi["CPI"].pct_change(12) * 100).rename("CPI YoY%")
+                fig.add_bar(
+                    x=yoy.index,
+                    y=scaler(yoy, scale),
+                    name="CPI YoY% (bar)",
+                    opacity=0.45,
+                    marker_color=next(color_iter),
+                )
+                yoy2 = (df_cpi["CoreCPI"].pct_change(12) * 100).rename("Core CPI YoY%")
+                fig.add_bar(
+                    x=yoy2.index,
+                    y=scaler(yoy2, scale),
+                    name="Core CPI YoY% (bar)",
+                    opacity=0.45,
+                    marker_color=next(color_iter),
+                )
+            for col in df_cpi.columns:
+                add_line(
+                    fig,
+                    scaler(df_cpi[col], scale),
+                    name=col,
+                    line=dict(width=2, color=next(color_iter)),
+                    fast=fast,
+                )
+
+        # Real Rate
+        elif tab == "RealRate" and {"RealRate_D"}.issubset(view.columns):
+            rr = view["RealRate_D"].resample("ME").last().to_frame(name="RealRate")
+            for col in rr.columns:
+                add_line(
+                    fig,
+                    scaler(rr[col], scale),
+                    name=col,
+                    line=dict(width=2, color=next(color_iter)),
+                    fast=fast,
+                )
+
+        # Korean Rate & 10Y
+        elif tab == "RateKR" and {"Rate", "Bond10"}.issubset(view.columns):
+            cols = ["Rate", "Bond10"]
+            r = view[cols].copy()
+            if aux_enabled["RateKR"]:
+                for base_col in cols:
+                    m = r[base_col].resample("ME").last()
+                    r[f"{base_col}_MA3M"] = m.rolling(3).mean().reindex(r.index, method="ffill")
+            for col in r.columns:
+                add_line(
+                    fig,
+                    scaler(r[col], scale),
+                    name=col,
+                    line=dict(
+                        width=2,
+                        color=next(color_iter),
+                        dash="dot" if "MA" in col else "solid",
+                    ),
+                    fast=fast,
+                )
+        # US Rate & 10Y
+        elif tab == "RateUS" and {"Rate_US", "Bond10_US"}.issubset(view.columns):
+            cols = ["Rate_US", "Bond10_US"]
+            r = view[cols].copy()
+            if aux_enabled["RateUS"]:
+                for base_col in cols:
+                    m = r[base_col].resample("ME").last()
+                    r[f"{base_col}_MA3M"] = m.rolling(3).mean().reindex(r.index, method="ffill")
+            for col in r.columns:
+                add_line(
+                    fig,
+                    scaler(r[col], scale),
+                    name=col,
+                    line=dict(
+                        width=2,
+                        color=next(color_iter),
+                        dash="dot" if "MA" in col else "solid",
+                    ),
+                    fast=fast,
+                )
+
+    # 월별 세로 가이드라인 추가
+    add_monthly_guides(fig)
+
+    # ───────────────────────────────────────────────────────────────
+    # 8. Figure Layout
+    # ----------------------------------------------------------------
+    # 원본 값일 때는 금액(원), 지수 또는 비율(%) 등 여러 단위를 포괄적으로 표시한다.
+    y_title = (
+        "Value (원·지수/%)" if scale.startswith("원본") else "표준화 값 (0–1)"
+    )
+    fig.update_layout(
+        height=640,
+        title=f"선택한 탭 Overlay – {scale}",
+        hovermode="x unified",
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+        yaxis_title=y_title,
+        margin=dict(l=40, r=40, t=60, b=40),
+    )
+    # 범위 슬라이더는 모든 트레이스를 한 번 더 그리므로 빠른 렌더링에서는 끈다.
+    fig.update_xaxes(rangeslider_visible=not fast)
 
-    # Korean Rate & 10Y
-    elif tab == "RateKR" and {"Rate", "Bond10"}.issubset(view.columns):
-        cols = ["Rate", "Bond10"]
-        r = view[cols].copy()
-        if aux_enabled["RateKR"]:
-            for base_col in cols:
-                m = r[base_col].resample("ME").last()
-                r[f"{base_col}_MA3M"] = m.rolling(3).mean().reindex(r.index, method="ffill")
-        for col in r.columns:
-            fig.add_scatter(
-                x=r.index,
-                y=scaler(r[col]),
-                name=col,
-                mode="lines",
-                line=dict(
-                    width=2,
-                    color=next(color_iter),
-                    dash="dot" if "MA" in col else "solid",
-                ),
-            )
-    # US Rate & 10Y
-    elif tab == "RateUS" and {"Rate_US", "Bond10_US"}.issubset(view.columns):
-        cols = ["Rate_US", "Bond10_US"]
-        r = view[cols].copy()
-        if aux_enabled["RateUS"]:
-            for base_col in cols:
-                m = r[base_col].resample("ME").last()
-                r[f"{base_col}_MA3M"] = m.rolling(3).mean().reindex(r.index, method="ffill")
-        for col in r.columns:
-            fig.add_scatter(
-                x=r.index,
-                y=scaler(r[col]),
-                name=col,
-                mode="lines",
-                line=dict(
-                    width=2,
-                    color=next(color_iter),
-                    dash="dot" if "MA" in col else "solid",
-                ),
-            )
+    return fig.to_dict()
 
-# 월별 세로 가이드라인 추가
-add_monthly_guides(fig, view.index.min(), view.index.max())
 
-# ───────────────────────────────────────────────────────────────
-# 8. Figure Layout
-# ----------------------------------------------------------------
-# 원본 값일 때는 금액(원), 지수 또는 비율(%) 등 여러 단위를 포괄적으로 표시한다.
-y_title = (
-    "Value (원·지수/%)" if scale_mode.startswith("원본") else "표준화 값 (0–1)"
+spec = overlay_figure(
+    tuple(selected_tabs), tuple(aux_enabled.items()), scale_mode, fast_chart, d_from, d_to, live.version
 )
-fig.update_layout(
-    height=640,
-    title=f"선택한 탭 Overlay – {scale_mode}",
-    hovermode="x unified",
-    legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
-    yaxis_title=y_title,
-    margin=dict(l=40, r=40, t=60, b=40),
-)
-fig.update_xaxes(rangeslider_visible=True)
-
-st.plotly_chart(fig, use_container_width=True)
+st.plotly_chart(go.Figure(spec), use_container_width=True)
 
 # ───────────────────────────────────────────────────────────────
 # 9. Snapshot (원본 값 기준)
 # ----------------------------------------------------------------
 
-snap_vals = {}
-def _last_valid(series: pd.Series):
-    series = series.dropna()
-    return series.iloc[-1] if not series.empty else None
-
-if "Gold_KRWg" in view and not view["Gold_KRWg"].dropna().empty:
-    snap_vals["Gold (원/g)"] = _last_valid(view["Gold_KRWg"])
-if "KODEX200" in view and not view["KODEX200"].dropna().empty:
-    snap_vals["KODEX 200"] = _last_valid(view["KODEX200"])
-if "SP500" in view and not view["SP500"].dropna().empty:
-    snap_vals["S&P 500"] = _last_valid(view["SP500"])
-if "Bitcoin" in view and not view["Bitcoin"].dropna().empty:
-    snap_vals["Bitcoin"] = _last_valid(view["Bitcoin"])
-if "FX" in view and not view["FX"].dropna().empty:
-    snap_vals["USD/KRW"] = _last_valid(view["FX"])
-if "Rate" in view and not view["Rate"].dropna().empty:
-    snap_vals["기준금리 (%)"] = _last_valid(view["Rate"])
-if "Bond10" in view and not view["Bond10"].dropna().empty:
-    snap_vals["10Y (%)"] = _last_valid(view["Bond10"])
-if "Rate_US" in view and not view["Rate_US"].dropna().empty:
-    snap_vals["연준금리 (%)"] = _last_valid(view["Rate_US"])
-if "Bond10_US" in view and not view["Bond10_US"].dropna().empty:
-    snap_vals["미국10Y (%)"] = _last_valid(view["Bond10_US"])
-if "M2_D" in view and not view["M2_D"].dropna().empty:
-    snap_vals["국내 M2 월말"] = _last_valid(view["M2_D"].resample("ME").last())
-if "M2_US_D" in view and not view["M2_US_D"].dropna().empty:
-    snap_vals["미국 M2 월말"] = _last_valid(view["M2_US_D"].resample("ME").last())
-if "CPI_D" in view and not view["CPI_D"].dropna().empty:
-    snap_vals["CPI"] = _last_valid(view["CPI_D"].resample("ME").last())
-if "RealRate_D" in view and not view["RealRate_D"].dropna().empty:
-    snap_vals["Real Rate"] = _last_valid(view["RealRate_D"].resample("ME").last())
+# (라벨, 컬럼, 단위) – 표에 싣는 순서. 월 지표(M2·CPI·실질금리)의 마지막 월말 값은
+# 일 격자의 마지막 유효 값과 같으므로 따로 월말로 묶지 않는다.
+SNAPSHOT = (
+    ("Gold (원/g)", "Gold_KRWg", " ₩"),
+    ("KODEX 200", "KODEX200", " ₩"),
+    ("S&P 500", "SP500", " $"),
+    ("Bitcoin", "Bitcoin", " $"),
+    ("USD/KRW", "FX", " ₩"),
+    ("기준금리 (%)", "Rate", " %"),
+    ("10Y (%)", "Bond10", " %"),
+    ("연준금리 (%)", "Rate_US", " %"),
+    ("미국10Y (%)", "Bond10_US", " %"),
+    ("국내 M2 월말", "M2_D", "B ₩"),
+    ("미국 M2 월말", "M2_US_D", "B $"),
+    ("CPI", "CPI_D", ""),
+    ("Real Rate", "RealRate_D", " %"),
+)
 
-st.markdown("### 최근 값 Snapshot")
+# 모든 지표의 마지막 유효 값을 배열 연산 한 번으로
+snap_last = panel.last_valid(view, [col for _, col, _ in SNAPSHOT])
 
-snap_units = {
-    "Gold (원/g)": " ₩",
-    "KODEX 200": " ₩",
-    "S&P 500": " $",
-    "Bitcoin": " $",
-    "USD/KRW": " ₩",
-    "기준금리 (%)": " %",
-    "10Y (%)": " %",
-    "연준금리 (%)": " %",
-    "미국10Y (%)": " %",
-    "국내 M2 월말": "B ₩",
-    "미국 M2 월말": "B $",
-    "CPI": "",
-    "Real Rate": " %",
-}
+st.markdown("### 최근 값 Snapshot")
 
 def _fmt(val: float, unit: str) -> str:
     u = unit.strip()
@@ -686,8 +647,9 @@ def _fmt(val: float, unit: str) -> str:
 
 snap_tbl = pd.DataFrame(
     [
-        {"항목": label, "값": _fmt(val, snap_units.get(label, ""))}
-        for label, val in snap_vals.items()
+        {"항목": label, "값": _fmt(snap_last[col], unit)}
+        for label, col, unit in SNAPSHOT
+        if col in snap_last
     ]
 )
 
@@ -697,17 +659,8 @@ st.table(snap_tbl)
 # 10. Signal 카드 (기존 로직 유지)
 # ----------------------------------------------------------------
 with st.expander("🔔 통합 자산 시그널", expanded=False):
-    final_scores = {}
-    for asset, ts in trend.items():
-        final_scores[asset] = int((ts + macro).clip(-3, 3).iloc[-1])
-
-    if "RTMS" in view:
-        realty_trend = (
-            view["RTMS"]
-            .pct_change(3)
-            .apply(lambda x: 2 if x > 0.03 else 1 if x > 0 else -1 if x > -0.03 else -2)
-        )
-        final_scores["Realty"] = int((realty_trend + macro).clip(-3, 3).iloc[-1])
+    # 자산별 clip(trend + macro) 의 기준일 값 – 계산할 수 없는 자산은 뺀다
+    final_scores = store.latest(view.index[-1])
 
     st.write(f"### 기준일: {sig_dt}")
     if final_scores:
@@ -723,6 +676,92 @@ with st.expander("🔔 통합 자산 시그널", expanded=False):
     else:
         st.info("시그널을 계산할 데이터가 부족합니다.")
 
+# ───────────────────────────────────────────────────────────────
+# 11. 시그널 백테스트
+# ----------------------------------------------------------------
+BT_RULES = {
+    "long": "점수 > 0 이면 보유",
+    "scaled": "점수 비례 (0~3 → 0~100 %)",
+    "longshort": "점수 부호대로 매수·매도",
+}
+BT_PCT = ("CAGR", "BuyHold", "MaxDD", "Vol", "HitRate", "Exposure")
+BT_LABELS = {
+    "CAGR": "CAGR", "BuyHold": "보유 CAGR", "MaxDD": "MDD", "Vol": "변동성",
+    "Sharpe": "샤프", "HitRate": "적중률", "Turnover": "회전율/년", "Exposure": "보유 비중",
+}
+
+
+def fmt_metrics(df: pd.DataFrame) -> pd.DataFrame:
+    """백테스트 지표 컬럼을 표시용 문자열로 (비율은 %, 나머지는 소수 둘째 자리)."""
+    return df.rename(columns=BT_LABELS).assign(**{
+        BT_LABELS[col]: [
+            "–" if pd.isna(v) else f"{v:.1%}" if col in BT_PCT else f"{v:.2f}"
+            for v in df[col]
+        ]
+        for col in BT_LABELS
+        if col in df
+    })
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def backtest_store(version) -> signals.SignalStore:
+    """데이터 버전마다 한 번 – Macro 재료에 발표 지연을 둔 백테스트용 점수표."""
+    return signals.SignalStore(live.frame(), release_lag=signals.RELEASE_LAG)
+
+
+@st.cache_resource(show_spinner=False, max_entries=16)
+def backtest_report(version, rule: str, cost_bps: float) -> pd.DataFrame:
+    """데이터 버전·규칙·비용마다 한 번 – 전체 이력 백테스트 지표표 (세션 공유)."""
+    return backtest.report(live.frame(), backtest_store(version), rule=rule, cost_bps=cost_bps)
+
+
+with st.expander("📊 시그널 백테스트", expanded=False):
+    c_rule, c_cost = st.columns(2)
+    bt_rule = c_rule.selectbox("포지션 규칙", list(BT_RULES), format_func=BT_RULES.get, key="bt_rule")
+    bt_cost = c_cost.number_input("편도 거래비용 (bp)", 0.0, 100.0, 10.0, step=5.0, key="bt_cost")
+    bt = backtest_report(live.version, bt_rule, float(bt_cost))
+    st.table(fmt_metrics(bt))
+    st.caption(
+        f"{live.index[0]:%Y-%m-%d} ~ {live.index[-1]:%Y-%m-%d} 전체 이력 · 그날 점수로 정한 비중을 다음 날 수익에 적용 · "
+        f"Macro 재료는 발표 지연(M2 {signals.RELEASE_LAG['m2'].days}일·금리 {signals.RELEASE_LAG['spread'].days}일) "
+        "뒤에 반영 · 회전율은 연간 비중 변화량 합계"
+    )
+
+# ───────────────────────────────────────────────────────────────
+# 12. 파라미터 스윕 결과 (python sweep.py 로 만든 표)
+# ----------------------------------------------------------------
+SWEEP_PATH = Path(os.getenv("SWEEP_FILE", str(sweep.OUT)))
+SWEEP_SORT = ("Sharpe", "CAGR", "MaxDD", "HitRate")
+
+
+@st.cache_data(show_spinner=False)
+def load_sweep(path: Path, stamp: int) -> pd.DataFrame | None:
+    """스윕 결과 표 – 파일이 바뀌면(``stamp`` = 수정 시각) 다시 읽습니다."""
+    return sweep.load(path)
+
+
+sweep_fp = next((fp for fp in (SWEEP_PATH, SWEEP_PATH.with_suffix(".csv")) if fp.exists()), None)
+if sweep_fp is not None:
+    with st.expander("🔬 파라미터 스윕", expanded=False):
+        sw = load_sweep(sweep_fp, sweep_fp.stat().st_mtime_ns)
+        c_asset, c_metric = st.columns(2)
+        sw_asset = c_asset.selectbox("자산", list(dict.fromkeys(sw["asset"])), key="sw_asset")
+        sw_metric = c_metric.selectbox("정렬 기준", SWEEP_SORT, format_func=BT_LABELS.get, key="sw_metric")
+        rows = sw[sw["asset"] == sw_asset]
+        st.table(fmt_metrics(rows.nlargest(10, sw_metric).drop(columns="asset").reset_index(drop=True)))
+        # 대시보드가 쓰는 기본 설정이 격자 안에 있으면 그 순위도 보여 준다
+        current = rows[
+            (rows["short"] == signals.SHORT) & (rows["long"] == signals.LONG)
+            & (rows["momentum"] == signals.MOMENTUM)
+            & (rows["m2_cuts"] == sweep.cuts_label(signals.M2_CUTS))
+            & (rows["spread_cuts"] == sweep.cuts_label(signals.SPREAD_CUTS))
+        ]
+        rank = f" · 현재 설정 순위 {int((rows[sw_metric] > current[sw_metric].iloc[0]).sum()) + 1}" if len(current) else ""
+        st.caption(
+            f"{len(rows)}개 설정 · 규칙 {', '.join(rows['rule'].unique())} · "
+            f"비용 {', '.join(f'{c:g}' for c in rows['cost_bps'].unique())}bp{rank} · `python sweep.py` 로 갱신"
+        )
+
 st.caption(
     "Data: FRED · Stooq · ECOS · Yahoo Finance — Signals = Macro(M2 + Spread) × Trend"
 )
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+backtest.py  –  Macro × Trend 시그널 백테스트 (벡터화)
+─────────────────────────────────────────────
+✓ 포지션 : 최종 점수(−3~3)를 규칙(long·scaled·longshort)으로 비중으로 – 다음 날부터 적용
+✓ 비용   : 비중 변화량(회전율) × 편도 비용(bp) 을 그날 수익에서 뺀다
+✓ 지표   : CAGR·매수 후 보유 CAGR·MDD·변동성·샤프·적중률·연 회전율·보유 비중
+✓ 벡터화 : 자산 전체를 (일자 × 자산) 배열 하나로 한 번에 (자산·일자 루프 없음)
+
+점수는 ``signals.SignalStore`` 와 같은 정의(``signals.final``)를 씁니다.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Dict
+
+import numpy as np
+import pandas as pd
+
+import signals
+
+# 점수 -> 비중 규칙 (결측 점수는 0 = 현금)
+RULES: Dict[str, Callable[[np.ndarray], np.ndarray]] = {
+    "long": lambda s: (s > 0).astype("float64"),        # 점수가 양수면 전액 보유
+    "scaled": lambda s: np.clip(s, 0, 3) / 3,           # 양수 점수에 비례해 0~100 %
+    "longshort": lambda s: np.sign(s),                  # 양수 매수 · 음수 매도
+}
+DEFAULT_RULE = "long"
+DAYS_PER_YEAR = 365.25  # 패널 한 행 = 달력 하루 (CAGR·회전율의 연 환산)
+METRICS = ("CAGR", "BuyHold", "MaxDD", "Vol", "Sharpe", "HitRate", "Turnover", "Exposure")
+
+
+def positions(final: np.ndarray, rule: str = DEFAULT_RULE) -> np.ndarray:
+    """최종 점수 배열을 목표 비중으로 바꿉니다 (그날 종가에 정하는 비중)."""
+    if rule not in RULES:
+        raise ValueError(f"unknown rule {rule!r} (choose from {', '.join(RULES)})")
+    with np.errstate(invalid="ignore"):
+        return np.nan_to_num(RULES[rule](np.asarray(final, dtype="float64")), nan=0.0)
+
+
+def run(
+    prices: np.ndarray,
+    final: np.ndarray,
+    *,
+    rule: str = DEFAULT_RULE,
+    cost_bps: float = 0.0,
+    periods_per_year: float = DAYS_PER_YEAR,
+) -> Dict[str, np.ndarray]:
+    """(일자 × 자산) 가격·점수로 백테스트하고, 지표 이름 -> 자산별 값 배열을 돌려줍니다.
+
+    t 일 종가에 정한 비중은 t+1 일 수익에 적용합니다 (당일 정보로 당일 수익을 먹지 않음).
+    비중을 바꾼 날에는 ``|Δ비중| × cost_bps / 10,000`` 을 수익에서 뺍니다. 지표는 자산마다
+    첫 가격이 있는 날부터 셉니다.
+
+    패널은 ffill 한 달력 격자라 주말·휴장 행은 수익이 0 입니다. CAGR·회전율은 행 수를
+    ``periods_per_year`` 로 나눈 햇수로 환산하고, 변동성·샤프는 가격이 바뀐 행(거래일)
+    사이의 수익으로 계산해 자산별 연간 거래일 수(거래일 수 ÷ 햇수)로 환산합니다.
+    """
+    prices = np.asarray(prices, dtype="float64")
+    ret = np.nan_to_num(signals.change(prices, 1), nan=0.0, posinf=0.0, neginf=0.0)
+    target = positions(final, rule)
+    held = np.zeros_like(target)
+    held[1:] = target[:-1]
+    turn = np.abs(np.diff(held, axis=0, prepend=0.0))
+    net = held * ret - turn * cost_bps / 1e4
+
+    listed = np.maximum.accumulate(~np.isnan(prices), axis=0)
+    days = listed.sum(axis=0)
+    years = np.where(days > 1, (days - 1) / periods_per_year, np.nan)
+
+    equity = np.cumprod(1.0 + net, axis=0)
+    hold = np.cumprod(1.0 + ret, axis=0)
+    drawdown = equity / np.maximum.accumulate(equity, axis=0) - 1.0
+
+    # 거래일 수익 – 가격이 바뀐 행마다 직전 거래일 이후 누적 수익 (사이 휴장 행의 비용 포함)
+    moved = listed & (ret != 0)
+    rows = np.arange(len(prices))[:, None]
+    last = np.maximum.accumulate(np.where(moved, rows, 0), axis=0)
+    prev = np.vstack([np.zeros((1,) + last.shape[1:], dtype=last.dtype), last[:-1]])
+    session = np.where(moved, equity / np.take_along_axis(equity, prev, axis=0) - 1.0, np.nan)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        sessions = moved.sum(axis=0) / years  # 연간 거래일 수
+        mean, std = np.nanmean(session, axis=0), np.nanstd(session, axis=0)
+        traded = (held != 0) & moved  # 보유 중이고 가격이 움직인 날 (주말·휴장 제외)
+        return {
+            "CAGR": equity[-1] ** (1 / years) - 1,
+            "BuyHold": hold[-1] ** (1 / years) - 1,
+            "MaxDD": drawdown.min(axis=0),
+            "Vol": std * np.sqrt(sessions),
+            "Sharpe": mean / std * np.sqrt(sessions),
+            "HitRate": ((net > 0) & traded).sum(axis=0) / traded.sum(axis=0),
+            "Turnover": turn.sum(axis=0) / years,
+            "Exposure": (np.abs(held) * listed).sum(axis=0) / days,
+        }
+
+
+def report(
+    df: pd.DataFrame,
+    store: signals.SignalStore,
+    *,
+    rule: str = DEFAULT_RULE,
+    cost_bps: float = 0.0,
+    assets: Dict[str, str] | None = None,
+) -> pd.DataFrame:
+    """패널 ``df`` 의 가격과 ``store`` 의 최종 점수로 자산별 지표표(자산 × ``METRICS``).
+
+    ``store`` 는 ``signals.SignalStore(df, release_lag=signals.RELEASE_LAG)`` 처럼 발표 지연을
+    준 점수여야 합니다 – 대시보드 점수는 Macro 재료가 발표 전 값을 미리 봅니다.
+    """
+    assets = assets or signals.TREND_ASSETS
+    names = [name for name in store.assets if name in assets and assets[name] in df]
+    final = store.window(final_only=True)[names]
+    prices = df[[assets[name] for name in names]].reindex(final.index)
+    out = run(prices.to_numpy(dtype="float64"), final.to_numpy(), rule=rule, cost_bps=cost_bps)
+    return pd.DataFrame(out, index=names, columns=list(METRICS))
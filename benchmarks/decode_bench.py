@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+decode_bench.py  –  API 응답 디코딩 처리량 마이크로 벤치마크
+─────────────────────────────────────────────
+FRED 일간 시리즈 형태의 합성 페이로드로, 예전 방식(행마다 float()·dict)과
+decode.py 의 일괄 디코딩을 비교합니다.
+
+    python -m benchmarks.decode_bench [--rows 20000] [--repeat 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+
+import pandas as pd
+
+import decode
+
+
+def make_payload(rows: int, *, missing: float = 0.03) -> bytes:
+    start = pd.Timestamp("1990-01-01")
+    days = pd.bdate_range(start, periods=rows).strftime("%Y-%m-%d")
+    obs = [
+        {"date": d, "value": "." if random.random() < missing else f"{1000 + random.random() * 400:.4f}"}
+        for d in days
+    ]
+    return json.dumps({"observations": obs}).encode("utf-8")
+
+
+def per_row(body: bytes) -> pd.Series:
+    j = json.loads(body)
+    ser = pd.Series({o["date"]: float(o["value"]) for o in j["observations"] if o["value"] != "."})
+    ser.index = pd.to_datetime(ser.index)
+    return ser
+
+
+def bulk(body: bytes) -> pd.Series:
+    j = decode.loads(body)
+    return decode.series(j["observations"], date_key="date", value_key="value", fmt="%Y-%m-%d")
+
+
+def bench(fn, body: bytes, repeat: int) -> float:
+    fn(body)  # 워밍업
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(body)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    random.seed(0)
+    body = make_payload(args.rows)
+    assert per_row(body).equals(bulk(body).rename(None))
+
+    print(f"rows={args.rows:,d}  payload={len(body) / 1024:.0f} KB  orjson={decode.HAS_ORJSON}")
+    results = {name: bench(fn, body, args.repeat) for name, fn in (("per-row", per_row), ("bulk", bulk))}
+    for name, sec in results.items():
+        print(f"{name:8s} {sec * 1000:8.2f} ms  {args.rows / sec / 1e6:6.2f} M rows/s")
+    print(f"speedup  {results['per-row'] / results['bulk']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+pipeline_bench.py  –  기록한 픽스처로 전체 수집 파이프라인 시간 재기
+─────────────────────────────────────────────
+``fetch_data.py --record DIR`` 로 남긴 응답을 네트워크 없이 재생해, 파싱·리샘플·
+병합·저장까지의 실제 비용을 반복 측정합니다. 출력은 임시 폴더에 씁니다.
+
+    python -m benchmarks.pipeline_bench fixtures/ [--repeat 3] [--latency 0.05 --fail-rate 0.1]
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import fetch_data
+from run_metrics import RunMetrics
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="나머지 옵션(--latency, --fail-rate …)은 fetch_data.py 로 넘깁니다.",
+    )
+    parser.add_argument("fixtures")
+    parser.add_argument("--repeat", type=int, default=3)
+    bench, rest = parser.parse_known_args(argv)
+    args = fetch_data.parse_args(["--replay", bench.fixtures, *rest])
+    fetch_data.attach_fixtures(args)
+
+    times = []
+    with tempfile.TemporaryDirectory() as out:
+        fetch_data.DIR = Path(out)
+        ctx = fetch_data.FetchContext(areas=fetch_data.load_areas())
+        for _ in range(bench.repeat):
+            fetch_data.METRICS = RunMetrics()
+            t0 = time.perf_counter()
+            fetch_data.run_pipeline(ctx, force=True)
+            times.append(time.perf_counter() - t0)
+            for fp in Path(out).iterdir():  # 다음 회차도 처음부터 쓰도록
+                fp.unlink()
+    print(fetch_data.METRICS.table(limit=15))
+    print(f"runs={bench.repeat}  best={min(times):.2f}s  median={sorted(times)[len(times) // 2]:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
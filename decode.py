@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+decode.py  –  API 응답 일괄 디코딩
+─────────────────────────────────────────────
+✓ JSON   : orjson 이 있으면 사용, 없으면 표준 json
+✓ 값     : 결측 표기('.', '', '-')를 한 번에 NaN 으로 바꾸고 float64 배열로 변환
+✓ 날짜   : 알려진 형식으로 한 번에 파싱 (행마다 추론하지 않음)
+✓ 레코드 : [{날짜, 값…}, …] → 타입이 정해진 Series
+"""
+
+from __future__ import annotations
+
+import json
+from operator import itemgetter
+from typing import Any, Mapping, Sequence
+
+import numpy as np
+import pandas as pd
+
+try:  # pragma: no cover - 선택 의존성
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:  # pragma: no cover - 선택 의존성
+    orjson = None
+    HAS_ORJSON = False
+
+# 원천 API 들이 결측을 나타내는 문자열 (FRED ".", ECOS/R-ONE "" 또는 "-")
+MISSING = (".", "", "-")
+# pandas 가 문자열 날짜를 파싱할 때 쓰는 해상도 (pandas 2 는 ns, 3 은 us)
+DATE_UNIT = pd.to_datetime(["2000-01-01"], format="%Y-%m-%d").unit
+
+
+def loads(body: bytes | str) -> Any:
+    """JSON 본문을 파싱합니다 (orjson 우선)."""
+    if HAS_ORJSON:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+def payload(resp) -> Any:
+    """HTTP 응답의 JSON 본문 – 바이트 본문이 있으면 ``loads`` 로 직접 파싱합니다."""
+    body = getattr(resp, "content", None)
+    if isinstance(body, (bytes, bytearray)):
+        return loads(body)
+    return resp.json()
+
+
+def numbers(values: Sequence) -> np.ndarray:
+    """문자열·숫자 값 목록을 float64 배열로 – 결측 표기와 숫자로 읽을 수 없는 값은 NaN."""
+    arr = np.asarray(values, dtype=object)
+    if arr.size == 0:
+        return np.empty(0, dtype="float64")
+    arr[np.isin(arr, MISSING) | pd.isna(arr)] = "nan"
+    try:
+        return arr.astype("float64")
+    except ValueError:  # 쉼표·단위 등 이상값 – 느린 경로로 하나씩 NaN 처리
+        return pd.to_numeric(arr, errors="coerce").astype("float64", copy=False)
+
+
+def dates(values: Sequence[str], fmt: str) -> pd.DatetimeIndex:
+    """알려진 ``fmt`` 으로 날짜 문자열을 한 번에 파싱합니다.
+
+    ``%Y-%m-%d`` 와 ``%Y%m`` 은 numpy datetime64 로 바로 바꾸고, 그 밖의 형식은
+    pandas 에 형식을 넘겨 파싱합니다.
+    """
+    if len(values) == 0:
+        return pd.DatetimeIndex([])
+    if fmt == "%Y-%m-%d":
+        days = np.asarray(values, dtype="datetime64[D]")
+    elif fmt == "%Y%m":
+        ym = np.asarray(values, dtype=object).astype("int64")
+        days = ((ym // 100 - 1970) * 12 + ym % 100 - 1).astype("datetime64[M]").astype("datetime64[D]")
+    else:
+        return pd.DatetimeIndex(pd.to_datetime(pd.Index(values, dtype=object), format=fmt))
+    return pd.DatetimeIndex(days).as_unit(DATE_UNIT)
+
+
+def _column(records: Sequence[Mapping], key: str) -> list:
+    return list(map(itemgetter(key), records))
+
+
+def series(
+    records: Sequence[Mapping],
+    *,
+    date_key: str,
+    value_key: str,
+    fmt: str | None = None,
+    index: pd.DatetimeIndex | None = None,
+    name: str | None = None,
+    dropna: bool = True,
+) -> pd.Series:
+    """레코드 목록에서 날짜·값 필드를 뽑아 float64 시리즈를 만듭니다.
+
+    ``index`` 를 주면 ``date_key``/``fmt`` 대신 그 인덱스를 씁니다(분기 등 특수 형식).
+    같은 날짜가 여러 번 나오면 마지막 값을 남깁니다.
+    """
+    if not records:
+        return pd.Series(dtype="float64", name=name)
+    values = numbers(_column(records, value_key))
+    if index is None:
+        index = dates(_column(records, date_key), fmt)
+    ser = pd.Series(values, index=index, name=name)
+    if dropna:
+        ser = ser[~np.isnan(values)]
+    if not ser.index.is_unique:
+        ser = ser[~ser.index.duplicated(keep="last")]
+    return ser
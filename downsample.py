@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+downsample.py  –  차트용 시계열 다운샘플링
+─────────────────────────────────────────────
+✓ min/max : 구간마다 최솟값·최댓값 두 점을 남겨 봉우리·골짜기 모양을 보존
+✓ 벡터화  : 구간을 (구간 수 × 폭) 배열로 접어 numpy 한 번에 계산 (파이썬 루프 없음)
+✓ 결측    : NaN 만 있는 구간은 건너뛰고, 점이 예산 이하이면 그대로 돌려줌
+"""
+
+from __future__ import annotations
+
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+# 트레이스 하나에 남길 최대 점 수 – 차트 폭(약 1,200px)에 2px 당 구간 하나 정도
+MAX_POINTS = 1200
+
+
+def minmax_indices(y: np.ndarray, n: int) -> np.ndarray:
+    """``y`` 를 ``n // 2`` 개 구간으로 나눠 각 구간의 최솟값·최댓값 위치를 돌려줍니다.
+
+    점이 ``n`` 개 이하이면 모든 위치를, 아니면 첫·마지막 유효 점을 포함한 정렬된
+    고유 위치를 돌려줍니다. NaN 만 있는 구간은 건너뜁니다.
+    """
+    size = len(y)
+    if size <= n:
+        return np.arange(size)
+    buckets = max(1, n // 2)
+    width = -(-size // buckets)  # ceil
+    padded = np.full(buckets * width, np.nan)
+    padded[:size] = y
+    grid = padded.reshape(buckets, width)
+    valid = ~np.isnan(grid).all(axis=1)
+    lo = np.where(np.isnan(grid), np.inf, grid).argmin(axis=1)
+    hi = np.where(np.isnan(grid), -np.inf, grid).argmax(axis=1)
+    base = np.arange(buckets) * width
+    picks = np.concatenate([(base + lo)[valid], (base + hi)[valid]])
+    ends = np.flatnonzero(~np.isnan(y))
+    if len(ends):
+        picks = np.concatenate([picks, ends[[0, -1]]])
+    return np.unique(picks)
+
+
+def series(ser: pd.Series, n: int = MAX_POINTS) -> Tuple[pd.Index, np.ndarray]:
+    """차트에 넘길 ``(x, y)`` – 점이 ``n`` 개를 넘으면 min/max 구간 다운샘플링."""
+    y = ser.to_numpy(dtype="float64")
+    keep = minmax_indices(y, n)
+    return ser.index[keep], y[keep]
@@ -12,24 +12,48 @@ fetch_data.py  –  거시·자산 원천 데이터 수집 (v4)
 ✓ M2_US    : 미국 M2 Money Stock (FRED M2SL, 월 → 일 선형보간)
 ✓ SP500    : S&P 500 (^GSPC, 일)
 ✓ KODEX200 : 069500.KS (일)
-결과 → data/all_data.csv  (일 빈도, ffill)
+✓ RTMS     : R-ONE 주택가격지수 (지역 × sale/rent 동시 수집, totalCount 페이지네이션, 월)
+결과 → data/native.parquet (원래 빈도 long 저장소) – panel.py·storage.py 참고
+       DAILY_EXPORT=1 이면 예전처럼 일 빈도 all_data(+ CSV 사본)도 남긴다.
+
+실행: python fetch_data.py [--only CPI,RealRate] [--incremental] [--list]
+      python fetch_data.py --backfill-buy-index 2012-05-07 [--max-pages 200]  # 매수우위지수 과거 이력
+      python fetch_data.py --record fixtures/        # 응답을 픽스처 번들로 기록
+      python fetch_data.py --replay fixtures/ [--latency 0.05 --fail-rate 0.1]  # 오프라인 재생
+      (재생은 기록한 날 기준으로 고정되고, 번들에 없는 요청이 있으면 실패한다)
+각 시리즈는 REGISTRY 의 원천/파생 노드이며, import 만으로는 아무것도 받지 않는다.
 """
 
 from __future__ import annotations
 
 import os
 import io
+import json
+import argparse
+import hashlib
 import re
+import time
+import threading
 import html as html_lib
 import datetime as dt
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
-from typing import List
+from typing import Callable, Dict, Iterable, List, Tuple, TypeVar
 
 import pandas as pd
-import requests
 import yfinance as yf
 from dotenv import load_dotenv
 
+import decode
+import panel
+import replay
+import storage
+from http_cache import ResponseCache
+from http_client import HttpClient
+from run_metrics import RunMetrics
+
 # ── 환경 준비 ───────────────────────────────────
 load_dotenv()
 FRED_KEY = os.getenv("FRED_KEY", "")
@@ -37,7 +61,7 @@ ECOS_KEY = os.getenv("ECOS_KEY", "")
 MOLIT_KEY = os.getenv("MOLIT_KEY", "")  # 국토부 미분양주택 현황
 RONE_KEY = os.getenv("RONE_KEY", "")    # 부동산원 R-ONE API Key
 RTMS_AREA = os.getenv("RTMS_AREA", "")   # 부동산 지수 조회 지역 코드(콤마구분)
-DIR = Path("data"); DIR.mkdir(exist_ok=True)
+DIR = Path("data")
 
 # FRED 시리즈 ID 상수화
 RATE_FRED_ID = "INTDSRKRM193N"     # Bank of Korea Base Rate (monthly)
@@ -47,11 +71,111 @@ US_BOND10_ID = "GS10"              # 10‑Year Treasury Constant Maturity (month
 CPI_FRED_ID = "CPIAUCSL"           # CPI All Items (monthly)
 CORECPI_FRED_ID = "CPILFESL"       # Core CPI (monthly)
 
+# 동시 수집 설정 – 전체 워커 수와 호스트별 동시 요청 상한
+FRED_HOST = "api.stlouisfed.org"
+ECOS_HOST = "ecos.bok.or.kr"
+YAHOO_HOST = "finance.yahoo.com"
+RONE_HOST = "r-one.co.kr"
+MOLIT_HOST = "apis.data.go.kr"
+REB_HOST = "www.reb.or.kr"
+
+MAX_WORKERS = int(os.getenv("FETCH_WORKERS", "8"))
+DEFAULT_HOST_LIMIT = 2
+HOST_LIMITS = {
+    FRED_HOST: 4,
+    ECOS_HOST: 2,
+    # yf.download 은 모듈 전역 상태를 공유하므로 한 번에 하나씩만 호출한다.
+    YAHOO_HOST: 1,
+    RONE_HOST: 2,
+    MOLIT_HOST: 2,
+    REB_HOST: 1,
+}
+# 호스트별 요청 속도 상한 (요청 수, 기간 초) – FRED 공식 한도 120 req/min
+RATE_LIMITS = {
+    FRED_HOST: (120, 60.0),
+    ECOS_HOST: (60, 60.0),
+    RONE_HOST: (300, 60.0),
+    MOLIT_HOST: (300, 60.0),
+    REB_HOST: (30, 60.0),
+}
+# 응답 디스크 캐시 TTL(초) – 빈도별: 일간 가격은 수 분, 월간 지표는 하루
+CACHE_TTL = {"d": 15 * 60, "w": 6 * 3600, "m": 24 * 3600}
+HTTP_CACHE = ResponseCache(
+    Path(os.getenv("HTTP_CACHE_DIR", ".cache/http")),
+    max_bytes=int(os.getenv("HTTP_CACHE_MAX_MB", "256")) * 1024 * 1024,
+    secrets=[FRED_KEY, ECOS_KEY, MOLIT_KEY, RONE_KEY],
+)
+# 노드별 실행 지표 – HTTP 이벤트는 요청한 스레드의 현재 노드에 귀속된다.
+METRICS = RunMetrics()
+RUN_LOG_FP = Path(os.getenv("RUN_LOG", "data/run_log.ndjson"))
+HTTP = HttpClient(
+    retries=int(os.getenv("HTTP_RETRIES", "4")),
+    backoff=float(os.getenv("HTTP_BACKOFF", "0.5")),
+    pool_size=MAX_WORKERS,
+    rate_limits=RATE_LIMITS,
+    cache=HTTP_CACHE,
+    on_request=lambda event: METRICS.on_http(event),
+)
+_HOST_SLOTS: Dict[str, threading.BoundedSemaphore] = {}
+_HOST_LOCK = threading.Lock()
+
+T = TypeVar("T")
+K = TypeVar("K")
+
+# 가격 유니버스 – tickers.csv (ticker,name,start), 한 번의 yf.download 에 넣을 티커 수
+UNIVERSE_FP = Path(os.getenv("TICKERS_FILE", "tickers.csv"))
+DEFAULT_UNIVERSE = [
+    ("^GSPC", "SP500", "2008-01-01"),
+    ("069500.KS", "KODEX200", "2008-01-01"),
+    ("BTC-USD", "Bitcoin", "2014-01-01"),
+]
+YF_BATCH_SIZE = int(os.getenv("YF_BATCH_SIZE", "50"))
+YF_THREADS = int(os.getenv("YF_THREADS", "8"))
+
+# ECOS StatisticSearch 한 번의 요청에서 받을 최대 행 수
+ECOS_PAGE_SIZE = 10000
+
+# 부동산 지수 – 지역 목록 파일(code,name), 지역 × 종류 요청을 나눠 실행할 워커 수,
+# 공공데이터(data.go.kr 형식) API 한 페이지의 행 수
+AREA_FP = Path(os.getenv("RTMS_AREA_FILE", "areas.csv"))
+RONE_KINDS = ("sale", "rent")
+AREA_WORKERS = int(os.getenv("AREA_WORKERS", "8"))
+# 부동산원 주간동향 – 최신 페이지, 과거 보고서는 기준일(월요일, YYYYMMDD) 파라미터로 조회
+BUY_INDEX_URL = "https://www.reb.or.kr/r-one/report.do?cmd=weeklyTrend"
+BUY_INDEX_WEEK_PARAM = os.getenv("BUY_INDEX_WEEK_PARAM", "baseDate")
+BACKFILL_WORKERS = int(os.getenv("BACKFILL_WORKERS", "2"))
+DATA_GO_PAGE_SIZE = 1000
+
+# 실행 기준일 – 재생(--replay) 중에는 번들을 기록한 날로 고정해, 요청 구간의 끝과
+# 증분 시작일이 재생하는 날마다 바뀌지 않게 한다 (None 이면 실제 오늘).
+RUN_DATE: dt.date | None = None
+# 재생 어댑터 – 번들에 없는 요청(misses)이 있으면 저장된 이력으로 넘어가지 않고 멈춘다.
+REPLAY: replay.ReplayAdapter | replay.ForwardAdapter | None = None
+
+# 증분 동기화 – 마지막 저장일 이전 겹침 구간을 다시 받아 정정치를 반영한다.
+SYNC_OVERLAP = {"d": pd.Timedelta(days=14), "m": pd.DateOffset(months=6)}
+# 원천 시리즈 이름 → all_data.csv 컬럼 (일 빈도로 펼쳐 저장된 경우)
+STORE_COLUMNS = {
+    "CPI": "CPI_D",
+    "CoreCPI": "CoreCPI_D",
+    "M2": "M2_D",
+    "M2_US": "M2_US_D",
+}
+# 일 빈도로 펼친 all_data·*_daily 파일도 남길지 (기본은 원래 빈도 native 저장소만)
+DAILY_EXPORT = os.getenv("DAILY_EXPORT", "") == "1"
+# 원천·파생 출력 전체를 하나로 묶은 zip (선택, 예: FETCH_BUNDLE=data/bundle.zip)
+BUNDLE_FP = Path(os.environ["FETCH_BUNDLE"]) if os.getenv("FETCH_BUNDLE") else None
+_STORE_CACHE: Dict[str, Tuple[tuple, pd.DataFrame]] = {}
+_STORE_LOCK = threading.Lock()
+
 # ── 공통 유틸 ───────────────────────────────────
 
-def save(name: str, obj: pd.Series | pd.DataFrame) -> None:
-    obj.to_csv(DIR / f"{name}.csv")
-    print(f"✔ {name:13s} {len(obj):6,d}")
+def save(writer: storage.BatchWriter, name: str, obj: pd.Series | pd.DataFrame) -> bool:
+    """내용이 바뀐 출력만 원자적으로 씁니다 – 실제로 썼으면 True."""
+    if writer.put(name, obj, csv_export=storage.wants_csv(name)):
+        print(f"✔ {name:13s} {len(obj):6,d}")
+        return True
+    return False
 
 
 def empty_series(name: str) -> pd.Series:
@@ -80,13 +204,41 @@ def safe_resample(ser: pd.Series, rule: str, method: str, *, name: str) -> pd.Se
     return out.rename(name)
 
 
+def _read_store(target: Path) -> pd.DataFrame:
+    """저장된 프레임을 읽습니다. 같은 파일(mtime·크기 동일)은 한 번만 파싱합니다."""
+    stat = target.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    with _STORE_LOCK:
+        hit = _STORE_CACHE.get(str(target))
+        if hit is None or hit[0] != stamp:
+            hit = (stamp, storage.read_frame(target))
+            _STORE_CACHE[str(target)] = hit
+        return hit[1]
+
+
+def _native_series(name: str) -> pd.Series:
+    """원래 빈도 저장소(native)의 ``name`` 시리즈 – 없으면 빈 시리즈."""
+    target = storage.resolve(DIR / panel.NATIVE)
+    if target is None:
+        return empty_series(name)
+    try:
+        df = _read_store(target)
+    except (FileNotFoundError, pd.errors.EmptyDataError):
+        return empty_series(name)
+    return to_datetime_index(panel.series_of(df, name))
+
+
 def load_cached_series(column: str, *, path: Path | None = None) -> pd.Series:
-    target = path or (DIR / "all_data.csv")
-    if not target.exists():
+    if path is None:
+        ser = _native_series(column)
+        if not ser.empty:
+            return ser
+    target = storage.resolve(path or (DIR / "all_data"))
+    if target is None:
         return empty_series(column)
 
     try:
-        df = pd.read_csv(target, index_col=0)
+        df = _read_store(target)
     except (FileNotFoundError, pd.errors.EmptyDataError):
         return empty_series(column)
 
@@ -94,12 +246,96 @@ def load_cached_series(column: str, *, path: Path | None = None) -> pd.Series:
         return empty_series(column)
 
     ser = pd.to_numeric(df[column], errors="coerce").dropna()
-    ser.index = pd.to_datetime(ser.index, errors="coerce")
-    ser = ser[~ser.index.isna()]
     ser.name = column
     return to_datetime_index(ser)
 
 
+def stored_history(name: str, *, freq: str = "d") -> pd.Series:
+    """저장소에서 ``name`` 시리즈의 기존 관측치를 원래 빈도로 복원합니다.
+
+    native 저장소에 없으면 예전 all_data 에서 찾는데, 거기서는 월간 시리즈가
+    일 빈도로 펼쳐 저장되어 있으므로 매월 1일 값만 남깁니다. all_data 는 ffill 로
+    채운 통합 프레임이라 채운 행은 직전 값의 반복입니다. 값이 같은 날도 실제 관측일 수
+    있으므로 반복 행을 모두 지우지는 않고, 주말의 반복 행과 마지막 관측 이후 파일
+    끝까지 채운 꼬리(발표 전 달 포함)만 뺍니다. 중간에 발표가 빠진 달은 구별할 수
+    없어 남지만, 증분 실행의 겹침 구간(``SYNC_OVERLAP``)에서 새로 받은 값으로 바뀝니다.
+    """
+    ser = _native_series(name)
+    if not ser.empty:
+        return ser
+    column = STORE_COLUMNS.get(name, name)
+    ser = load_cached_series(column, path=DIR / "all_data")
+    if freq == "m":
+        ser = ser[ser.index.is_month_start]
+    changed = ser.ne(ser.shift())
+    if changed.any():
+        ser = ser.loc[: changed[changed].index[-1]]
+    if freq == "d":
+        ser = ser[ser.ne(ser.shift()) | (ser.index.dayofweek < 5)]
+    return ser.rename(name)
+
+
+def merge_history(
+    cached: pd.Series, live: pd.Series, *, since: pd.Timestamp | None = None
+) -> pd.Series:
+    """새로 받은 구간(``live``)을 기존 이력(``cached``) 뒤에 이어 붙입니다.
+
+    ``since`` 이후 구간은 새 데이터로 완전히 교체되어 정정치가 반영되며,
+    생략하면 ``live`` 의 첫 날짜를 기준으로 합니다.
+    """
+    if live.empty:
+        return cached.rename(live.name) if not cached.empty else live
+    if cached.empty:
+        return live
+    cut = since if since is not None else live.index.min()
+    older_cached = cached[cached.index < cut]
+    if older_cached.empty:
+        return live
+    return pd.concat([older_cached, live]).sort_index().rename(live.name)
+
+
+def today() -> dt.date:
+    """요청 구간의 끝과 증분 기준이 되는 오늘 – ``RUN_DATE`` 가 있으면 그 날."""
+    return RUN_DATE or dt.date.today()
+
+
+def sync_start(cached: pd.Series, *, start: str, freq: str = "d") -> pd.Timestamp:
+    """증분 요청 시작일: 마지막 저장일(``today()`` 이후는 보지 않음)에서 겹침 구간만큼 되돌린 날짜."""
+    if cached.empty:
+        return pd.Timestamp(start)
+    last = min(cached.index.max(), pd.Timestamp(today()))
+    return max(pd.Timestamp(start), last - SYNC_OVERLAP[freq])
+
+
+def fetch_tail(
+    name: str,
+    fetch: Callable[[str], pd.Series],
+    *,
+    start: str,
+    freq: str = "d",
+    incremental: bool = False,
+) -> pd.Series:
+    """증분 모드면 마지막 저장일 - 겹침 구간부터만 받아 기존 이력과 병합합니다.
+
+    재시도 후에도 요청이 실패하면 전체 실행을 멈추지 않고 저장된 이력을 씁니다.
+    """
+    cached = stored_history(name, freq=freq) if incremental else None
+    try:
+        if cached is None or cached.empty:
+            return fetch(start).rename(name)
+        since = sync_start(cached, start=start, freq=freq)
+        live = fetch(since.strftime("%Y-%m-%d")).rename(name)
+        return merge_history(cached, live, since=since)
+    except Exception as e:
+        print(f"{name} fetch failed", e)
+        METRICS.fallback(f"stored history: {e}")
+        if cached is None:
+            cached = stored_history(name, freq=freq)
+        if not cached.empty:
+            print(f"Using cached {name} series from data/all_data.csv")
+        return cached
+
+
 # ── API 래퍼 ────────────────────────────────────
 
 def fred(series: str, *, freq: str = "d", start: str = "2008-01-01") -> pd.Series:
@@ -108,108 +344,297 @@ def fred(series: str, *, freq: str = "d", start: str = "2008-01-01") -> pd.Serie
         f"?series_id={series}&api_key={FRED_KEY}&file_type=json"
         f"&frequency={freq}&observation_start={start}"
     )
-    resp = requests.get(url, timeout=30)
+    resp = HTTP.get(url, timeout=30, ttl=CACHE_TTL[freq])
     resp.raise_for_status()
-    j = resp.json()
+    j = decode.payload(resp)
     if "observations" not in j:
+        HTTP.invalidate(url)
         raise RuntimeError(f"FRED API Error for {series}: {j}")
-    ser = pd.Series(
-        {o["date"]: float(o["value"]) for o in j["observations"] if o["value"] != "."},
-        name=series,
-    )
-    ser.index = pd.to_datetime(ser.index)
-    return ser
+    return decode.series(j["observations"], date_key="date", value_key="value", fmt="%Y-%m-%d", name=series)
+
+
+def _ecos_period(ts: pd.Timestamp, cycle: str) -> str:
+    if cycle == "A":
+        return ts.strftime("%Y")
+    if cycle == "Q":
+        return f"{ts.year}Q{ts.quarter}"
+    if cycle == "D":
+        return ts.strftime("%Y%m%d")
+    return ts.strftime("%Y%m")
+
+
+def _ecos_index(times: List[str], cycle: str) -> pd.DatetimeIndex:
+    if cycle == "Q":
+        return pd.PeriodIndex(times, freq="Q").to_timestamp()
+    fmt = {"A": "%Y", "D": "%Y%m%d"}.get(cycle, "%Y%m")
+    return decode.dates(times, fmt)
+
+
+def ecos(code: str, *, start: str = "2008-01-01", cycle: str = "M", **flt) -> pd.Series:
+    """ECOS StatisticSearch – 전체 행을 받을 때까지 페이지를 이어서 요청합니다.
+
+    ``ITEM_CODE1``~``ITEM_CODE4`` 필터는 요청 경로에 넣어 서버에서 거르고,
+    그 밖의 필터(예: ``ITM_ID``)만 받은 행에서 거릅니다.
+    """
+    begin = _ecos_period(pd.Timestamp(start), cycle)
+    end = _ecos_period(pd.Timestamp(today()), cycle)
+    items = [flt.pop(f"ITEM_CODE{i}", None) for i in range(1, 5)]
+    while items and items[-1] is None:
+        items.pop()
+    item_path = "".join(f"/{it if it is not None else '?'}" for it in items)
+
+    rows: List[dict] = []
+    first = 1
+    while True:
+        last = first + ECOS_PAGE_SIZE - 1
+        url = (
+            f"https://ecos.bok.or.kr/api/StatisticSearch/{ECOS_KEY}"
+            f"/json/kr/{first}/{last}/{code}/{cycle}/{begin}/{end}{item_path}"
+        )
+        payload = decode.payload(HTTP.get(url, timeout=30, ttl=CACHE_TTL["d" if cycle == "D" else "m"]))
+        if "StatisticSearch" not in payload:
+            HTTP.invalidate(url)
+        body = payload.get("StatisticSearch", {})
+        page = body.get("row", [])
+        rows.extend(page)
+        total = int(body.get("list_total_count", 0) or 0)
+        if not page or len(rows) >= total:
+            break
+        first = last + 1
+
+    for k, v in flt.items():
+        rows = [r for r in rows if r.get(k) == v]
+    index = _ecos_index([r["TIME"] for r in rows], cycle)
+    return decode.series(rows, date_key="TIME", value_key="DATA_VALUE", index=index)
 
 
-def ecos(code: str, **flt) -> pd.Series:
-    end = dt.date.today().strftime("%Y%m")
-    url = (
-        f"https://ecos.bok.or.kr/api/StatisticSearch/{ECOS_KEY}"
-        f"/json/kr/1/10000/{code}/M/200801/{end}"
-    )
-    rows: List[dict] = (
-        requests.get(url, timeout=30)
-        .json()
-        .get("StatisticSearch", {})
-        .get("row", [])
-    )
-    if flt:
-        k, v = next(iter(flt.items()))
-        rows = [r for r in rows if r.get(k) == v]
-    ser = pd.Series({r["TIME"]: float(r["DATA_VALUE"]) for r in rows})
-    ser.index = pd.to_datetime(ser.index, format="%Y%m")
-    return ser
+def first_nonempty(candidates: Iterable[Callable[[], pd.Series]], *, name: str) -> pd.Series:
+    """폴백 후보를 순서대로 호출해, 처음으로 값이 있는 시리즈에서 멈춥니다."""
+    for candidate in candidates:
+        try:
+            ser = candidate()
+        except Exception as e:
+            print(f"{name} candidate failed", e)
+            METRICS.fallback(f"next candidate: {e}")
+            continue
+        if not ser.empty:
+            return ser.rename(name)
+    return empty_series(name)
 
 
 def fetch_adj_close(ticker: str, *, start: str = "2008-01-01") -> pd.Series:
-    raw = yf.download(ticker, start=start, progress=False, threads=False, auto_adjust=False)
-    if raw.empty:
-        raise RuntimeError(f"yfinance returned no data for {ticker}")
-    raw.index = raw.index.tz_localize(None)
+    body = HTTP.cached(
+        "https://finance.yahoo.com/download",
+        {"ticker": ticker, "start": start},
+        CACHE_TTL["d"],
+        lambda: _download_adj_close(ticker, start=start).to_csv().encode("utf-8"),
+    )
+    ser = pd.read_csv(io.BytesIO(body), index_col=0, parse_dates=True).iloc[:, 0]
+    ser.index.name = None
+    ser.name = ticker
+    return ser
 
+
+def _adj_close_columns(raw: pd.DataFrame, tickers: List[str]) -> pd.DataFrame:
+    """yf.download 결과에서 수정주가(없으면 종가)만 ``티커 -> 컬럼`` 으로 꺼냅니다."""
     if isinstance(raw.columns, pd.MultiIndex):
         lvl0 = raw.columns.get_level_values(0)
-        if "Adj Close" in lvl0:
-            ser = raw["Adj Close"].squeeze()
-        else:
-            ser = raw["Close"].squeeze()
+        px = raw["Adj Close"] if "Adj Close" in lvl0 else raw["Close"]
     else:
-        ser = raw["Adj Close"] if "Adj Close" in raw.columns else raw["Close"]
+        px = raw[["Adj Close" if "Adj Close" in raw.columns else "Close"]]
+        px.columns = tickers[:1]
+    px = px.reindex(columns=tickers)
+    px.index = px.index.tz_localize(None)
+    px.columns.name = None
+    return px
 
+
+def _download_adj_close(ticker: str, *, start: str) -> pd.Series:
+    raw = yf.download(ticker, start=start, progress=False, threads=False, auto_adjust=False)
+    if raw.empty:
+        raise RuntimeError(f"yfinance returned no data for {ticker}")
+    ser = _adj_close_columns(raw, [ticker])[ticker]
     ser.name = ticker
     return ser
 
 
-def fetch_gold(*, start: str = "2008-01-01") -> pd.Series:
-    cached = load_cached_series("Gold")
+def fetch_adj_close_batch(tickers: List[str], *, start: str = "2008-01-01") -> pd.DataFrame:
+    """여러 티커를 한 번의 yf.download 로 받아 ``티커 -> 수정주가`` 프레임을 돌려줍니다.
+
+    배치 안에서는 yfinance 의 스레드로 티커를 병렬로 받고, MultiIndex 컬럼은
+    배치 전체에 대해 한 번만 풀어 냅니다.
+    """
+    if not tickers:
+        return pd.DataFrame()
+
+    def _download() -> bytes:
+        raw = yf.download(
+            tickers, start=start, progress=False, threads=YF_THREADS,
+            auto_adjust=False, group_by="column",
+        )
+        if raw.empty:
+            raise RuntimeError(f"yfinance returned no data for {', '.join(tickers)}")
+        return _adj_close_columns(raw, tickers).to_csv().encode("utf-8")
+
+    body = HTTP.cached(
+        "https://finance.yahoo.com/download",
+        {"tickers": ",".join(sorted(tickers)), "start": start},
+        CACHE_TTL["d"],
+        _download,
+    )
+    df = pd.read_csv(io.BytesIO(body), index_col=0, parse_dates=True)
+    df.index.name = None
+    return df
+
+
+def load_universe(path: Path | None = None) -> pd.DataFrame:
+    """가격 수집 대상(ticker, name, start)을 설정 파일에서 읽습니다."""
+    fp = path or UNIVERSE_FP
+    if not fp.exists():
+        return pd.DataFrame(DEFAULT_UNIVERSE, columns=["ticker", "name", "start"])
+    uni = pd.read_csv(fp, dtype=str, comment="#", skipinitialspace=True).dropna(subset=["ticker"])
+    uni["name"] = uni["name"].fillna(uni["ticker"]) if "name" in uni else uni["ticker"]
+    uni["start"] = uni["start"].fillna("2008-01-01") if "start" in uni else "2008-01-01"
+    return uni[["ticker", "name", "start"]].drop_duplicates("name").reset_index(drop=True)
+
+
+def fetch_prices(
+    universe: pd.DataFrame, *, incremental: bool = False, batch_size: int | None = None
+) -> pd.DataFrame:
+    """유니버스 전체의 수정주가를 배치 단위로 받아 ``name`` 컬럼 프레임으로 합칩니다.
+
+    증분 모드에서는 배치마다 가장 이른 동기화 시작일부터만 받고, 티커별로 저장된
+    이력과 병합합니다. 배치가 실패하면 그 배치의 티커는 저장된 이력을 씁니다.
+    """
+    size = batch_size or YF_BATCH_SIZE
+    stored = _stored_prices() if incremental else pd.DataFrame()
+
+    def cached_for(name: str) -> pd.Series:
+        if name in stored.columns:
+            return stored[name].dropna().rename(name)
+        return stored_history(name)
+
+    out: Dict[str, pd.Series] = {}
+    rows = list(universe.itertuples(index=False))
+    for i in range(0, len(rows), size):
+        batch = rows[i : i + size]
+        cached = {r.name: cached_for(r.name) for r in batch} if incremental else {}
+        since = {
+            r.name: sync_start(cached[r.name], start=r.start) if incremental else pd.Timestamp(r.start)
+            for r in batch
+        }
+        try:
+            live = fetch_adj_close_batch(
+                [r.ticker for r in batch],
+                start=min(since.values()).strftime("%Y-%m-%d"),
+            )
+        except Exception as e:
+            print("Price batch failed", [r.ticker for r in batch], e)
+            METRICS.fallback(f"stored history: {e}")
+            live = pd.DataFrame()
+        for r in batch:
+            ser = live[r.ticker].dropna() if r.ticker in live else empty_series(r.name)
+            ser = ser[ser.index >= since[r.name]].rename(r.name)
+            if incremental or ser.empty:
+                history = cached[r.name] if r.name in cached else cached_for(r.name)
+                ser = merge_history(history, ser, since=since[r.name])
+            out[r.name] = ser.rename(r.name)
+    return pd.concat(out, axis=1).sort_index() if out else pd.DataFrame()
+
+
+def _stored_prices() -> pd.DataFrame:
+    if not storage.exists(DIR / "prices"):
+        return pd.DataFrame()
+    return storage.read_frame(DIR / "prices")
+
+
+def fetch_gold(*, start: str = "2008-01-01", incremental: bool = False) -> pd.Series:
+    cached = stored_history("Gold")
 
     try:
+        since = sync_start(cached, start=start) if incremental else None
+        if since is not None:
+            start = since.strftime("%Y-%m-%d")
         live = fetch_adj_close("GC=F", start=start).rename("Gold")
-        if not cached.empty and not live.empty:
-            older_cached = cached[cached.index < live.index.min()]
-            if not older_cached.empty:
-                live = pd.concat([older_cached, live]).sort_index()
-        return live
+        return merge_history(cached, live, since=since)
     except Exception as e:  # pragma: no cover - network/API fallback
         print("Gold fetch failed", e)
+        METRICS.fallback(f"stored history: {e}")
         if not cached.empty:
             print("Using cached Gold series from data/all_data.csv")
             return cached.rename("Gold")
         return empty_series("Gold")
 
 
-def fetch_rone_price_index(kind: str, areas: List[str]) -> pd.DataFrame:
-    """R-ONE 주택가격지수(kinds="sale" or "rent")"""
+def _page_items(payload: dict) -> Tuple[List[dict], int]:
+    """공공데이터 API 응답의 ``items`` 와 ``totalCount``.
+
+    ``items`` 는 리스트, ``{"item": [...]}``, 행 하나면 ``{"item": {...}}`` 로 오기도 한다.
+    """
+    body = payload.get("response", {}).get("body", {}) or {}
+    items = body.get("items") or []
+    if isinstance(items, dict):
+        items = items.get("item") or []
+    if isinstance(items, dict):
+        items = [items]
+    total = int(body.get("totalCount") or len(items))
+    return items, total
+
+
+def fetch_pages(url: str, params: Dict, *, ttl: float, page_size: int | None = None) -> List[dict]:
+    """``totalCount`` 를 다 받을 때까지 ``pageNo`` 를 넘기며 모든 행을 모읍니다."""
+    page_size = page_size or DATA_GO_PAGE_SIZE
+    rows: List[dict] = []
+    page = 1
+    while True:
+        resp = HTTP.get(url, params={**params, "pageNo": page, "numOfRows": page_size}, timeout=30, ttl=ttl)
+        resp.raise_for_status()
+        items, total = _page_items(decode.payload(resp))
+        rows.extend(items)
+        if not items or len(rows) >= total:
+            return rows
+        page += 1
+
+
+def load_areas(fp: Path = AREA_FP) -> List[str]:
+    """부동산 지수 조회 지역 코드 – ``RTMS_AREA``(콤마구분), 없으면 지역 파일(code,name)."""
+    if RTMS_AREA.strip():
+        return [a.strip() for a in RTMS_AREA.split(",") if a.strip()]
+    if not fp.exists():
+        return []
+    codes = pd.read_csv(fp, comment="#", dtype=str, skipinitialspace=True)["code"]
+    return list(dict.fromkeys(codes.dropna().str.strip()))
+
+
+def fetch_rone_price_index(areas: List[str], kinds: Iterable[str] = RONE_KINDS) -> pd.DataFrame:
+    """R-ONE 주택가격지수 – 지역 × 종류(sale/rent)를 동시에 받아 ``{kind}_{area}`` 컬럼으로 합칩니다."""
     if not RONE_KEY or not areas:
         return pd.DataFrame()
 
     base = "https://r-one.co.kr/idxsvc/getAptPriceIndex"
-    frames = []
-    end = dt.date.today().strftime("%Y%m")
-    for cd in areas:
-        try:
-            resp = requests.get(
-                base,
-                params={
-                    "serviceKey": RONE_KEY,
-                    "areaCode": cd,
-                    "indexGubun": kind,
-                    "startMonth": "200601",
-                    "endMonth": end,
-                },
-                timeout=30,
-            )
-            resp.raise_for_status()
-            items = resp.json().get("response", {}).get("body", {}).get("items", [])
-            df = pd.DataFrame(items)
-            if df.empty:
-                continue
-            df.index = pd.to_datetime(df["baseYm"], format="%Y%m")
-            df = df[["idx"]].astype(float).rename(columns={"idx": f"{kind}_{cd}"})
-            frames.append(df)
-        except Exception as e:  # pragma: no cover - 네트워크 오류 대비
-            print("R-ONE fetch failed", cd, e)
-    return pd.concat(frames, axis=1) if frames else pd.DataFrame()
+    end = today().strftime("%Y%m")
+
+    def _one(kind: str, cd: str) -> pd.Series:
+        params = {
+            "serviceKey": RONE_KEY,
+            "areaCode": cd,
+            "indexGubun": kind,
+            "startMonth": "200601",
+            "endMonth": end,
+        }
+        items = fetch_pages(base, params, ttl=CACHE_TTL["m"])
+        return decode.series(items, date_key="baseYm", value_key="idx", fmt="%Y%m", name=f"{kind}_{cd}")
+
+    jobs = {(kind, cd): partial(_one, kind, cd) for kind in kinds for cd in areas}
+    results = fan_out(jobs, workers=AREA_WORKERS)
+    parts = {}
+    for (kind, cd), res in results.items():
+        if isinstance(res, Exception):
+            print("R-ONE fetch failed", kind, cd, res)
+            METRICS.fallback(f"skipped {kind} {cd}: {res}")
+        elif not res.empty:
+            parts[res.name] = res
+    return pd.concat(parts, axis=1).sort_index() if parts else pd.DataFrame()
 
 
 def fetch_unsold_house_status() -> pd.Series:
@@ -218,30 +643,17 @@ def fetch_unsold_house_status() -> pd.Series:
         return pd.Series(dtype=float, name="Unsold")
 
     url = "https://apis.data.go.kr/B552555/unsoldHouseStatus/getUnsoldHouseStatus"
-    end = dt.date.today().strftime("%Y%m")
+    end = today().strftime("%Y%m")
     try:
-        resp = requests.get(
+        items = fetch_pages(
             url,
-            params={
-                "serviceKey": MOLIT_KEY,
-                "startYm": "200601",
-                "endYm": end,
-                "numOfRows": 1000,
-                "pageNo": 1,
-            },
-            timeout=30,
+            {"serviceKey": MOLIT_KEY, "startYm": "200601", "endYm": end},
+            ttl=CACHE_TTL["m"],
         )
-        resp.raise_for_status()
-        items = resp.json().get("response", {}).get("body", {}).get("items", [])
-        df = pd.DataFrame(items)
-        if df.empty:
-            return pd.Series(dtype=float, name="Unsold")
-        df.index = pd.to_datetime(df["ym"], format="%Y%m")
-        ser = df["unsoldHouseCnt"].astype(float)
-        ser.name = "Unsold"
-        return ser
+        return decode.series(items, date_key="ym", value_key="unsoldHouseCnt", fmt="%Y%m", name="Unsold")
     except Exception as e:  # pragma: no cover - API 오류 대비
         print("Unsold house fetch failed", e)
+        METRICS.fallback(f"empty: {e}")
         return pd.Series(dtype=float, name="Unsold")
 
 
@@ -256,178 +668,670 @@ def _extract_table_rows(html: str) -> list[list[str]]:
     return rows
 
 
-def fetch_buy_index() -> pd.Series:
-    """주간 매수우위지수 (부동산원 주간동향)"""
-    url = "https://www.reb.or.kr/r-one/report.do?cmd=weeklyTrend"
+def parse_buy_index(html: str) -> pd.Series:
+    """주간동향 페이지의 첫 표를 ``날짜 -> 매수우위지수`` 시리즈로 읽습니다."""
+    # 1) 표준 파서 경로 (설치된 parser 엔진 자동 사용)
     try:
-        html = requests.get(url, timeout=30).text
+        tables = pd.read_html(io.StringIO(html))
+        df = tables[0]
+    except Exception:
+        # 2) parser 의존성 실패 시 정규식 기반 최소 파싱
+        rows = _extract_table_rows(html)
+        if len(rows) < 2:
+            return empty_series("BuyIndex")
+        header = rows[0]
+        data_rows = [r for r in rows[1:] if len(r) >= 2]
+        df = pd.DataFrame(data_rows, columns=header[: len(data_rows[0])])
+
+    df.columns = [str(c).strip() for c in df.columns]
+    if "날짜" in df.columns:
+        dt_col = "날짜"
+    elif "주차" in df.columns:
+        dt_col = "주차"
+    else:
+        dt_col = df.columns[0]
 
-        # 1) 표준 파서 경로 (설치된 parser 엔진 자동 사용)
-        try:
-            tables = pd.read_html(io.StringIO(html))
-            df = tables[0]
-        except Exception:
-            # 2) parser 의존성 실패 시 정규식 기반 최소 파싱
-            rows = _extract_table_rows(html)
-            if len(rows) < 2:
-                return empty_series("BuyIndex")
-            header = rows[0]
-            data_rows = [r for r in rows[1:] if len(r) >= 2]
-            df = pd.DataFrame(data_rows, columns=header[: len(data_rows[0])])
-
-        df.columns = [str(c).strip() for c in df.columns]
-        if "날짜" in df.columns:
-            dt_col = "날짜"
-        elif "주차" in df.columns:
-            dt_col = "주차"
-        else:
-            dt_col = df.columns[0]
+    numeric_col = next((c for c in df.columns if c != dt_col), df.columns[1] if len(df.columns) > 1 else None)
+    if numeric_col is None:
+        return empty_series("BuyIndex")
 
-        numeric_col = next((c for c in df.columns if c != dt_col), df.columns[1] if len(df.columns) > 1 else None)
-        if numeric_col is None:
-            return empty_series("BuyIndex")
+    df[dt_col] = pd.to_datetime(df[dt_col], errors="coerce")
+    ser = pd.to_numeric(df[numeric_col], errors="coerce")
+    ser.index = df[dt_col]
+    ser = ser.dropna()
+    ser.name = "BuyIndex"
+    return to_datetime_index(ser)
 
-        df[dt_col] = pd.to_datetime(df[dt_col], errors="coerce")
-        ser = pd.to_numeric(df[numeric_col], errors="coerce")
-        ser.index = df[dt_col]
-        ser = ser.dropna()
-        ser.name = "BuyIndex"
-        return to_datetime_index(ser)
+
+def fetch_buy_index() -> pd.Series:
+    """주간 매수우위지수 (부동산원 주간동향)"""
+    try:
+        html = HTTP.get(BUY_INDEX_URL, timeout=30, ttl=CACHE_TTL["w"]).text
+        return parse_buy_index(html)
     except Exception as e:  # pragma: no cover - 스크래핑 오류 대비
         print("Buy index fetch failed", e)
+        METRICS.fallback(f"empty: {e}")
         return empty_series("BuyIndex")
 
 
-# ── 1. 원시 시리즈 수집 ──────────────────────────
-fx   = fred("DEXKOUS");                     fx.name  = "FX";        save("FX_raw", fx)
+def buy_index_history() -> pd.Series:
+    """저장된 매수우위지수 이력 – native 저장소, 없으면 BuyIndex 출력 파일."""
+    ser = _native_series("BuyIndex")
+    if ser.empty:
+        ser = load_cached_series("BuyIndex", path=DIR / "BuyIndex")
+    return ser
 
-gold = fetch_gold();                         gold.name = "Gold";     save("Gold_raw", gold)
 
-# Gold 원화 환산 (원/그램)
-gold_krwg = (gold * fx / 31.1035).rename("Gold_KRWg")
-save("Gold_KRWg", gold_krwg)
-
-dxy  = fred("DTWEXM");                      dxy.name = "DXY";       save("DXY_raw", dxy)
+def backfill_buy_index(
+    start: str,
+    end: str | None = None,
+    *,
+    max_pages: int | None = None,
+    workers: int = BACKFILL_WORKERS,
+    checkpoint: Path | None = None,
+) -> pd.Series:
+    """과거 주간동향 보고서를 거슬러 올라가며 매수우위지수 이력을 채웁니다.
+
+    ``start``~``end`` 의 매주 월요일 보고서 중 저장소에 없고 체크포인트에도 없는
+    주만 ``workers`` 개 스레드로 받습니다 (요청 속도는 REB 토큰 버킷이 제한).
+    각 페이지는 한 번만 파싱하고, 끝난 주와 읽은 값은 페이지마다 체크포인트에
+    원자적으로 기록되므로 중간에 실패해도 다시 실행하면 이어서 받습니다.
+    ``max_pages`` 로 한 번에 받을 페이지 수를 제한합니다. 새 주만 기존 이력 뒤에
+    붙여 BuyIndex 출력(과 native 저장소가 있으면 그 안의 BuyIndex)을 갱신합니다.
+    """
+    ckpt_fp = checkpoint or DIR / ".buy_index_backfill.json"
+    try:
+        state = json.loads(ckpt_fp.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        state = {}
+    done = set(state.get("done", []))
+    rows: Dict[str, float] = dict(state.get("rows", {}))
+    stored = buy_index_history()
+
+    have = done | set(stored.index.strftime("%Y-%m-%d"))
+    weeks = pd.date_range(start, end or pd.Timestamp(today()), freq="W-MON")
+    todo = [w for w in weeks.strftime("%Y-%m-%d") if w not in have][:max_pages]
+    lock = threading.Lock()
+
+    def _persist() -> None:
+        text = json.dumps({"done": sorted(done), "rows": rows}, sort_keys=True)
+        storage.atomic_write(ckpt_fp, lambda tmp: tmp.write_text(text, encoding="utf-8"))
+
+    def _crawl(week: str) -> int:
+        params = {BUY_INDEX_WEEK_PARAM: week.replace("-", "")}
+        html = HTTP.get(BUY_INDEX_URL, params=params, timeout=30, ttl=CACHE_TTL["m"]).text
+        ser = parse_buy_index(html)
+        with lock:
+            rows.update(zip(ser.index.strftime("%Y-%m-%d"), ser.tolist()))
+            done.add(week)
+            _persist()
+        return len(ser)
+
+    print(f"↺ BuyIndex backfill: {len(todo)} week(s) to crawl, {len(rows)} row(s) checkpointed")
+    results = fan_out({week: partial(_crawl, week) for week in todo}, workers=workers)
+    failed = sorted(week for week, res in results.items() if isinstance(res, Exception))
+    if failed:
+        print(f"⚠ BuyIndex backfill: {len(failed)} week(s) failed, rerun to resume (first: {failed[0]})")
+
+    crawled = pd.Series(rows, dtype="float64", name="BuyIndex")
+    crawled.index = pd.to_datetime(crawled.index)
+    new = crawled[~crawled.index.isin(stored.index)]
+    if new.empty:
+        return stored.rename("BuyIndex")
+    merged = pd.concat([stored, new]).sort_index().rename("BuyIndex")
+
+    writer = storage.BatchWriter(DIR)
+    save(writer, "BuyIndex", merged)
+    native = storage.resolve(DIR / panel.NATIVE)
+    if native is not None:
+        parts = panel.split_long(_read_store(native))
+        parts["BuyIndex"] = merged
+        save(writer, panel.NATIVE, panel.to_long(parts))
+    writer.commit()
+    print(f"＋ BuyIndex: {len(new)} new week(s), {len(merged)} total")
+    return merged
+
+
+# ── 동시 수집 오케스트레이터 ─────────────────────
+
+def host_slot(host: str) -> threading.BoundedSemaphore:
+    """호스트별 동시 요청 수를 제한하는 세마포어를 반환합니다."""
+    with _HOST_LOCK:
+        sem = _HOST_SLOTS.get(host)
+        if sem is None:
+            sem = threading.BoundedSemaphore(HOST_LIMITS.get(host, DEFAULT_HOST_LIMIT))
+            _HOST_SLOTS[host] = sem
+        return sem
+
+
+def run_concurrent(
+    jobs: Dict[str, Tuple[str, Callable[[], T]]],
+    *,
+    max_workers: int = MAX_WORKERS,
+) -> Dict[str, T]:
+    """독립적인 수집 작업을 스레드 풀에서 동시에 실행합니다.
+
+    ``jobs`` 는 ``이름 -> (호스트, 호출 함수)`` 매핑이며, 같은 호스트의 작업은
+    ``HOST_LIMITS`` 에 지정된 개수까지만 동시에 실행됩니다. 결과는 ``jobs`` 와
+    같은 순서의 딕셔너리로 돌려주며, 작업 중 예외는 그대로 전파됩니다.
+    """
+
+    def _guarded(host: str, fn: Callable[[], T]) -> T:
+        with host_slot(host):
+            return fn()
+
+    if not jobs:
+        return {}
+    workers = max(1, min(max_workers, len(jobs)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fetch") as pool:
+        futures = {name: pool.submit(_guarded, host, fn) for name, (host, fn) in jobs.items()}
+        return {name: fut.result() for name, fut in futures.items()}
+
+
+def fan_out(calls: Dict[K, Callable[[], T]], *, workers: int = AREA_WORKERS) -> Dict[K, T | Exception]:
+    """한 노드 안의 많은 요청(지역 × 종류 등)을 작은 스레드 풀로 나눠 실행합니다.
+
+    노드는 이미 ``host_slot`` 하나를 잡고 있으므로 여기서는 세마포어를 쓰지 않고,
+    요청 속도는 ``HTTP`` 의 호스트별 토큰 버킷이 제한합니다. HTTP 지표는 호출한
+    노드에 귀속되며, 실패한 호출은 예외 대신 예외 객체를 결과로 돌려줍니다.
+    """
+    node = METRICS.current
+
+    def _run(fn: Callable[[], T]) -> T | Exception:
+        with METRICS.bind(node):
+            try:
+                return fn()
+            except Exception as e:  # 호출별 실패는 호출한 쪽에서 처리
+                return e
+
+    if not calls:
+        return {}
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(calls))), thread_name_prefix="fan") as pool:
+        futures = {key: pool.submit(_run, fn) for key, fn in calls.items()}
+        return {key: fut.result() for key, fut in futures.items()}
+
+
+# ── 파이프라인 레지스트리 ─────────────────────────
+
+@dataclass(frozen=True)
+class Node:
+    """파이프라인 노드 – 원천(source) 또는 파생(derived) 시리즈.
+
+    원천 노드는 ``build(ctx)`` 로 API에서 받아 오고, 파생 노드는
+    ``build(*deps)`` 로 의존 노드의 값에서 계산합니다.
+    """
+
+    name: str
+    build: Callable[..., pd.Series | pd.DataFrame]
+    deps: Tuple[str, ...] = ()
+    host: str | None = None      # 원천 노드만 – 동시 수집 시 호스트 제한 키
+    output: str | None = None    # save() 파일 이름 (없으면 저장하지 않음)
+    freq: str = "d"
+    frame: bool = False          # 결과가 DataFrame 인 노드
+
+    @property
+    def is_source(self) -> bool:
+        return self.host is not None
+
+
+@dataclass
+class FetchContext:
+    areas: List[str] = field(default_factory=list)
+    incremental: bool = False
+
+
+REGISTRY: Dict[str, Node] = {}
+
+
+def register(node: Node) -> Node:
+    for dep in node.deps:
+        if dep not in REGISTRY:
+            raise ValueError(f"{node.name}: unknown dependency {dep}")
+    REGISTRY[node.name] = node
+    return node
+
+
+def _fred_node(name: str, series_id: str, *, start: str, freq: str = "d", output: str) -> Node:
+    return register(Node(
+        name,
+        lambda ctx: fetch_tail(
+            name, lambda s: fred(series_id, freq=freq, start=s),
+            start=start, freq=freq, incremental=ctx.incremental,
+        ),
+        host=FRED_HOST, output=output, freq=freq,
+    ))
+
+
+def _price_node(name: str, *, output: str) -> Node:
+    return register(Node(
+        name,
+        lambda prices: prices[name].dropna().rename(name) if name in prices else empty_series(name),
+        deps=("Prices",), output=output,
+    ))
+
+
+def _daily_node(name: str, source: str, method: str, *, column: str | None = None, output: str | None = None) -> Node:
+    return register(Node(
+        name,
+        lambda ser: safe_resample(ser, "D", method, name=column or name),
+        deps=(source,), output=output,
+    ))
+
+
+def _daily_frame_node(name: str, source: str) -> Node:
+    return register(Node(
+        name,
+        lambda df: df.resample("D").ffill() if not df.empty else pd.DataFrame(),
+        deps=(source,), frame=True,
+    ))
+
+
+def _kind_node(name: str, kind: str) -> Node:
+    return register(Node(
+        name,
+        lambda df: df.filter(regex=f"^{kind}_"),
+        deps=("RTMS",), output=name, freq="m", frame=True,
+    ))
+
+
+def _fetch_m2(ctx: FetchContext) -> pd.Series:
+    # 101Y003 ▷ 060Y002 ▷ LDT_MA001_A – 첫 번째로 값이 있는 후보에서 중단
+    return fetch_tail(
+        "M2",
+        lambda s: first_nonempty(
+            [
+                lambda: ecos("101Y003", start=s, ITEM_CODE1="BBHS00"),
+                lambda: ecos("060Y002", start=s),
+                lambda: ecos("LDT_MA001_A", start=s, ITM_ID="A"),
+            ],
+            name="M2",
+        ),
+        start="2008-01-01", freq="m", incremental=ctx.incremental,
+    )
 
-# --- 기준금리 & 국채 10Y (FRED) ------------------------------------------------
-rate = fred(RATE_FRED_ID, freq="m", start="1964-01-01").rename("Rate"); save("Rate_month", rate)
-bond10 = fred(BOND10_FRED_ID, freq="m", start="2000-01-01").rename("Bond10"); save("Bond10_month", bond10)
 
-# --- 연준 기준금리 & 미국 10Y -----------------------------------------------
-us_rate = fred(US_RATE_ID, freq="m", start="2000-01-01").rename("Rate_US")
-save("RateUS_month", us_rate)
-us_bond10 = fred(US_BOND10_ID, freq="m", start="2000-01-01").rename("Bond10_US")
-save("Bond10US_month", us_bond10)
+def _combine(*parts: pd.Series | pd.DataFrame) -> pd.DataFrame:
+    # 부동산·미분양·매수우위 시리즈는 값이 있을 때만 통합한다.
+    keep = [
+        p for p in parts
+        if not (p.empty and (isinstance(p, pd.DataFrame) or p.name in {"Unsold", "BuyIndex"}))
+    ]
+    return pd.concat(keep, axis=1).sort_index().ffill()
+
+
+def _real_rate(rate: pd.Series, cpi: pd.Series) -> pd.Series:
+    """CPI 가 있는 달마다 정책금리 - CPI YoY(%).
+
+    정책금리와 12개월 전 CPI 는 그 날짜의 직전 관측치(as-of)를 쓰므로, 정책금리처럼 일부
+    달만 남은 이력(``stored_history``)이나 발표가 빠진 달이 있어도 YoY 가 행 위치로 밀리지 않습니다.
+    """
+    if cpi.empty:
+        return empty_series("RealRate")
+    year_ago = cpi.index - pd.DateOffset(months=12)
+    yoy = (cpi.to_numpy() / cpi.asof(year_ago).to_numpy() - 1) * 100
+    return pd.Series(rate.asof(cpi.index).to_numpy() - yoy, index=cpi.index, name="RealRate")
+
+
+def _gold_krw(gold: pd.Series, fx: pd.Series) -> pd.Series:
+    """금 시세(원/g) – Gold 가 있는 날마다 그 날짜의 직전 환율(as-of)로 환산합니다.
+
+    두 시장의 휴장일이 달라 날짜를 정확히 맞추면 환율이 없는 날의 금값이 빠집니다.
+    """
+    if gold.empty or fx.empty:
+        return empty_series("Gold_KRWg")
+    krw = gold.to_numpy() * fx.sort_index().asof(gold.index).to_numpy() / 31.1035
+    return pd.Series(krw, index=gold.index, name="Gold_KRWg").dropna()
+
+
+# --- 1. 원천 시리즈 ------------------------------------------------------------
+_fred_node("FX", "DEXKOUS", start="2008-01-01", output="FX_raw")
+register(Node("Gold", lambda ctx: fetch_gold(incremental=ctx.incremental), host=YAHOO_HOST, output="Gold_raw"))
+_fred_node("DXY", "DTWEXM", start="2008-01-01", output="DXY_raw")
+_fred_node("Rate", RATE_FRED_ID, start="1964-01-01", freq="m", output="Rate_month")
+_fred_node("Bond10", BOND10_FRED_ID, start="2000-01-01", freq="m", output="Bond10_month")
+_fred_node("Rate_US", US_RATE_ID, start="2000-01-01", freq="m", output="RateUS_month")
+_fred_node("Bond10_US", US_BOND10_ID, start="2000-01-01", freq="m", output="Bond10US_month")
+_fred_node("CPI", CPI_FRED_ID, start="2000-01-01", freq="m", output="CPI_month")
+_fred_node("CoreCPI", CORECPI_FRED_ID, start="2000-01-01", freq="m", output="CoreCPI_month")
+_fred_node("M2_US", "M2SL", start="2008-01-01", freq="m", output="M2_US_month")
+register(Node("M2", _fetch_m2, host=ECOS_HOST, output="M2_month", freq="m"))
+register(Node(
+    "Prices",
+    lambda ctx: fetch_prices(load_universe(), incremental=ctx.incremental),
+    host=YAHOO_HOST, output="prices", frame=True,
+))
+register(Node("RTMS", lambda ctx: fetch_rone_price_index(ctx.areas), host=RONE_HOST, output="RTMS", freq="m", frame=True))
+register(Node("Unsold", lambda ctx: fetch_unsold_house_status(), host=MOLIT_HOST, output="Unsold", freq="m"))
+register(Node(
+    "BuyIndex",
+    lambda ctx: merge_history(buy_index_history(), fetch_buy_index()),
+    host=REB_HOST, output="BuyIndex",
+))
+
+# --- 2. 파생 시리즈 ------------------------------------------------------------
+# 부동산 지수 (R-ONE 지역 × 종류 프레임에서 종류별로 분리)
+_kind_node("RTMS_sale", "sale")
+_kind_node("RTMS_rent", "rent")
+# 주가 지수 (Yahoo Finance 유니버스에서 추출)
+_price_node("SP500", output="SP500_raw")
+_price_node("KODEX200", output="KODEX200_raw")
+_price_node("Bitcoin", output="Bitcoin_raw")
+# Gold 원화 환산 (원/그램)
+register(Node("Gold_KRWg", lambda gold, fx: _gold_krw(gold, fx), deps=("Gold", "FX"), output="Gold_KRWg"))
+# Real Rate = 정책금리 - CPI YoY
+register(Node(
+    "RealRate",
+    _real_rate,
+    deps=("Rate", "CPI"), output="RealRate_month", freq="m",
+))
+
+# --- 3. 저장소 ----------------------------------------------------------------
+# 원래 빈도 저장소 – 앱·신호 계산은 panel.load_panel 로 필요한 구간만 as-of 정렬해 쓴다.
+NATIVE_SERIES = (
+    "FX", "Gold", "Gold_KRWg", "DXY",
+    "Rate", "Bond10", "Rate_US", "Bond10_US",
+    "M2", "M2_US", "CPI", "CoreCPI", "RealRate",
+    "RTMS", "Unsold", "BuyIndex",
+    "SP500", "KODEX200", "Bitcoin",
+)
+register(Node(
+    "native",
+    lambda *parts: panel.to_long(dict(zip(NATIVE_SERIES, parts))),
+    deps=NATIVE_SERIES, output=panel.NATIVE, frame=True,
+))
+
+
+def register_daily_export() -> None:
+    """예전 일 빈도 출력(``*_D``·``Spread5D``·``all_data``) 노드를 등록합니다.
+
+    전체 이력을 일 격자로 펼쳐 ffill 하는 비싼 단계라 ``DAILY_EXPORT=1`` 일 때만 등록하고,
+    기본 실행은 native 저장소만 만듭니다.
+    """
+    # 월→일 변환
+    _daily_node("Rate_D", "Rate", "ffill", column="Rate")
+    _daily_node("Bond10_D", "Bond10", "ffill", column="Bond10")
+    _daily_node("Rate_US_D", "Rate_US", "ffill", column="Rate_US")
+    _daily_node("Bond10_US_D", "Bond10_US", "ffill", column="Bond10_US")
+    _daily_node("M2_D", "M2", "linear", output="M2_daily")
+    _daily_node("M2_US_D", "M2_US", "linear", output="M2_US_daily")
+    _daily_node("CPI_D", "CPI", "ffill", output="CPI_daily")
+    _daily_node("CoreCPI_D", "CoreCPI", "ffill", output="CoreCPI_daily")
+    _daily_node("RealRate_D", "RealRate", "ffill", output="RealRate_daily")
+    _daily_frame_node("RTMS_sale_D", "RTMS_sale")
+    _daily_frame_node("RTMS_rent_D", "RTMS_rent")
+    _daily_node("Unsold_D", "Unsold", "ffill", column="Unsold")
+    _daily_node("BuyIndex_D", "BuyIndex", "ffill", column="BuyIndex")
+
+    # 금리 스프레드(10Y - 정책금리) 5일 평균
+    register(Node(
+        "Spread5D",
+        lambda bond10_d, rate_d: (bond10_d - rate_d).rolling(5).mean().rename("Spread5D"),
+        deps=("Bond10_D", "Rate_D"), output="Spread5D",
+    ))
+
+    # 통합
+    register(Node(
+        "all_data",
+        _combine,
+        deps=(
+            "FX", "Gold", "Gold_KRWg", "DXY",
+            "Rate_D", "Bond10_D", "Rate_US_D", "Bond10_US_D", "Spread5D",
+            "M2_D", "M2_US_D", "CPI_D", "CoreCPI_D", "RealRate_D",
+            "RTMS_sale_D", "RTMS_rent_D", "Unsold_D", "BuyIndex_D",
+            "SP500", "KODEX200", "Bitcoin",
+        ),
+        output="all_data", frame=True,
+    ))
+
+
+if DAILY_EXPORT:
+    register_daily_export()
+
+
+# ── 파이프라인 실행 ──────────────────────────────
+
+def downstream(names: Iterable[str]) -> set[str]:
+    """``names`` 와 그에 의존하는 모든 노드."""
+    out = set(names)
+    for name, node in REGISTRY.items():  # 등록 순서 = 위상 순서
+        if out.intersection(node.deps):
+            out.add(name)
+    return out
 
-# --- 물가 (FRED) --------------------------------------------------------------
-cpi = fred(CPI_FRED_ID, freq="m", start="2000-01-01").rename("CPI")
-save("CPI_month", cpi)
-core_cpi = fred(CORECPI_FRED_ID, freq="m", start="2000-01-01").rename("CoreCPI")
-save("CoreCPI_month", core_cpi)
 
-# Real Rate = 정책금리 - CPI YoY
-cpi_yoy = cpi.pct_change(12) * 100
-real_rate = (rate - cpi_yoy).rename("RealRate")
-save("RealRate_month", real_rate)
-
-# --- 미국 M2 (FRED) ------------------------------------------------------------
-m2_us = fred("M2SL", freq="m", start="2008-01-01").rename("M2_US")
-save("M2_US_month", m2_us)
-
-# --- M2 (순차 폴백) ----------------------------------------------------------
-_m2_candidates = [
-    ecos("101Y003", ITEM_CODE1="BBHS00"),
-    ecos("060Y002"),
-    ecos("LDT_MA001_A", ITM_ID="A"),
-]
+fingerprint = storage.content_hash
 
-m2 = next((s for s in _m2_candidates if not s.empty), empty_series("M2"))
-save("M2_month", m2)
-
-# --- 주가 지수 (Yahoo Finance) ------------------------------------------------
-sp500 = fetch_adj_close("^GSPC").rename("SP500");          save("SP500_raw", sp500)
-kodex = fetch_adj_close("069500.KS").rename("KODEX200");  save("KODEX200_raw", kodex)
-btc   = fetch_adj_close("BTC-USD", start="2014-01-01").rename("Bitcoin"); save("Bitcoin_raw", btc)
-
-# --- 부동산 지수 --------------------------------------------------------------
-areas = [a.strip() for a in RTMS_AREA.split(',') if a.strip()]
-idx_sale = fetch_rone_price_index("sale", areas)
-if not idx_sale.empty:
-    save("RTMS_sale", idx_sale)
-idx_rent = fetch_rone_price_index("rent", areas)
-if not idx_rent.empty:
-    save("RTMS_rent", idx_rent)
-
-unsold = fetch_unsold_house_status()
-if not unsold.empty:
-    save("Unsold", unsold)
-
-buy_idx = fetch_buy_index()
-if not buy_idx.empty:
-    save("BuyIndex", buy_idx)
-
-# ── 2. 월→일 변환 ──────────────────────────────
-rate_d = safe_resample(rate, "D", "ffill", name="Rate")
-bond10_d = safe_resample(bond10, "D", "ffill", name="Bond10")
-us_rate_d = safe_resample(us_rate, "D", "ffill", name="Rate_US")
-us_bond10_d = safe_resample(us_bond10, "D", "ffill", name="Bond10_US")
-m2_d = safe_resample(m2, "D", "linear", name="M2_D"); save("M2_daily", m2_d)
-m2_us_d = safe_resample(m2_us, "D", "linear", name="M2_US_D"); save("M2_US_daily", m2_us_d)
-cpi_d = safe_resample(cpi, "D", "ffill", name="CPI_D"); save("CPI_daily", cpi_d)
-core_cpi_d = safe_resample(core_cpi, "D", "ffill", name="CoreCPI_D"); save("CoreCPI_daily", core_cpi_d)
-real_rate_d = safe_resample(real_rate, "D", "ffill", name="RealRate_D"); save("RealRate_daily", real_rate_d)
-
-if not idx_sale.empty:
-    idx_sale_d = idx_sale.resample("D").ffill()
-else:
-    idx_sale_d = pd.DataFrame()
-if not idx_rent.empty:
-    idx_rent_d = idx_rent.resample("D").ffill()
-else:
-    idx_rent_d = pd.DataFrame()
-if not unsold.empty:
-    unsold_d = unsold.resample("D").ffill()
-else:
-    unsold_d = pd.Series(dtype=float, name="Unsold")
-if not buy_idx.empty:
-    buy_idx_d = buy_idx.resample("D").ffill()
-else:
-    buy_idx_d = pd.Series(dtype=float, name="BuyIndex")
-
-# 금리 스프레드(10Y - 정책금리) 5일 평균
-spread5d = (bond10_d - rate_d).rolling(5).mean().rename("Spread5D")
-save("Spread5D", spread5d)
-
-# ── 3. 통합 & 저장 ─────────────────────────────
-series_list = [
-    fx,
-    gold,
-    gold_krwg,
-    dxy,
-    rate_d,
-    bond10_d,
-    us_rate_d,
-    us_bond10_d,
-    spread5d,
-    m2_d,
-    m2_us_d,
-    cpi_d,
-    core_cpi_d,
-    real_rate_d,
-]
 
-if not idx_sale_d.empty:
-    series_list.append(idx_sale_d)
-if not idx_rent_d.empty:
-    series_list.append(idx_rent_d)
-if not unsold_d.empty:
-    series_list.append(unsold_d)
-if not buy_idx_d.empty:
-    series_list.append(buy_idx_d)
+def load_output(node: Node) -> pd.Series | pd.DataFrame:
+    """이번 실행에서 다시 만들지 않는 노드의 값을 저장된 파일에서 읽습니다."""
+    if node.output and storage.exists(DIR / node.output):
+        df = storage.read_frame(DIR / node.output)
+        if node.frame:
+            return df
+        return df.iloc[:, 0] if not df.empty else empty_series(node.name)
+    if node.frame:
+        return pd.DataFrame()
+    return stored_history(node.name, freq=node.freq)
+
+
+def run_pipeline(
+    ctx: FetchContext,
+    *,
+    only: Iterable[str] | None = None,
+    force: bool = False,
+    state_path: Path | None = None,
+) -> Dict[str, pd.Series | pd.DataFrame]:
+    """레지스트리를 실행합니다.
+
+    ``only`` 를 주면 그 노드와 하위 노드만 다시 만들고, 나머지는 저장된 파일에서
+    읽습니다. 입력 해시가 지난 실행과 같고 결과 파일이 있으면 파생 노드의 계산과
+    저장을 건너뜁니다(``force`` 로 무시). 출력은 ``storage.BatchWriter`` 로 쓰므로
+    내용이 같은 파일은 다시 쓰지 않고, 끝에 ``manifest.json`` 을 갱신합니다.
+    """
+    targets = downstream(only) if only else set(REGISTRY)
+    writer = storage.BatchWriter(DIR, bundle=BUNDLE_FP)
+    state_fp = state_path or (DIR / ".fetch_state.json")
+    try:
+        state = json.loads(state_fp.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        state = {}
+
+    values: Dict[str, pd.Series | pd.DataFrame] = {}
+    prints: Dict[str, str] = {}
+
+    def output_exists(node: Node) -> bool:
+        return node.output is not None and storage.exists(DIR / node.output)
+
+    def finish(node: Node, value, inputs: str | None = None) -> None:
+        values[node.name] = value
+        prints[node.name] = fingerprint(value)
+        METRICS.set(node.name, rows=len(value))
+        if node.name not in targets:
+            return
+        if node.output and not value.empty:
+            save(writer, node.output, value)
+        state[node.name] = {"inputs": inputs, "output": prints[node.name]}
+
+    def tracked(node: Node) -> Callable[[], pd.Series | pd.DataFrame]:
+        def _run():
+            with METRICS.track(node.name, kind="source"):
+                return node.build(ctx)
+        return _run
+
+    # 1) 선택된 원천 노드 – 동시 수집
+    sources = [n for n, node in REGISTRY.items() if node.is_source and n in targets]
+    fetched = run_concurrent({n: (REGISTRY[n].host, tracked(REGISTRY[n])) for n in sources})
+    check_replay()
+
+    # 2) 나머지는 위상 순서대로
+    for name, node in REGISTRY.items():
+        if name in fetched:
+            finish(node, fetched[name])
+            continue
+        if node.is_source or name not in targets:
+            with METRICS.track(name, kind="stored") as rec:
+                value = load_output(node)
+                if value.empty and not node.is_source:
+                    value = node.build(*(values[d] for d in node.deps))
+                rec["status"] = "stored"
+            finish(node, value)
+            continue
+        inputs = hashlib.sha1("|".join(prints[d] for d in node.deps).encode()).hexdigest()
+        with METRICS.track(name, kind="derived") as rec:
+            if not force and state.get(name, {}).get("inputs") == inputs and output_exists(node):
+                print(f"· {name:13s} unchanged")
+                rec["status"] = "skipped"
+                value = load_output(node)
+            else:
+                value = node.build(*(values[d] for d in node.deps))
+        finish(node, value, inputs)
+
+    writer.commit()
+    if writer.changed:
+        print(f"✎ {len(writer.changed)} output(s) changed → {DIR / storage.MANIFEST}")
+    text = json.dumps(state, indent=1, sort_keys=True)
+    storage.atomic_write(state_fp, lambda tmp: tmp.write_text(text, encoding="utf-8"))
+    return values
+
+
+def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="거시·자산 원천 데이터 수집")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        default=os.getenv("FETCH_INCREMENTAL", "") == "1",
+        help="data/all_data.csv 의 마지막 저장일 이후(겹침 구간 포함)만 받아 병합",
+    )
+    cache = parser.add_mutually_exclusive_group()
+    cache.add_argument("--no-cache", action="store_true", help="응답 디스크 캐시를 읽지도 쓰지도 않음")
+    cache.add_argument("--refresh", action="store_true", help="캐시를 무시하고 새로 받아 캐시를 갱신")
+    parser.add_argument(
+        "--only",
+        type=lambda s: [n.strip() for n in s.split(",") if n.strip()],
+        help="이 노드들과 하위 노드만 다시 만들기 (예: CPI,RealRate)",
+    )
+    parser.add_argument("--force", action="store_true", help="입력이 같아도 파생 노드를 다시 계산")
+    parser.add_argument("--list", action="store_true", help="노드와 의존 관계를 출력하고 종료")
+    parser.add_argument(
+        "--backfill-buy-index",
+        metavar="START",
+        help="START(YYYY-MM-DD) 이후 주간동향 보고서를 거슬러 받아 매수우위지수 이력을 채우고 종료",
+    )
+    parser.add_argument("--max-pages", type=int, help="--backfill-buy-index 한 번에 받을 최대 페이지 수")
+    fixtures = parser.add_mutually_exclusive_group()
+    fixtures.add_argument("--record", type=Path, metavar="DIR", help="모든 원천 응답을 DIR 에 픽스처로 기록")
+    fixtures.add_argument(
+        "--replay",
+        metavar="DIR|URL",
+        help="네트워크 대신 픽스처(DIR) 또는 `python replay.py` 재생 서버(URL)에서 응답을 받음",
+    )
+    chaos = parser.add_argument_group("재생 장애 주입 (--replay DIR)")
+    chaos.add_argument("--latency", type=float, default=0.0, help="응답마다 더할 지연(초)")
+    chaos.add_argument("--jitter", type=float, default=0.0, help="지연에 더할 무작위 지터 상한(초)")
+    chaos.add_argument("--fail-rate", type=float, default=0.0, help="실패 주입 확률 (0~1)")
+    chaos.add_argument("--fail-status", type=int, default=503, help="실패 상태 코드 (0 이면 연결 오류)")
+    chaos.add_argument("--seed", type=int, help="지연·실패 난수 시드")
+    args = parser.parse_args(argv)
+    unknown = [n for n in args.only or [] if n not in REGISTRY]
+    if unknown:
+        parser.error(f"unknown node(s): {', '.join(unknown)} (see --list)")
+    return args
+
+
+def check_replay() -> None:
+    """재생 중 번들에 없는 요청이 있었으면, 저장된 이력으로 채운 결과를 쓰기 전에 멈춥니다."""
+    misses = sorted(set(REPLAY.misses)) if REPLAY is not None else []
+    if misses:
+        shown = "\n  ".join(misses[:10])
+        more = f"\n  … {len(misses) - 10} more" if len(misses) > 10 else ""
+        raise replay.MissingFixture(f"{len(misses)} request(s) not in the fixture bundle:\n  {shown}{more}")
+
+
+def attach_fixtures(args: argparse.Namespace) -> replay.Fixtures | None:
+    """``--record``/``--replay`` 에 맞춰 공용 HTTP 세션에 기록·재생 어댑터를 붙입니다.
+
+    기록은 디스크 캐시를 읽지 않고(refresh) 실제로 요청해야 빠짐없이 남고, 기록한 날을
+    번들에 함께 남깁니다. 재생은 캐시를 끄고 API 키 자리에 ``replay.PLACEHOLDER_KEY`` 를
+    넣어 키 없이도 기록한 요청과 같은 URL 을 만들며, ``RUN_DATE`` 를 기록한 날로 고정합니다
+    (기록한 날이 없는 번들은 재생하지 않음).
+    """
+    global FRED_KEY, ECOS_KEY, MOLIT_KEY, RONE_KEY, RUN_DATE, REPLAY
+    fixtures = None
+    if args.record:
+        fixtures = replay.Fixtures(args.record, normalize=HTTP_CACHE.normalize)
+        fixtures.today = today()
+        adapter = replay.RecordAdapter(fixtures, pool_connections=MAX_WORKERS, pool_maxsize=MAX_WORKERS)
+        HTTP.record = fixtures.add
+        HTTP_CACHE.mode = "refresh"
+    elif args.replay:
+        RUN_DATE = replay.run_date(args.replay)
+        if RUN_DATE is None:
+            raise SystemExit(f"{args.replay}: no {replay.RUN} run date – re-record the bundle with --record")
+        FRED_KEY = ECOS_KEY = MOLIT_KEY = RONE_KEY = replay.PLACEHOLDER_KEY
+        HTTP.replay = True
+        HTTP_CACHE.mode = "off"
+        if args.replay.startswith(("http://", "https://")):
+            adapter = REPLAY = replay.ForwardAdapter(args.replay, pool_connections=MAX_WORKERS, pool_maxsize=MAX_WORKERS)
+        else:
+            fixtures = replay.Fixtures(Path(args.replay))
+            chaos = replay.Chaos(
+                latency=args.latency, jitter=args.jitter, fail_rate=args.fail_rate,
+                fail_status=args.fail_status or None, seed=args.seed,
+            )
+            adapter = REPLAY = replay.ReplayAdapter(fixtures, chaos)
+            print(f"▶ replaying {len(fixtures)} fixture(s) from {args.replay} as of {RUN_DATE}")
+    else:
+        return None
+    for prefix in ("https://", "http://"):
+        HTTP.session.mount(prefix, adapter)
+    return fixtures
+
+
+def native_summary(native: pd.DataFrame) -> pd.DataFrame:
+    """native 저장소의 시리즈별 행 수·첫 날·마지막 날·마지막 값."""
+    rows = native.reset_index(names=storage.INDEX_NAME)
+    return rows.groupby(panel.SERIES, sort=False).agg(
+        rows=(panel.VALUE, "size"),
+        first=(storage.INDEX_NAME, "min"),
+        last=(storage.INDEX_NAME, "max"),
+        value=(panel.VALUE, "last"),
+    )
 
-series_list.extend([sp500, kodex, btc])
 
-all_df = pd.concat(series_list, axis=1).sort_index().ffill()
+def main(argv: List[str] | None = None) -> None:
+    args = parse_args(argv)
+    if args.list:
+        for name, node in REGISTRY.items():
+            kind = "source " if node.is_source else "derived"
+            print(f"{kind} {name:13s} ← {', '.join(node.deps) or node.host}")
+        return
+    if args.no_cache:
+        HTTP_CACHE.mode = "off"
+    elif args.refresh:
+        HTTP_CACHE.mode = "refresh"
+    fixtures = attach_fixtures(args)
+
+    DIR.mkdir(exist_ok=True)
+    if args.backfill_buy_index:
+        backfill_buy_index(args.backfill_buy_index, max_pages=args.max_pages)
+        print(f"http={HTTP.stats()}")
+        return
+    ctx = FetchContext(
+        areas=load_areas(),
+        incremental=args.incremental,
+    )
 
-save("all_data", all_df)
-print(all_df.tail())
+    t0 = time.perf_counter()
+    try:
+        values = run_pipeline(ctx, only=args.only, force=args.force)
+        print(native_summary(values["native"]))
+    finally:
+        if args.record:
+            print(f"● recorded {len(fixtures)} fixture(s) → {fixtures.save()}")
+        METRICS.write(RUN_LOG_FP)
+        print(METRICS.table())
+        print(f"⏱ total {time.perf_counter() - t0:.1f}s  http={HTTP.stats()}  log={RUN_LOG_FP}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+http_cache.py  –  원천 API 응답 디스크 캐시
+─────────────────────────────────────────────
+✓ 키     : 정규화한 URL + 쿼리(정렬) 의 SHA-256, API 키는 제거
+✓ TTL    : 호출마다 지정 (월간 시리즈 하루, 일간 가격 수 분)
+✓ 재검증 : 만료 시 ETag / Last-Modified 조건부 요청, 304 면 본문 재사용
+✓ 용량   : 최대 바이트 초과 시 가장 오래 쓰지 않은 항목부터 삭제(LRU)
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Mapping, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import storage
+
+# 캐시 키에서 제거할 인증 파라미터 이름
+SECRET_PARAMS = frozenset({"api_key", "apikey", "servicekey", "key", "auth", "crtfc_key"})
+REDACTED = "***"
+
+MODES = ("use", "refresh", "off")
+
+
+class CacheEntry:
+    """캐시된 응답 본문과 메타데이터."""
+
+    __slots__ = ("body", "meta")
+
+    def __init__(self, body: bytes, meta: Dict) -> None:
+        self.body = body
+        self.meta = meta
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.meta.get("stored_at", 0.0)
+
+    def fresh(self, ttl: float) -> bool:
+        return self.age < ttl
+
+    def validators(self) -> Dict[str, str]:
+        """조건부 재검증 요청 헤더."""
+        headers = {}
+        if self.meta.get("etag"):
+            headers["If-None-Match"] = self.meta["etag"]
+        if self.meta.get("last_modified"):
+            headers["If-Modified-Since"] = self.meta["last_modified"]
+        return headers
+
+
+class ResponseCache:
+    """내용 주소 기반(SHA-256) 디스크 응답 캐시.
+
+    ``mode`` 는 ``use``(기본), ``refresh``(읽지 않고 새로 저장), ``off``(사용 안 함).
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        max_bytes: int = 256 * 1024 * 1024,
+        secrets: Iterable[str] = (),
+        mode: str = "use",
+    ) -> None:
+        if mode not in MODES:
+            raise ValueError(f"Unsupported cache mode: {mode}")
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.secrets = {s for s in secrets if s}
+        self.mode = mode
+        self._lock = threading.Lock()
+        self._total: int | None = None  # 본문 바이트 합계 – 처음 evict() 때 한 번 훑어 채운다
+
+    # ── 키 ────────────────────────────────────────
+    def normalize(self, url: str, params: Mapping | None = None) -> str:
+        """비밀값을 지운 정규화 URL (쿼리 파라미터는 이름순 정렬)."""
+        parts = urlsplit(url)
+        path = "/".join(REDACTED if seg in self.secrets else seg for seg in parts.path.split("/"))
+        query = parse_qsl(parts.query, keep_blank_values=True)
+        query += [(k, str(v)) for k, v in (params or {}).items()]
+        query = sorted(
+            (k, REDACTED if k.lower() in SECRET_PARAMS or v in self.secrets else v) for k, v in query
+        )
+        return f"{parts.scheme}://{parts.netloc.lower()}{path}?{urlencode(query)}"
+
+    def key(self, url: str, params: Mapping | None = None) -> str:
+        return hashlib.sha256(self.normalize(url, params).encode("utf-8")).hexdigest()
+
+    def _paths(self, key: str) -> Tuple[Path, Path]:
+        return self.root / f"{key}.body", self.root / f"{key}.json"
+
+    # ── 읽기 / 쓰기 ──────────────────────────────
+    def load(self, key: str) -> CacheEntry | None:
+        if self.mode != "use":
+            return None
+        body_fp, meta_fp = self._paths(key)
+        try:
+            meta = json.loads(meta_fp.read_text(encoding="utf-8"))
+            body = body_fp.read_bytes()
+        except (OSError, ValueError):
+            return None
+        with contextlib.suppress(OSError):  # 읽은 뒤 다른 스레드가 지웠으면 건너뜀
+            os.utime(body_fp)  # LRU 순서 갱신
+        return CacheEntry(body, meta)
+
+    def store(self, key: str, body: bytes, meta: Dict) -> None:
+        if self.mode == "off":
+            return
+        self.root.mkdir(parents=True, exist_ok=True)
+        body_fp, meta_fp = self._paths(key)
+        meta = {**meta, "stored_at": time.time()}
+        replaced = _size(body_fp)
+        _atomic_write(body_fp, body)
+        _atomic_write(meta_fp, json.dumps(meta, ensure_ascii=False).encode("utf-8"))
+        with self._lock:
+            if self._total is not None:
+                self._total += len(body) - replaced
+            full = self._total is None or self._total > self.max_bytes
+        if full:  # 폴더 전체를 훑는 것은 처음 한 번과 상한을 넘었을 때뿐
+            self.evict()
+
+    def touch(self, key: str) -> None:
+        """304 재검증 성공 – 저장 시각만 갱신합니다."""
+        _, meta_fp = self._paths(key)
+        try:
+            meta = json.loads(meta_fp.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        meta["stored_at"] = time.time()
+        _atomic_write(meta_fp, json.dumps(meta, ensure_ascii=False).encode("utf-8"))
+
+    def discard(self, key: str) -> None:
+        with self._lock:
+            removed = self._remove(key)
+            if self._total is not None:
+                self._total -= removed
+
+    def _remove(self, key: str) -> int:
+        """항목의 두 파일을 지우고, 지운 본문 크기를 반환합니다."""
+        body_fp, meta_fp = self._paths(key)
+        size = _size(body_fp)
+        body_fp.unlink(missing_ok=True)
+        meta_fp.unlink(missing_ok=True)
+        return size
+
+    def evict(self) -> int:
+        """용량 상한을 넘으면 오래 쓰지 않은 항목부터 지우고, 지운 개수를 반환합니다."""
+        with self._lock:
+            bodies = []
+            total = 0
+            for fp in self.root.glob("*.body"):
+                try:
+                    st = fp.stat()
+                except OSError:
+                    continue
+                bodies.append((st.st_mtime, st.st_size, fp))
+                total += st.st_size
+            removed = 0
+            for _, size, fp in sorted(bodies):
+                if total <= self.max_bytes:
+                    break
+                self._remove(fp.stem)
+                total -= size
+                removed += 1
+            self._total = total
+            return removed
+
+
+def _size(fp: Path) -> int:
+    try:
+        return fp.stat().st_size
+    except OSError:
+        return 0
+
+
+def _atomic_write(fp: Path, data: bytes) -> None:
+    storage.atomic_write(fp, lambda tmp: tmp.write_bytes(data))
@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+http_client.py  –  API 래퍼 공용 HTTP 클라이언트
+─────────────────────────────────────────────
+✓ 커넥션 풀 : requests.Session + HTTPAdapter (keep-alive 재사용)
+✓ 재시도   : 5xx·429·연결 오류 시 지수 백오프 + 지터, Retry-After 준수
+✓ 속도 제한 : 호스트별 토큰 버킷 (예: FRED 120 req/min)
+✓ 캐시     : ttl 을 준 요청은 http_cache.ResponseCache 에 저장·재검증
+✓ 계측     : 요청·재시도·캐시 적중·신규/재사용 커넥션 카운터
+✓ 기록/재생 : HTTP 가 아닌 원천(yfinance)도 record 훅·replay 플래그로 replay.py 번들에 포함
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+import email.utils
+from typing import Callable, Dict, Mapping, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from http_cache import CacheEntry, ResponseCache
+
+RETRY_STATUS = frozenset({429, 500, 502, 503, 504})
+
+
+class TokenBucket:
+    """초당 ``rate`` 개씩 채워지는 토큰 버킷 – 토큰이 없으면 기다립니다."""
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._stamp = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """토큰 1개를 소비하고, 기다린 시간(초)을 반환합니다."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._tokens = min(self.capacity, self._tokens + (now - self._stamp) * self.rate)
+                self._stamp = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                delay = (1 - self._tokens) / self.rate
+            self._sleep(delay)
+            waited += delay
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Retry-After 헤더(초 또는 HTTP-date)를 대기 초로 바꿉니다."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+class HttpClient:
+    """모든 API 래퍼가 함께 쓰는 커넥션 풀·재시도·속도 제한 클라이언트.
+
+    ``rate_limits`` 는 ``호스트 -> (요청 수, 기간 초)`` 매핑이고, ``on_request`` 는
+    요청(또는 캐시 적중)마다 호스트·지연·바이트·재시도·캐시 상태를 담은 딕셔너리를
+    받는 콜백입니다.
+
+    ``record`` 는 ``cached`` 로 만든 본문을 ``(url, params, body)`` 로 받는 콜백이고,
+    ``replay`` 가 참이면 ``cached`` 는 원천을 호출하지 않고 같은 URL 을 세션으로
+    요청합니다 (세션에 ``replay.ReplayAdapter`` 등을 마운트해 둔 경우).
+    """
+
+    def __init__(
+        self,
+        *,
+        retries: int = 4,
+        backoff: float = 0.5,
+        max_backoff: float = 30.0,
+        pool_size: int = 16,
+        rate_limits: Mapping[str, Tuple[int, float]] | None = None,
+        session: requests.Session | None = None,
+        cache: ResponseCache | None = None,
+        on_request: Callable[[Dict], None] | None = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self._sleep = sleep
+        self.cache = cache
+        self.on_request = on_request
+        self.record: Callable[[str, Mapping | None, bytes], None] | None = None
+        self.replay = False
+        self.session = session or requests.Session()
+        if session is None:
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
+        self._buckets: Dict[str, TokenBucket] = {
+            host: TokenBucket(count / period, count) for host, (count, period) in (rate_limits or {}).items()
+        }
+        self._lock = threading.Lock()
+        self._counters = {
+            "requests": 0,
+            "retries": 0,
+            "failures": 0,
+            "throttled_s": 0.0,
+            "cache_hits": 0,
+            "cache_misses": 0,
+            "cache_revalidated": 0,
+        }
+
+    # ── 내부 ──────────────────────────────────────
+    def _count(self, key: str, amount: float = 1) -> None:
+        with self._lock:
+            self._counters[key] += amount
+
+    def _delay(self, attempt: int, retry_after: float | None) -> float:
+        if retry_after is not None:
+            return min(retry_after, self.max_backoff)
+        base = min(self.max_backoff, self.backoff * (2 ** attempt))
+        return random.uniform(0, base)  # full jitter
+
+    def _send(
+        self,
+        url: str,
+        params: Mapping | None,
+        timeout: float,
+        headers: Mapping | None,
+        info: Dict[str, int],
+    ) -> requests.Response:
+        host = urlsplit(url).hostname or ""
+        bucket = self._buckets.get(host)
+        attempt = 0
+        while True:
+            if bucket is not None:
+                self._count("throttled_s", bucket.acquire())
+            self._count("requests")
+            info["requests"] += 1
+            try:
+                resp = self.session.get(url, params=params, timeout=timeout, headers=headers)
+            except (requests.ConnectionError, requests.Timeout) as exc:
+                if attempt >= self.retries:
+                    self._count("failures")
+                    raise
+                delay = self._delay(attempt, None)
+                print(f"↻ {host} {type(exc).__name__} – retry in {delay:.1f}s")
+            else:
+                if resp.status_code not in RETRY_STATUS or attempt >= self.retries:
+                    if resp.status_code in RETRY_STATUS:
+                        self._count("failures")
+                    return resp
+                delay = self._delay(attempt, parse_retry_after(resp.headers.get("Retry-After")))
+                print(f"↻ {host} HTTP {resp.status_code} – retry in {delay:.1f}s")
+                resp.close()
+            self._count("retries")
+            info["retries"] += 1
+            self._sleep(delay)
+            attempt += 1
+
+    def _produce(self, url: str, params: Mapping | None, produce: Callable[[], bytes]) -> bytes:
+        if self.replay:
+            info = {"requests": 0, "retries": 0}
+            resp = self._send(url, params, 30, None, info)
+            resp.raise_for_status()
+            return resp.content
+        body = produce()
+        if self.record is not None:
+            self.record(url, params, body)
+        return body
+
+    def _emit(self, url: str, cache: str | None, t0: float, info: Mapping[str, int], nbytes: int) -> None:
+        if self.on_request is None:
+            return
+        self.on_request({
+            "host": urlsplit(url).hostname or "",
+            "cache": cache,
+            "latency": time.perf_counter() - t0,
+            "bytes": nbytes,
+            **info,
+        })
+
+    # ── 공개 API ──────────────────────────────────
+    def get(
+        self,
+        url: str,
+        *,
+        params: Mapping | None = None,
+        timeout: float = 30,
+        ttl: float | None = None,
+    ) -> requests.Response:
+        """GET 요청 – 일시적 오류는 재시도하고 마지막 응답(또는 예외)을 돌려줍니다.
+
+        ``ttl`` (초)을 주면 디스크 캐시를 거치며, 만료된 항목은 조건부 요청으로
+        재검증합니다. 캐시에서 나온 응답은 ``from_cache`` 속성이 ``True`` 입니다.
+        """
+        t0 = time.perf_counter()
+        info = {"requests": 0, "retries": 0}
+        cache = self.cache if ttl is not None else None
+        if cache is None or cache.mode == "off":
+            try:
+                resp = self._send(url, params, timeout, None, info)
+            except Exception:
+                self._emit(url, None, t0, info, 0)
+                raise
+            self._emit(url, None, t0, info, len(resp.content))
+            return resp
+
+        key = cache.key(url, params)
+        entry = cache.load(key)
+        if entry is not None and entry.fresh(ttl):
+            self._count("cache_hits")
+            self._emit(url, "hit", t0, info, len(entry.body))
+            return _cached_response(entry)
+        self._count("cache_misses")
+
+        try:
+            resp = self._send(url, params, timeout, entry.validators() if entry else None, info)
+        except Exception:
+            self._emit(url, "miss", t0, info, 0)
+            raise
+        if resp.status_code == 304 and entry is not None:
+            cache.touch(key)
+            self._count("cache_revalidated")
+            self._emit(url, "revalidated", t0, info, 0)
+            return _cached_response(entry)
+        if resp.status_code == 200:
+            cache.store(
+                key,
+                resp.content,
+                {
+                    "url": cache.normalize(url, params),
+                    "etag": resp.headers.get("ETag"),
+                    "last_modified": resp.headers.get("Last-Modified"),
+                    "content_type": resp.headers.get("Content-Type"),
+                    "encoding": resp.encoding,
+                },
+            )
+        self._emit(url, "miss", t0, info, len(resp.content))
+        resp.from_cache = False
+        return resp
+
+    def cached(self, url: str, params: Mapping | None, ttl: float, produce: Callable[[], bytes]) -> bytes:
+        """HTTP 가 아닌 원천(yfinance 등)의 결과 바이트를 같은 캐시에 보관합니다."""
+        t0 = time.perf_counter()
+        info = {"requests": 0, "retries": 0}
+        cache = self.cache
+        if cache is None or cache.mode == "off":
+            body = self._produce(url, params, produce)
+            self._emit(url, None, t0, {"requests": 1, "retries": 0}, len(body))
+            return body
+        key = cache.key(url, params)
+        entry = cache.load(key)
+        if entry is not None and entry.fresh(ttl):
+            self._count("cache_hits")
+            self._emit(url, "hit", t0, info, len(entry.body))
+            return entry.body
+        self._count("cache_misses")
+        body = self._produce(url, params, produce)
+        cache.store(key, body, {"url": cache.normalize(url, params)})
+        self._emit(url, "miss", t0, {"requests": 1, "retries": 0}, len(body))
+        return body
+
+    def invalidate(self, url: str, params: Mapping | None = None) -> None:
+        """오류 페이로드처럼 재사용하면 안 되는 응답을 캐시에서 지웁니다."""
+        if self.cache is not None:
+            self.cache.discard(self.cache.key(url, params))
+
+    def stats(self) -> Dict[str, float]:
+        """요청·재시도 카운터와 커넥션 풀의 신규/재사용 커넥션 수."""
+        with self._lock:
+            out = dict(self._counters)
+        opened = 0
+        # 같은 어댑터를 https·http 에 함께 걸어 두므로 어댑터마다 한 번만 센다
+        adapters = {id(a): a for a in self.session.adapters.values()}
+        for adapter in adapters.values():
+            manager = getattr(adapter, "poolmanager", None)
+            if manager is None:
+                continue
+            for key in list(manager.pools.keys()):
+                pool = manager.pools.get(key)
+                if pool is not None:
+                    opened += pool.num_connections
+        out["new_connections"] = opened
+        out["reused_connections"] = max(0, out["requests"] - opened)
+        return out
+
+    def close(self) -> None:
+        self.session.close()
+
+
+def _cached_response(entry: CacheEntry) -> requests.Response:
+    resp = requests.Response()
+    resp.status_code = 200
+    resp._content = entry.body
+    resp.url = entry.meta.get("url", "")
+    if entry.meta.get("content_type"):
+        resp.headers["Content-Type"] = entry.meta["content_type"]
+    resp.encoding = entry.meta.get("encoding")
+    resp.from_cache = True
+    return resp
@@ -0,0 +1,644 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+panel.py  –  원래 빈도 시리즈 저장소 & as-of 정렬
+─────────────────────────────────────────────
+✓ 저장 : 시리즈마다 원래 빈도(거래일·주·월) 관측치만 long 형식(date, series, value)
+✓ 정렬 : 요청한 구간·격자(기본 일 단위)에 as-of 조인 – 계단(ffill) 또는 선형 보간
+✓ 파생 : Spread5D 처럼 입력 시리즈의 관측일에서 계산한 뒤 같은 방식으로 정렬하는 컬럼
+✓ 갱신 : LivePanel – 저장소 지문(mtime·크기)이 바뀌면 새로 붙은 행만 읽어 이어 붙임
+✓ 호환 : native 저장소가 없으면 예전 일 빈도 all_data 를 같은 API 로 읽음 – 처음 한 번
+         컬럼 정리·ffill 을 마친 Parquet 사본(.all_data_prepared)을 만들어 두고 그것을 읽음
+"""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Mapping, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+import storage
+
+NATIVE = "native"      # 원래 빈도 long 저장소 파일 이름
+LEGACY = "all_data"    # 예전 일 빈도 통합 파일 이름
+PREPARED = ".all_data_prepared"  # 정리를 마친 all_data 사본 (원본보다 오래되면 다시 만듦)
+SERIES = "series"
+VALUE = "value"
+
+# 창 시작 전 마지막 관측치(월·분기 시리즈)와 파생 컬럼의 이동 창을 채우기 위해 더 읽는 구간
+LOOKBACK = pd.DateOffset(years=1)
+# 파생 컬럼(5일 평균)이 창 시작 전에 보는 구간 – 이 구간 앞에 관측치가 없는 시리즈는 직전 관측치를 더 읽는다
+WARMUP = pd.Timedelta(days=7)
+
+# 화면 컬럼 → (원래 빈도 시리즈, 정렬 방법). 목록에 없는 시리즈는 같은 이름·ffill 로 붙는다.
+COLUMNS: Dict[str, Tuple[str, str]] = {
+    "FX": ("FX", "ffill"),
+    "Gold": ("Gold", "ffill"),
+    "Gold_KRWg": ("Gold_KRWg", "ffill"),
+    "DXY": ("DXY", "ffill"),
+    "Rate": ("Rate", "ffill"),
+    "Bond10": ("Bond10", "ffill"),
+    "Rate_US": ("Rate_US", "ffill"),
+    "Bond10_US": ("Bond10_US", "ffill"),
+    "M2_D": ("M2", "linear"),
+    "M2_US_D": ("M2_US", "linear"),
+    "CPI_D": ("CPI", "ffill"),
+    "CoreCPI_D": ("CoreCPI", "ffill"),
+    "RealRate_D": ("RealRate", "ffill"),
+    "Unsold": ("Unsold", "ffill"),
+    "BuyIndex": ("BuyIndex", "ffill"),
+    "SP500": ("SP500", "ffill"),
+    "KODEX200": ("KODEX200", "ffill"),
+    "Bitcoin": ("Bitcoin", "ffill"),
+}
+# 파생 컬럼 → (입력 컬럼, 계산 함수). 함수는 입력 시리즈들의 첫 관측일부터 이어지는 일 달력
+# (예전 *_D 일 변환과 같은 격자)에서 계산하므로, 요청한 격자·구간과 무관하게 5일 평균입니다.
+DERIVED: Dict[str, Tuple[Tuple[str, ...], Callable[..., pd.Series]]] = {
+    "Spread5D": (("Bond10", "Rate"), lambda bond10, rate: (bond10 - rate).rolling(5).mean()),
+}
+# 예전 all_data 와 같은 컬럼 순서 (부동산 지수 등 나머지 시리즈는 Unsold 앞에 붙는다)
+ORDER = (
+    "FX", "Gold", "Gold_KRWg", "DXY",
+    "Rate", "Bond10", "Rate_US", "Bond10_US", "Spread5D",
+    "M2_D", "M2_US_D", "CPI_D", "CoreCPI_D", "RealRate_D",
+    "*",
+    "Unsold", "BuyIndex", "SP500", "KODEX200", "Bitcoin",
+)
+
+
+# ── 저장 형식 ─────────────────────────────────────
+
+def to_long(parts: Mapping[str, pd.Series | pd.DataFrame]) -> pd.DataFrame:
+    """시리즈(또는 프레임의 각 컬럼)를 결측 없는 long 프레임 하나로 합칩니다.
+
+    행은 시리즈별로 모여 날짜순으로 놓이므로, Parquet 행 그룹 통계로 다른 시리즈의
+    그룹을 건너뛸 수 있습니다.
+    """
+    names: List[np.ndarray] = []
+    dates: List[np.ndarray] = []
+    values: List[np.ndarray] = []
+    for name, obj in parts.items():
+        cols = obj.items() if isinstance(obj, pd.DataFrame) else [(name, obj)]
+        for col, ser in cols:
+            ser = pd.to_numeric(ser, errors="coerce").dropna().sort_index()
+            ser = ser[~ser.index.duplicated(keep="last")]
+            if ser.empty:
+                continue
+            names.append(np.full(len(ser), str(col), dtype=object))
+            dates.append(pd.DatetimeIndex(ser.index).as_unit("ns").to_numpy())
+            values.append(ser.to_numpy(dtype="float64"))
+    if not names:
+        return pd.DataFrame({SERIES: pd.Series(dtype=object), VALUE: pd.Series(dtype="float64")},
+                            index=pd.DatetimeIndex([], name=storage.INDEX_NAME))
+    return pd.DataFrame(
+        {SERIES: np.concatenate(names), VALUE: np.concatenate(values)},
+        index=pd.DatetimeIndex(np.concatenate(dates), name=storage.INDEX_NAME),
+    )
+
+
+def split_long(df: pd.DataFrame) -> Dict[str, pd.Series]:
+    """long 프레임을 ``{시리즈 이름: 시리즈}`` 로 나눕니다 (저장 순서 유지)."""
+    if df.empty:
+        return {}
+    out: Dict[str, pd.Series] = {}
+    for name, grp in df.groupby(SERIES, sort=False):
+        ser = grp[VALUE].astype("float64").rename(name).sort_index()
+        ser.index.name = None
+        out[str(name)] = ser
+    return out
+
+
+def series_of(df: pd.DataFrame, name: str) -> pd.Series:
+    """long 프레임에서 시리즈 하나."""
+    ser = df.loc[df[SERIES] == name, VALUE].astype("float64").sort_index()
+    ser.index.name = None
+    return ser.rename(name)
+
+
+def read_native(
+    path: Path,
+    *,
+    series: Iterable[str] | None = None,
+    start: str | pd.Timestamp | None = None,
+    end: str | pd.Timestamp | None = None,
+) -> Dict[str, pd.Series]:
+    """native 저장소에서 필요한 시리즈·구간만 읽습니다."""
+    isin = {SERIES: list(series)} if series is not None else None
+    return split_long(storage.read_frame(path, start=start, end=end, isin=isin))
+
+
+# ── as-of 정렬 ───────────────────────────────────
+
+def asof(ser: pd.Series, index: pd.DatetimeIndex) -> np.ndarray:
+    """``index`` 각 날짜의 직전(같은 날 포함) 관측치 – 첫 관측 이전은 NaN."""
+    out = np.full(len(index), np.nan)
+    if ser.empty:
+        return out
+    pos = ser.index.searchsorted(index, side="right") - 1
+    ok = pos >= 0
+    out[ok] = ser.to_numpy(dtype="float64")[pos[ok]]
+    return out
+
+
+def interpolate(ser: pd.Series, index: pd.DatetimeIndex) -> np.ndarray:
+    """관측치 사이는 시간 선형 보간, 마지막 관측 이후는 그 값을 유지, 첫 관측 이전은 NaN."""
+    if ser.empty:
+        return np.full(len(index), np.nan)
+    x = pd.DatetimeIndex(ser.index).as_unit("ns").asi8
+    vals = ser.to_numpy(dtype="float64")
+    return np.interp(index.as_unit("ns").asi8, x, vals, left=np.nan, right=vals[-1])
+
+
+ALIGNERS = {"ffill": asof, "linear": interpolate}
+# 저장소에 관측치가 없는 시리즈 – 정렬하면 전부 NaN
+EMPTY = pd.Series(dtype="float64", index=pd.DatetimeIndex([]))
+
+
+def resolve_columns(available: Iterable[str], columns: Sequence[str] | None = None) -> List[str]:
+    """요청한(없으면 전부) 화면 컬럼 중 ``available`` 시리즈로 만들 수 있는 것, ORDER 순.
+
+    ``columns`` 로 콕 집어 요청한 ``COLUMNS``·``DERIVED`` 컬럼은 시리즈가 비어 있어도
+    (예: 관측치가 하나도 없는 M2) 남깁니다 – ``align`` 이 전부 NaN 인 컬럼으로 채웁니다.
+    예전 all_data 도 빈 컬럼을 그대로 갖고 있으므로 두 저장소의 컬럼(과 점수)이 같아집니다.
+    """
+    available = list(available)
+    consumed = {series for series, _ in COLUMNS.values()}
+    extras = [s for s in available if s not in consumed and s not in COLUMNS]
+    have = set(available)
+
+    def buildable(col: str) -> bool:
+        if col in DERIVED:
+            return all(buildable(dep) for dep in DERIVED[col][0])
+        return COLUMNS.get(col, (col, ""))[0] in have
+
+    ordered: List[str] = []
+    for col in ORDER:
+        ordered.extend(extras if col == "*" else [col])
+    if columns is None:
+        return [c for c in ordered if buildable(c)]
+    wanted = list(dict.fromkeys(columns))
+    ordered = [c for c in ordered if c in wanted] + [c for c in wanted if c not in ordered]
+    return [c for c in ordered if c in COLUMNS or c in DERIVED or buildable(c)]
+
+
+def needed_series(columns: Iterable[str]) -> List[str]:
+    """화면 컬럼을 만드는 데 필요한 원래 빈도 시리즈 이름."""
+    out: List[str] = []
+    for col in columns:
+        if col in DERIVED:
+            out.extend(needed_series(DERIVED[col][0]))
+        else:
+            out.append(COLUMNS.get(col, (col, ""))[0])
+    return list(dict.fromkeys(out))
+
+
+def align(
+    native: Mapping[str, pd.Series],
+    index: pd.DatetimeIndex,
+    columns: Sequence[str] | None = None,
+) -> pd.DataFrame:
+    """원래 빈도 시리즈를 ``index`` 격자에 as-of 정렬한 와이드 프레임.
+
+    파생 컬럼은 입력 시리즈들의 일 달력(``calendar``)에서 먼저 계산하고, 그 결과를
+    as-of 로 정렬합니다 – 격자 빈도나 창 시작일이 달라도 같은 날의 값은 같습니다.
+    """
+    cols = resolve_columns(native.keys(), columns)
+
+    def aligned(col: str, at: pd.DatetimeIndex) -> np.ndarray:
+        if col in DERIVED:
+            deps, fn = DERIVED[col]
+            dates = calendar(native, deps, until=at[-1] if len(at) else None)
+            args = [pd.Series(aligned(d, dates), index=dates) for d in deps]
+            return asof(pd.Series(np.asarray(fn(*args), dtype="float64"), index=dates).dropna(), at)
+        series, method = COLUMNS.get(col, (col, "ffill"))
+        return ALIGNERS[method](native.get(series, EMPTY), at)
+
+    return pd.DataFrame({c: aligned(c, index) for c in cols}, index=index)
+
+
+def calendar(
+    native: Mapping[str, pd.Series],
+    columns: Iterable[str],
+    *,
+    until: pd.Timestamp | None = None,
+) -> pd.DatetimeIndex:
+    """``columns`` 를 만드는 원래 빈도 시리즈들의 첫 관측일부터 일 달력.
+
+    마지막 관측일과 ``until`` 중 늦은 날까지 이어지므로, 마지막 관측 뒤에도 이동 평균은
+    유지된 입력값으로 계속 굴러갑니다 – 읽은 구간의 끝(``end``)이 달라도 같은 값입니다.
+    """
+    spans = [native[s].index for s in needed_series(columns) if s in native and len(native[s])]
+    if not spans:
+        return pd.DatetimeIndex([])
+    last = max(idx[-1] for idx in spans)
+    return pd.date_range(min(idx[0] for idx in spans), max(last, until) if until is not None else last, freq="D")
+
+
+def last_valid(df: pd.DataFrame, columns: Iterable[str] | None = None) -> Dict[str, float]:
+    """컬럼마다 마지막 유효 값 ``{컬럼: 값}`` – 값이 하나도 없는 컬럼은 빠집니다.
+
+    ``notna`` 마스크를 뒤집어 ``argmax`` 한 번으로 모든 컬럼의 마지막 유효 위치를 찾습니다.
+    float64 단일 블록 프레임이면 배열도 복사하지 않아, 컬럼이 수백 개여도 배열 연산 한 번입니다.
+    """
+    values = df.to_numpy(dtype="float64")
+    if not values.size:
+        return {}
+    valid = ~np.isnan(values)
+    pos = len(values) - 1 - valid[::-1].argmax(axis=0)
+    last = values[pos, np.arange(values.shape[1])]
+    wanted = None if columns is None else set(columns)
+    return {
+        col: float(val)
+        for col, val, ok in zip(df.columns, last, valid.any(axis=0))
+        if ok and (wanted is None or col in wanted)
+    }
+
+
+# ── 조회 ──────────────────────────────────────────
+
+def has_native(data_dir: Path) -> bool:
+    return storage.exists(Path(data_dir) / NATIVE)
+
+
+def available(data_dir: Path) -> bool:
+    return has_native(data_dir) or storage.exists(Path(data_dir) / LEGACY)
+
+
+def bounds(data_dir: Path) -> Tuple[pd.Timestamp, pd.Timestamp]:
+    """저장된 관측치의 첫날·마지막 날 (인덱스만 읽음)."""
+    name = NATIVE if has_native(data_dir) else LEGACY
+    idx = storage.read_frame(Path(data_dir) / name, columns=[]).index
+    return idx.min(), idx.max()
+
+
+def normalize(df: pd.DataFrame) -> pd.DataFrame:
+    """예전 all_data 의 컬럼 이름을 화면 컬럼으로 맞추고, 없는 파생 컬럼을 만듭니다.
+
+    (원천 티커 이름 → SP500·KODEX200·CPI, Gold 원화 환산, M2·CPI 일 보간, 실질금리)
+    """
+    # Gold 원화 환산 – 저장소에 없을 때만 계산
+    a0_cols = df.columns
+    if "Gold_KRWg" not in a0_cols and {"Gold", "FX"}.issubset(a0_cols):
+        df["Gold_KRWg"] = df["Gold"] * df["FX"] / 31.1035
+
+    # KODEX 200 컬럼 정규화
+    for c in df.columns:
+        if c.lower().replace(" ", "").startswith("kodex200") or "069500" in c.lower():
+            df.rename(columns={c: "KODEX200"}, inplace=True)
+            break
+
+    # S&P 500 컬럼 정규화
+    for c in df.columns:
+        if c.lower() in {"sp500", "^gspc"} or "sp500" in c.lower():
+            df.rename(columns={c: "SP500"}, inplace=True)
+            break
+
+    # M2 일별 보간
+    after_cols = df.columns
+    if "M2_D" not in after_cols and "M2" in after_cols:
+        df["M2_D"] = df["M2"].resample("D").interpolate("linear")
+    if "M2_US_D" not in after_cols and "M2_US" in after_cols:
+        df["M2_US_D"] = df["M2_US"].resample("D").interpolate("linear")
+
+    # CPI 및 Core CPI 컬럼 정규화
+    for c in list(df.columns):
+        uc = c.upper()
+        if uc.startswith("CPIAUCSL"):
+            df.rename(
+                columns={c: "CPI" if not uc.endswith("_D") else "CPI_D"}, inplace=True
+            )
+        elif uc.startswith("CPILFESL"):
+            df.rename(
+                columns={c: "CoreCPI" if not uc.endswith("_D") else "CoreCPI_D"},
+                inplace=True,
+            )
+
+    # CPI 일별 보간
+    after_cols = df.columns
+    if "CPI_D" not in after_cols and "CPI" in after_cols:
+        df["CPI_D"] = df["CPI"].resample("D").ffill()
+    if "CoreCPI_D" not in after_cols and "CoreCPI" in after_cols:
+        df["CoreCPI_D"] = df["CoreCPI"].resample("D").ffill()
+
+    # Real Rate 계산 (정책금리 - CPI YoY)
+    if "RealRate_D" not in after_cols and {"Rate", "CPI_D"}.issubset(after_cols):
+        cpi_yoy = df["CPI_D"].resample("ME").last().pct_change(12) * 100
+        rr = (df["Rate"].resample("ME").last() - cpi_yoy).reindex(
+            df.index, method="ffill"
+        )
+        df["RealRate_D"] = rr
+
+    return df
+
+
+def prepare_legacy(data_dir: Path) -> Path:
+    """예전 all_data 를 한 번만 정리(ffill·컬럼 정규화)해 ``PREPARED`` 로 저장합니다.
+
+    사본이 원본보다 새것이면 그대로 쓰므로, 원본을 다시 받기 전까지는 앱을 새로
+    띄워도 CSV 전체 파싱·ffill·이름 정리를 반복하지 않습니다.
+    """
+    data_dir = Path(data_dir)
+    src = storage.resolve(data_dir / LEGACY)
+    if src is None:
+        raise FileNotFoundError(data_dir / LEGACY)
+    out = storage.resolve(data_dir / PREPARED)
+    if out is not None and out.stat().st_mtime_ns >= src.stat().st_mtime_ns:
+        return out
+    df = normalize(storage.read_frame(src).ffill())
+    return storage.write_frame(data_dir / PREPARED, df)[0]
+
+
+def load_panel(
+    data_dir: Path,
+    *,
+    columns: Sequence[str] | None = None,
+    start: str | pd.Timestamp | None = None,
+    end: str | pd.Timestamp | None = None,
+    freq: str = "D",
+) -> pd.DataFrame:
+    """``start``~``end`` 구간의 ``freq`` 격자 패널을 만듭니다.
+
+    native 저장소가 있으면 필요한 시리즈와 구간(+ ``LOOKBACK``)만 읽어 as-of 정렬하고,
+    없으면 정리해 둔 all_data 사본(``prepare_legacy``)에서 필요한 컬럼·구간만 읽습니다.
+    마지막 날짜는 저장된 관측치의 마지막 날을 넘지 않습니다.
+    """
+    data_dir = Path(data_dir)
+    lo = pd.Timestamp(start) if start is not None else None
+    hi = pd.Timestamp(end) if end is not None else None
+    if not has_native(data_dir):
+        try:
+            prepared = prepare_legacy(data_dir)
+        except FileNotFoundError:
+            raise
+        except OSError:  # 읽기 전용 폴더 등 – 사본 없이 원본을 매번 정리
+            df = normalize(storage.read_frame(data_dir / LEGACY).ffill()).loc[lo:hi]
+            return df if columns is None else df[[c for c in columns if c in df.columns]]
+        return storage.read_frame(prepared, columns=columns, start=lo, end=hi)
+
+    wanted = resolve_columns(_stored_series(data_dir), columns)
+    series = needed_series(wanted)
+    native = read_native(
+        data_dir / NATIVE,
+        series=series,
+        start=lo - LOOKBACK if lo is not None else None,
+        end=hi,
+    )
+    if lo is not None:
+        native = carry_in(data_dir / NATIVE, native, series, lo - WARMUP)
+    if not native:
+        return pd.DataFrame(columns=wanted, index=pd.DatetimeIndex([]), dtype="float64")
+    first = min(s.index.min() for s in native.values())
+    last = max(s.index.max() for s in native.values()) if hi is None else bounds(data_dir)[1]
+    lo = max(lo, first) if lo is not None else first
+    hi = min(hi, last) if hi is not None else last
+    return align(native, pd.date_range(lo.normalize(), hi, freq=freq), wanted)
+
+
+def carry_in(
+    path: Path,
+    native: Dict[str, pd.Series],
+    series: Iterable[str],
+    at: pd.Timestamp,
+) -> Dict[str, pd.Series]:
+    """``at`` 이전 관측치가 ``LOOKBACK`` 안에 없던 시리즈에 그 직전 관측치를 앞에 붙입니다.
+
+    정책금리처럼 값이 바뀔 때만 관측치가 남는 시리즈는 마지막 관측이 1년보다 오래될 수
+    있습니다. 그런 시리즈만 ``at`` 까지의 이력을 한 번 더 읽어 마지막 한 행을 가져옵니다.
+    """
+    stale = [s for s in series if s not in native or native[s].index[0] > at]
+    if not stale:
+        return native
+    out = dict(native)
+    for name, ser in read_native(path, series=stale, end=at).items():
+        head = ser.iloc[-1:]
+        out[name] = pd.concat([head, out[name].loc[out[name].index > head.index[0]]]) if name in out else head
+    return out
+
+
+def _stored_series(data_dir: Path) -> List[str]:
+    """native 저장소의 시리즈 이름 목록 (series 컬럼만 읽음)."""
+    df = storage.read_frame(Path(data_dir) / NATIVE, columns=[SERIES])
+    return list(pd.unique(df[SERIES].astype(str)))
+
+
+# ── 압축 패널 ─────────────────────────────────────
+
+# 값이 바뀌는 지점이 행 수의 1/STEP_RATIO 이하인 컬럼은 변화 지점만 저장한다.
+STEP_RATIO = 8
+# float32 로 줄여도 이 자릿수(소수점 아래)까지는 값이 같아야 한다.
+FLOAT32_DECIMALS = 4
+
+
+class StepColumn:
+    """계단 함수 컬럼 – 값이 바뀌는 행 위치(``starts``)와 그 값만 보관합니다."""
+
+    __slots__ = ("starts", "values", "length")
+
+    def __init__(self, starts: np.ndarray, values: np.ndarray, length: int) -> None:
+        self.starts = starts
+        self.values = values
+        self.length = length
+
+    @classmethod
+    def encode(cls, arr: np.ndarray) -> "StepColumn":
+        same = (arr[1:] == arr[:-1]) | (np.isnan(arr[1:]) & np.isnan(arr[:-1]))
+        starts = np.concatenate([[0], np.flatnonzero(~same) + 1]).astype("int32")
+        return cls(starts, arr[starts].copy(), len(arr))
+
+    def expand(self, lo: int = 0, hi: int | None = None) -> np.ndarray:
+        hi = self.length if hi is None else hi
+        run = np.searchsorted(self.starts, np.arange(lo, hi), side="right") - 1
+        return self.values[run]
+
+    @property
+    def nbytes(self) -> int:
+        return self.starts.nbytes + self.values.nbytes
+
+
+class CompactPanel:
+    """읽기 전용 압축 패널 – 여러 세션이 한 벌을 함께 쓰고, 필요한 구간만 펼칩니다.
+
+    계단 컬럼(금리·CPI_D 등)은 ``StepColumn`` 으로, 나머지는 ``FLOAT32_DECIMALS``
+    자리까지 값이 보존되면 float32, 아니면 float64 배열로 보관합니다.
+    ``frame()`` 은 항상 float64 DataFrame 을 돌려줍니다.
+    """
+
+    def __init__(self, index: pd.DatetimeIndex, columns: Dict[str, np.ndarray | StepColumn]) -> None:
+        self.index = index
+        self._columns = columns
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, *, float32: bool = True) -> "CompactPanel":
+        cols: Dict[str, np.ndarray | StepColumn] = {}
+        tol = 0.5 * 10 ** -FLOAT32_DECIMALS
+        for name, ser in df.items():
+            arr = ser.to_numpy(dtype="float64")
+            step = StepColumn.encode(arr) if len(arr) else None
+            if step is not None and len(step.starts) * STEP_RATIO <= len(arr):
+                cols[str(name)] = step
+                continue
+            if float32:
+                small = arr.astype("float32")
+                diff = np.abs(small.astype("float64") - arr)
+                if np.all(np.isnan(arr) | (diff < tol)):
+                    cols[str(name)] = small
+                    continue
+            cols[str(name)] = arr
+        return cls(df.index, cols)
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self._columns)
+
+    @property
+    def empty(self) -> bool:
+        return len(self.index) == 0 or not self._columns
+
+    @property
+    def nbytes(self) -> int:
+        total = self.index.nbytes
+        for col in self._columns.values():
+            total += col.nbytes
+        return total
+
+    def kinds(self) -> Dict[str, str]:
+        """컬럼별 보관 형식 (``step`` / ``float32`` / ``float64``)."""
+        return {
+            name: "step" if isinstance(col, StepColumn) else str(col.dtype)
+            for name, col in self._columns.items()
+        }
+
+    def frame(
+        self,
+        columns: Sequence[str] | None = None,
+        *,
+        start: str | pd.Timestamp | None = None,
+        end: str | pd.Timestamp | None = None,
+    ) -> pd.DataFrame:
+        """``start``~``end`` 구간의 요청 컬럼만 float64 로 펼친 DataFrame."""
+        lo = self.index.searchsorted(pd.Timestamp(start)) if start is not None else 0
+        hi = self.index.searchsorted(pd.Timestamp(end), side="right") if end is not None else len(self.index)
+        names = [c for c in (columns if columns is not None else self._columns) if c in self._columns]
+        data = {}
+        for name in names:
+            col = self._columns[name]
+            data[name] = col.expand(lo, hi) if isinstance(col, StepColumn) else col[lo:hi].astype("float64")
+        return pd.DataFrame(data, index=self.index[lo:hi], columns=names)
+
+
+# ── 실시간 갱신 ───────────────────────────────────
+
+# 갱신 때 다시 읽어 기존 패널과 맞춰 보는 구간 – 이 안의 정정은 그대로 반영되고,
+# 더 오래된 값이 바뀌었으면 전체를 다시 읽는다.
+REFRESH_OVERLAP = LOOKBACK
+
+
+def fingerprint(data_dir: Path) -> Tuple[str, int, int]:
+    """패널 원천 파일의 ``(이름, mtime_ns, 크기)``.
+
+    수집기(storage.BatchWriter)는 내용이 바뀐 출력만 다시 쓰므로, 지문이 바뀌면
+    내용도 바뀐 것으로 봅니다. stat 한 번이라 재실행마다 확인해도 됩니다.
+    """
+    data_dir = Path(data_dir)
+    fp = storage.resolve(data_dir / NATIVE) or storage.resolve(data_dir / LEGACY)
+    if fp is None:
+        return "", 0, 0
+    st = fp.stat()
+    return fp.name, st.st_mtime_ns, st.st_size
+
+
+def extend(
+    df: pd.DataFrame,
+    data_dir: Path,
+    *,
+    columns: Sequence[str] | None = None,
+) -> pd.DataFrame | None:
+    """``df`` 의 마지막 ``REFRESH_OVERLAP`` 구간부터 다시 읽어 새 날짜만 이어 붙입니다.
+
+    겹치는 구간의 값이나 컬럼이 달라졌으면(과거 정정·컬럼 추가) ``None`` 을 돌려주어
+    호출한 쪽이 전체를 다시 읽게 합니다. 값은 float32 보관 오차 안에서 비교합니다.
+    """
+    if df.empty:
+        return None
+    last = df.index[-1]
+    tail = load_panel(data_dir, columns=columns, start=last - REFRESH_OVERLAP)
+    if tail.empty or list(tail.columns) != list(df.columns):
+        return None
+    old = df.loc[tail.index[0]:]
+    new = tail.loc[:last]
+    if not old.index.equals(new.index):
+        return None
+    if not np.allclose(old.to_numpy(), new.to_numpy(), rtol=1e-6, atol=0, equal_nan=True):
+        return None
+    return pd.concat([df, tail.loc[tail.index > last]])
+
+
+class LivePanel:
+    """프로세스 전체가 함께 쓰는 패널 – 저장소가 바뀌면 새 행만 이어 붙입니다.
+
+    ``refresh()`` 는 ``fingerprint`` 로 변경을 확인하고, 바뀌었으면 ``extend`` 로 꼬리만
+    읽어 붙이며, 과거 값이 바뀌었으면 전체를 다시 읽습니다. ``compact`` 면 데이터를
+    ``CompactPanel`` 로 보관합니다. 갱신은 한 스레드만 하고, 읽는 쪽은 교체 전후의
+    온전한 패널 중 하나를 봅니다.
+    """
+
+    def __init__(
+        self,
+        data_dir: Path,
+        *,
+        columns: Sequence[str] | None = None,
+        start: str | pd.Timestamp | None = None,
+        compact: bool = False,
+    ) -> None:
+        self.data_dir = Path(data_dir)
+        self.columns = columns
+        self.start = start
+        self.compact = compact
+        self.version: Tuple[str, int, int] | None = None
+        self.stats = {"reloads": 0, "appends": 0}
+        self._data: pd.DataFrame | CompactPanel | None = None
+        self._lock = threading.Lock()
+        self.refresh()
+
+    def _full(self) -> pd.DataFrame:
+        data = self._data
+        return data.frame() if isinstance(data, CompactPanel) else data
+
+    def refresh(self) -> bool:
+        """저장소가 바뀌었으면 패널을 갱신하고 ``True`` 를 돌려줍니다."""
+        version = fingerprint(self.data_dir)
+        if version == self.version:
+            return False
+        with self._lock:
+            if version == self.version:
+                return False
+            df = extend(self._full(), self.data_dir, columns=self.columns) if self._data is not None else None
+            if df is None:
+                df = load_panel(self.data_dir, columns=self.columns, start=self.start)
+                self.stats["reloads"] += 1
+            else:
+                self.stats["appends"] += 1
+            self._data = CompactPanel.from_frame(df) if self.compact else df
+            self.version = version
+        return True
+
+    @property
+    def index(self) -> pd.DatetimeIndex:
+        return self._data.index
+
+    def frame(
+        self,
+        *,
+        start: str | pd.Timestamp | None = None,
+        end: str | pd.Timestamp | None = None,
+    ) -> pd.DataFrame:
+        """``start``~``end`` 구간 사본 (float64)."""
+        data = self._data
+        if isinstance(data, CompactPanel):
+            return data.frame(start=start, end=end)
+        lo = pd.Timestamp(start) if start is not None else None
+        hi = pd.Timestamp(end) if end is not None else None
+        return data.loc[lo:hi].copy()
@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+replay.py  –  원천 응답 기록·재생 (오프라인·결정적 실행용)
+─────────────────────────────────────────────
+✓ 기록   : 실제 요청의 최종 응답(상태·헤더·본문)을 픽스처 번들로 저장
+✓ 재생   : 번들을 requests 어댑터(프로세스 내) 또는 localhost HTTP 서버로 제공
+✓ 장애   : 지연(고정 + 지터)·실패율(5xx 또는 연결 끊김) 주입, 시드로 재현 가능
+✓ 키     : http_cache 와 같은 정규화 URL – API 키는 지운 채로 저장
+
+번들 구조::
+
+    fixtures/
+      index.json          정규화 URL -> {status, headers, encoding, body}
+      run.json            {"today": 기록한 날} – 재생 때 요청 구간의 끝·증분 기준일을 이 날로 고정
+      <sha256>.body       응답 본문
+
+재생 중 번들에 없는 요청은 404 로 답하면서 ``misses`` 에 남습니다 – fetch_data 는
+이것이 하나라도 있으면 저장된 이력으로 넘어가지 않고 실행을 멈춥니다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import hashlib
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Dict, Mapping, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+import storage
+from http_cache import ResponseCache
+
+INDEX = "index.json"
+RUN = "run.json"
+# 재생 중에 API 키 자리에 넣는 값 – 기록할 때 지운 키(***)와 같은 키로 정규화된다.
+PLACEHOLDER_KEY = "replay-key"
+# 재생 응답에 남길 헤더 – 나머지(Date, Set-Cookie …)는 결정성을 해치므로 버린다.
+KEEP_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+# 재생 서버가 번들에 없는 요청의 404 응답에 붙이는 헤더 (값은 정규화 키)
+MISS_HEADER = "X-Replay-Miss"
+
+
+class MissingFixture(LookupError):
+    """번들에 없는 요청."""
+
+
+class Fixtures:
+    """정규화 URL 로 찾는 응답 픽스처 번들.
+
+    ``normalize`` 는 ``(url, params) -> 키`` 함수로, 보통 ``ResponseCache.normalize``
+    를 넘겨 캐시와 같은 규칙(쿼리 정렬·비밀값 제거)을 씁니다. ``today`` 는 기록한 날
+    (``run.json``, 없으면 ``None``)입니다.
+    """
+
+    def __init__(self, root: Path, *, normalize: Callable[[str, Mapping | None], str] | None = None) -> None:
+        self.root = Path(root)
+        self.normalize = normalize or ResponseCache(self.root, secrets=[PLACEHOLDER_KEY]).normalize
+        self._lock = threading.Lock()
+        try:
+            self._index: Dict[str, Dict] = json.loads((self.root / INDEX).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self._index = {}
+        try:
+            self.today: dt.date | None = dt.date.fromisoformat(
+                json.loads((self.root / RUN).read_text(encoding="utf-8"))["today"]
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            self.today = None
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._index
+
+    def add(
+        self,
+        url: str,
+        params: Mapping | None,
+        body: bytes,
+        *,
+        status: int = 200,
+        headers: Mapping[str, str] | None = None,
+        encoding: str | None = None,
+    ) -> str:
+        """응답 하나를 기록하고 그 키를 반환합니다 (같은 키는 마지막 응답이 남음)."""
+        key = self.normalize(url, params)
+        digest = hashlib.sha256(body).hexdigest()
+        self.root.mkdir(parents=True, exist_ok=True)
+        body_fp = self.root / f"{digest}.body"
+        if not body_fp.exists():
+            storage.atomic_write(body_fp, lambda tmp: tmp.write_bytes(body))
+        kept = {h: headers[h] for h in KEEP_HEADERS if headers and headers.get(h)}
+        with self._lock:
+            self._index[key] = {"status": status, "headers": kept, "encoding": encoding, "body": body_fp.name}
+        return key
+
+    def get(self, url: str, params: Mapping | None = None) -> Tuple[Dict, bytes]:
+        """``(메타, 본문)`` – 없으면 ``MissingFixture``."""
+        key = self.normalize(url, params)
+        meta = self._index.get(key)
+        if meta is None:
+            raise MissingFixture(key)
+        return meta, (self.root / meta["body"]).read_bytes()
+
+    def save(self) -> Path:
+        """색인(과 기록한 날 ``today``)을 원자적으로 씁니다."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            text = json.dumps(self._index, indent=1, sort_keys=True, ensure_ascii=False)
+        if self.today is not None:
+            _write_text(self.root / RUN, json.dumps({"today": self.today.isoformat()}))
+        return _write_text(self.root / INDEX, text)
+
+
+def _write_text(fp: Path, text: str) -> Path:
+    storage.atomic_write(fp, lambda tmp: tmp.write_text(text, encoding="utf-8"))
+    return fp
+
+
+def run_date(source: str | Path) -> dt.date | None:
+    """번들(폴더) 또는 ``serve`` 로 띄운 재생 서버(URL)의 기록한 날 – 없으면 ``None``."""
+    source = str(source)
+    if source.startswith(("http://", "https://")):
+        resp = requests.get(f"{source.rstrip('/')}/{RUN}", timeout=10)
+        if resp.status_code != 200:
+            return None
+        return dt.date.fromisoformat(resp.json()["today"])
+    return Fixtures(Path(source)).today
+
+
+class Chaos:
+    """재생 응답에 지연과 실패를 주입합니다.
+
+    ``latency`` 초에 ``[0, jitter)`` 초를 더해 기다리고, ``fail_rate`` 확률로 실패합니다.
+    ``fail_status`` 가 ``None`` 이면 연결 오류, 아니면 그 상태 코드로 실패합니다.
+    """
+
+    def __init__(
+        self,
+        *,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        fail_rate: float = 0.0,
+        fail_status: int | None = 503,
+        seed: int | None = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if not 0.0 <= fail_rate <= 1.0:
+            raise ValueError(f"fail_rate must be within [0, 1]: {fail_rate}")
+        self.latency = latency
+        self.jitter = jitter
+        self.fail_rate = fail_rate
+        self.fail_status = fail_status
+        self._rng = random.Random(seed)
+        self._sleep = sleep
+        self._lock = threading.Lock()
+
+    def roll(self) -> bool:
+        """지연을 적용하고, 이번 요청을 실패시킬지 여부를 반환합니다."""
+        with self._lock:
+            delay = self.latency + self._rng.uniform(0, self.jitter) if self.jitter else self.latency
+            fail = self.fail_rate > 0 and self._rng.random() < self.fail_rate
+        if delay > 0:
+            self._sleep(delay)
+        return fail
+
+
+def _response(request: requests.PreparedRequest, status: int, body: bytes, meta: Mapping | None = None) -> requests.Response:
+    resp = requests.Response()
+    resp.status_code = status
+    resp._content = body
+    resp.headers = CaseInsensitiveDict((meta or {}).get("headers") or {})
+    resp.encoding = (meta or {}).get("encoding")
+    resp.url = request.url
+    resp.request = request
+    resp.reason = "Replayed" if status < 400 else "Replay Error"
+    return resp
+
+
+class RecordAdapter(HTTPAdapter):
+    """실제로 요청하고, 최종 응답을 ``fixtures`` 에 기록하는 어댑터."""
+
+    def __init__(self, fixtures: Fixtures, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.fixtures = fixtures
+
+    def send(self, request, **kwargs):
+        resp = super().send(request, **kwargs)
+        self.fixtures.add(
+            request.url, None, resp.content,
+            status=resp.status_code, headers=resp.headers, encoding=resp.encoding,
+        )
+        return resp
+
+
+class ReplayAdapter(BaseAdapter):
+    """네트워크 없이 ``fixtures`` 에서 응답을 돌려주는 어댑터 (없는 요청은 404 + ``misses``)."""
+
+    def __init__(self, fixtures: Fixtures, chaos: Chaos | None = None) -> None:
+        super().__init__()
+        self.fixtures = fixtures
+        self.chaos = chaos or Chaos()
+        self.misses: list[str] = []
+
+    def send(self, request, **kwargs):
+        if self.chaos.roll():
+            if self.chaos.fail_status is None:
+                raise requests.ConnectionError("injected connection failure", request=request)
+            return _response(request, self.chaos.fail_status, b"injected failure")
+        try:
+            meta, body = self.fixtures.get(request.url)
+        except MissingFixture as exc:
+            self.misses.append(str(exc))
+            return _response(request, 404, f"no fixture for {exc}".encode("utf-8"))
+        return _response(request, meta["status"], body, meta)
+
+    def close(self) -> None:
+        pass
+
+
+class ForwardAdapter(HTTPAdapter):
+    """``https://host/path?q`` 요청을 ``{base}/https/host/path?q`` 로 돌려 보내는 어댑터.
+
+    ``serve`` 로 띄운 localhost 재생 서버를 실제 소켓·커넥션 풀을 거쳐 쓸 때 씁니다.
+    서버가 번들에 없다고 답한 요청은 ``misses`` 에 남깁니다.
+    """
+
+    def __init__(self, base: str, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.base = base.rstrip("/")
+        self.misses: list[str] = []
+
+    def send(self, request, **kwargs):
+        parts = urlsplit(request.url)
+        request.url = f"{self.base}/{parts.scheme}/{parts.netloc}{parts.path}?{parts.query}"
+        resp = super().send(request, **kwargs)
+        if MISS_HEADER in resp.headers:
+            self.misses.append(resp.headers[MISS_HEADER])
+        return resp
+
+
+def make_handler(fixtures: Fixtures, chaos: Chaos) -> type:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:  # noqa: N802 - http.server 규약
+            if self.path == f"/{RUN}":  # 기록한 날 – 장애 주입 대상이 아님
+                if fixtures.today is None:
+                    self._reply(404, b"no run date", {})
+                else:
+                    self._reply(200, json.dumps({"today": fixtures.today.isoformat()}).encode(), {})
+                return
+            if chaos.roll():
+                if chaos.fail_status is None:
+                    self.close_connection = True
+                    return
+                self._reply(chaos.fail_status, b"injected failure", {})
+                return
+            scheme, _, rest = self.path.lstrip("/").partition("/")
+            try:
+                meta, body = fixtures.get(f"{scheme}://{rest}")
+            except MissingFixture as exc:
+                self._reply(404, f"no fixture for {exc}".encode("utf-8"), {MISS_HEADER: str(exc)})
+                return
+            self._reply(meta["status"], body, meta.get("headers") or {})
+
+        def _reply(self, status: int, body: bytes, headers: Mapping[str, str]) -> None:
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, fmt, *args) -> None:
+            pass
+
+    return Handler
+
+
+def serve(fixtures: Fixtures, *, host: str = "127.0.0.1", port: int = 0, chaos: Chaos | None = None) -> ThreadingHTTPServer:
+    """재생 서버를 백그라운드 스레드로 띄웁니다 (``server.server_address`` 로 포트 확인)."""
+    server = ThreadingHTTPServer((host, port), make_handler(fixtures, chaos or Chaos()))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="replay-server", daemon=True).start()
+    return server
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="기록한 원천 응답을 localhost 에서 재생")
+    parser.add_argument("fixtures", type=Path, help="fetch_data.py --record 로 만든 폴더")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="응답마다 더할 지연(초)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="지연에 더할 무작위 지터 상한(초)")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="실패 주입 확률 (0~1)")
+    parser.add_argument("--fail-status", type=int, default=503, help="실패 상태 코드 (0 이면 연결 끊김)")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args(argv)
+    chaos = Chaos(
+        latency=args.latency, jitter=args.jitter, fail_rate=args.fail_rate,
+        fail_status=args.fail_status or None, seed=args.seed,
+    )
+    server = serve(Fixtures(args.fixtures), port=args.port, chaos=chaos)
+    print(f"▶ replaying {args.fixtures} on http://{server.server_address[0]}:{server.server_address[1]}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
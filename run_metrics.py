@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+run_metrics.py  –  수집 실행 계측 & 실행 로그
+─────────────────────────────────────────────
+✓ 노드별 : 소요 시간, HTTP 지연, 다운로드 바이트, 반환 행 수
+✓ HTTP   : 요청·재시도·캐시 적중/미적중 (http_client 의 on_request 콜백)
+✓ 폴백   : 저장 이력·다음 후보로 넘어간 횟수
+✓ 출력   : NDJSON 실행 로그(노드당 한 줄 + 실행 요약 한 줄) + 요약 표
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List
+
+# 노드 레코드의 누적 카운터 기본값
+COUNTERS = (
+    "http_s",
+    "requests",
+    "bytes",
+    "retries",
+    "cache_hits",
+    "cache_misses",
+    "cache_revalidated",
+    "fallbacks",
+)
+
+
+class RunMetrics:
+    """한 번의 실행 동안 노드별 지표를 모읍니다.
+
+    ``track()`` 안에서 일어난 HTTP 이벤트와 폴백은 같은 스레드의 현재 노드에
+    귀속됩니다. 노드 밖의 이벤트는 ``"-"`` 레코드에 모입니다.
+    """
+
+    def __init__(self) -> None:
+        self.run_id = uuid.uuid4().hex[:12]
+        self.started = time.time()
+        self._t0 = time.perf_counter()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.records: Dict[str, Dict] = {}
+
+    # ── 기록 ──────────────────────────────────────
+    def _record(self, name: str) -> Dict:
+        rec = self.records.get(name)
+        if rec is None:
+            rec = {"node": name, "kind": "", "status": "pending", "wall_s": 0.0, "rows": None}
+            rec.update({k: 0 for k in COUNTERS})
+            self.records[name] = rec
+        return rec
+
+    @property
+    def current(self) -> str:
+        return getattr(self._local, "node", None) or "-"
+
+    @contextmanager
+    def track(self, name: str, *, kind: str = "") -> Iterator[Dict]:
+        """``name`` 노드의 실행 시간을 재고, 이 스레드의 이벤트를 그 노드에 귀속합니다."""
+        prev = getattr(self._local, "node", None)
+        self._local.node = name
+        with self._lock:
+            rec = self._record(name)
+            rec["kind"] = kind or rec["kind"]
+        t0 = time.perf_counter()
+        try:
+            yield rec
+        except BaseException as exc:
+            with self._lock:
+                rec["status"] = "error"
+                rec["error"] = f"{type(exc).__name__}: {exc}"
+            raise
+        else:
+            with self._lock:
+                if rec["status"] == "pending":
+                    rec["status"] = "ok"
+        finally:
+            with self._lock:
+                rec["wall_s"] += time.perf_counter() - t0
+            self._local.node = prev
+
+    @contextmanager
+    def bind(self, name: str | None) -> Iterator[None]:
+        """다른 스레드에서 실행되는 작업의 이벤트를 ``name`` 노드에 귀속합니다 (시간은 재지 않음)."""
+        prev = getattr(self._local, "node", None)
+        self._local.node = None if name == "-" else name
+        try:
+            yield
+        finally:
+            self._local.node = prev
+
+    def add(self, key: str, amount: float = 1, *, node: str | None = None) -> None:
+        with self._lock:
+            self._record(node or self.current)[key] += amount
+
+    def set(self, node: str, **fields) -> None:
+        with self._lock:
+            self._record(node).update(fields)
+
+    def fallback(self, reason: str = "") -> None:
+        """저장 이력이나 다음 후보로 넘어간 경우를 현재 노드에 기록합니다."""
+        with self._lock:
+            rec = self._record(self.current)
+            rec["fallbacks"] += 1
+            if reason:
+                rec.setdefault("fallback_reasons", []).append(reason)
+
+    def on_http(self, event: Dict) -> None:
+        """http_client.HttpClient 의 ``on_request`` 콜백."""
+        cache = event.get("cache")
+        with self._lock:
+            rec = self._record(self.current)
+            rec["http_s"] += event.get("latency", 0.0)
+            rec["bytes"] += event.get("bytes", 0)
+            rec["requests"] += event.get("requests", 0)
+            rec["retries"] += event.get("retries", 0)
+            if cache == "hit":
+                rec["cache_hits"] += 1
+            elif cache == "miss":
+                rec["cache_misses"] += 1
+            elif cache == "revalidated":
+                rec["cache_revalidated"] += 1
+
+    # ── 출력 ──────────────────────────────────────
+    def rows(self) -> List[Dict]:
+        with self._lock:
+            return [dict(r, run_id=self.run_id) for r in self.records.values()]
+
+    def summary(self) -> Dict:
+        recs = self.rows()
+        out = {
+            "run_id": self.run_id,
+            "node": "_run",
+            "started": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(self.started)),
+            "wall_s": time.perf_counter() - self._t0,
+            "errors": sum(r["status"] == "error" for r in recs),
+        }
+        for k in COUNTERS:
+            out[k] = sum(r[k] for r in recs)
+        return out
+
+    def write(self, path: Path) -> None:
+        """NDJSON 실행 로그에 이번 실행의 레코드를 덧붙입니다."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("a", encoding="utf-8") as fh:
+            for rec in self.rows() + [self.summary()]:
+                fh.write(json.dumps(rec, ensure_ascii=False, default=str) + "\n")
+
+    def table(self, *, limit: int | None = None) -> str:
+        """소요 시간이 긴 순서의 요약 표."""
+        recs = sorted(self.rows(), key=lambda r: r["wall_s"], reverse=True)[:limit]
+        head = f"{'node':13s} {'status':7s} {'wall':>7s} {'http':>7s} {'req':>4s} {'retry':>5s} {'KB':>8s} {'hit/miss':>8s} {'fb':>3s} {'rows':>7s}"
+        lines = [head, "─" * len(head)]
+        for r in recs:
+            rows = "" if r["rows"] is None else f"{r['rows']:,d}"
+            lines.append(
+                f"{r['node']:13s} {r['status']:7s} {r['wall_s']:6.2f}s {r['http_s']:6.2f}s "
+                f"{r['requests']:4d} {r['retries']:5d} {r['bytes'] / 1024:8.1f} "
+                f"{str(r['cache_hits']) + '/' + str(r['cache_misses']):>8s} {r['fallbacks']:3d} {rows:>7s}"
+            )
+        return "\n".join(lines)
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+signals.py  –  Macro × Trend 시그널 엔진 (벡터화)
+─────────────────────────────────────────────
+✓ Trend  : 자산 전체를 (일자 × 자산) 2D 배열 하나로 – MA 교차 + 21일 모멘텀을 한 번에
+✓ Macro  : M2 YoY·금리 스프레드 구간 분류를 np.select 로 (행마다 파이썬 호출 없음)
+✓ 이동평균 : 누적합 차분이라 창 길이와 무관하게 O(행 × 열)
+✓ 저장소 : SignalStore – 전체 이력으로 한 번 계산하고, 구간은 복사 없는 위치 슬라이스로
+
+점수 규칙은 대시보드에서 쓰던 그대로입니다::
+
+    trend  = clip(sign(MA20 − MA50) + sign(21일 수익률), −2, 2)
+    M2     = YoY > 9 → 2, ≥ 6 → 1, ≥ 3 → −1, 그 밖 → −2 (결측 −1)
+    spread = > 0.5 → 1, < 0 → −1, 그 밖 → 0 (결측 0)
+    macro  = clip(M2 + spread, −3, 3),  final = clip(trend + macro, −3, 3)
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Mapping, Sequence
+
+import numpy as np
+import pandas as pd
+
+# 추세 점수를 내는 자산 – 시그널 이름 -> 패널 컬럼
+TREND_ASSETS = {
+    "Gold": "Gold_KRWg",
+    "KODEX": "KODEX200",
+    "SP500": "SP500",
+    "BTC": "Bitcoin",
+    "USDKRW": "FX",
+}
+SHORT, LONG, MOMENTUM = 20, 50, 21
+# 구간 경계 – 위에서부터 차례로 비교한다
+M2_CUTS = (9.0, 6.0, 3.0)
+SPREAD_CUTS = (0.5, 0.0)
+REALTY_CUTS = (0.03, 0.0, -0.03)
+REALTY_LAG = 3
+# 발표 지연 – 월 관측치(매월 1일 기준)를 실제로 알 수 있게 되는 시점까지 (백테스트용, 보수적으로)
+# M2 는 다음다음 달 중순, 10년물·정책금리 월 값은 다음 달 중순에 나온다.
+RELEASE_LAG = {"m2": pd.Timedelta(days=75), "spread": pd.Timedelta(days=45)}
+# 두 이동평균이 이만큼(상대) 가까우면 교차 없음(0)으로 본다 – 누적합 반올림 오차 흡수
+CROSS_RTOL = 1e-9
+
+
+def rolling_mean(a: np.ndarray, window: int) -> np.ndarray:
+    """열마다 ``window`` 행 이동평균 – 창 안에 NaN 이 있으면 NaN (pandas ``rolling`` 과 같음).
+
+    누적합의 차분으로 계산하므로 창 길이와 무관하게 O(행 × 열) 입니다.
+    """
+    a = np.asarray(a, dtype="float64")
+    out = np.full(a.shape, np.nan)
+    if window < 1 or len(a) < window:
+        return out
+    valid = ~np.isnan(a)
+    total = np.zeros((len(a) + 1,) + a.shape[1:])
+    np.cumsum(np.where(valid, a, 0.0), axis=0, out=total[1:])
+    out[window - 1:] = (total[window:] - total[:-window]) / window
+    if not valid.all():
+        count = np.zeros(total.shape, dtype=np.int64)
+        np.cumsum(valid, axis=0, out=count[1:])
+        out[window - 1:][(count[window:] - count[:-window]) < window] = np.nan
+    return out
+
+
+def change(a: np.ndarray, periods: int) -> np.ndarray:
+    """``periods`` 행 전 대비 변화율 (``pct_change`` 와 같이 앞부분은 NaN)."""
+    a = np.asarray(a, dtype="float64")
+    out = np.full(a.shape, np.nan)
+    if 0 < periods < len(a):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            out[periods:] = a[periods:] / a[:-periods] - 1.0
+    return out
+
+
+def trend(
+    prices: np.ndarray,
+    short: int = SHORT,
+    long: int = LONG,
+    momentum: int = MOMENTUM,
+) -> np.ndarray:
+    """(일자 × 자산) 가격 배열의 추세 점수 (−2~2, 계산할 수 없는 칸은 NaN)."""
+    prices = np.asarray(prices, dtype="float64")
+    ma_s, ma_l = rolling_mean(prices, short), rolling_mean(prices, long)
+    gap = ma_s - ma_l
+    cross = np.sign(np.where(np.abs(gap) <= CROSS_RTOL * np.abs(ma_l), 0.0, gap))
+    return np.clip(cross + np.sign(change(prices, momentum)), -2, 2)
+
+
+def classify(x: np.ndarray, cuts: Sequence[float], scores: Sequence[float], *, strict: Sequence[bool], default: float) -> np.ndarray:
+    """``x`` 를 구간 점수로 – ``cuts[i]`` 를 넘으면(``strict`` 가 아니면 같아도) ``scores[i]``.
+
+    앞 조건부터 먼저 맞는 점수를 쓰고, 어느 것도 아니면(NaN 포함) ``default`` 입니다.
+    """
+    x = np.asarray(x, dtype="float64")
+    conds = [x > c if s else x >= c for c, s in zip(cuts, strict)]
+    return np.select(conds, scores, default)
+
+
+def m2_score(yoy: np.ndarray, cuts: Sequence[float] = M2_CUTS) -> np.ndarray:
+    """M2 YoY(%) 점수 – 결측은 −1."""
+    yoy = np.asarray(yoy, dtype="float64")
+    out = classify(yoy, cuts, (2, 1, -1), strict=(True, False, False), default=-2)
+    return np.where(np.isnan(yoy), -1.0, out)
+
+
+def spread_score(spread: np.ndarray, cuts: Sequence[float] = SPREAD_CUTS) -> np.ndarray:
+    """장단기 금리차 점수 – 위쪽 경계 초과 1, 아래쪽 경계 미만 −1, 그 밖(결측 포함) 0."""
+    spread = np.asarray(spread, dtype="float64")
+    return np.select([spread > cuts[0], spread < cuts[1]], [1, -1], 0)
+
+
+def realty_score(rtms: np.ndarray, lag: int = REALTY_LAG, cuts: Sequence[float] = REALTY_CUTS) -> np.ndarray:
+    """부동산 추세 점수 – ``lag`` 행 변화율 구간 (결측은 가장 낮은 −2)."""
+    return classify(change(rtms, lag), cuts, (2, 1, -1), strict=(True, True, True), default=-2)
+
+
+def macro_inputs(df: pd.DataFrame, *, release_lag: Mapping[str, pd.Timedelta] | None = None) -> Dict[str, np.ndarray]:
+    """구간 경계와 무관한 Macro 재료 – 경계를 바꿔 가며 여러 번 점수 매길 때 한 번만 만듭니다.
+
+    ``m2_yoy`` 는 월말 YoY(%) 를 다음 월말까지 일별로 채운 값, ``m2_seen`` 은 첫 월말을
+    지났는지(그 전은 점수 0), ``spread`` 는 5일 평균 장단기 금리차입니다. 없는 재료는 빠집니다.
+
+    대시보드 규칙의 월말 M2 는 선형 보간 값이라 다음 달 관측치가 섞여 있고, 월 금리도 그달
+    1일부터 보입니다. ``release_lag``(예: ``RELEASE_LAG``)를 주면 M2 는 보간 전 월 관측치로
+    YoY 를 내고, 두 재료 모두 그만큼 늦게 알게 된 것으로 밀어 백테스트의 미래 참조를 없앱니다.
+    """
+    parts: Dict[str, np.ndarray] = {}
+    if "M2_D" in df and release_lag is not None:
+        m2 = df["M2_D"]
+        yoy = m2[m2.index.is_month_start].resample("MS").first().pct_change(12) * 100
+        known = yoy.index + release_lag["m2"]
+        parts["m2_yoy"] = _known(yoy, known, df.index)
+        parts["m2_seen"] = df.index >= known[0] if len(known) else np.zeros(len(df), dtype=bool)
+    elif "M2_D" in df:
+        month = df["M2_D"].resample("ME").last()
+        yoy = month.pct_change(12) * 100
+        parts["m2_yoy"] = yoy.reindex(df.index, method="ffill").to_numpy(dtype="float64")
+        parts["m2_seen"] = df.index >= month.index[0] if len(month) else np.zeros(len(df), dtype=bool)
+    if "Spread5D" in df:
+        parts["spread"] = df["Spread5D"].to_numpy(dtype="float64")
+    elif {"Rate", "Bond10"}.issubset(df.columns):
+        parts["spread"] = rolling_mean((df["Bond10"] - df["Rate"]).to_numpy(dtype="float64"), 5)
+    if "spread" in parts and release_lag is not None:
+        parts["spread"] = _known(parts["spread"], df.index + release_lag["spread"], df.index)
+    return parts
+
+
+def _known(values, known: pd.DatetimeIndex, index: pd.DatetimeIndex) -> np.ndarray:
+    """``known`` 시점에 알게 된 ``values`` 를 ``index`` 의 각 날짜에 직전 값으로 채웁니다."""
+    ser = pd.Series(np.asarray(values, dtype="float64"), index=known)
+    return ser.reindex(index, method="ffill").to_numpy(dtype="float64")
+
+
+def macro(
+    parts: Mapping[str, np.ndarray],
+    size: int,
+    m2_cuts: Sequence[float] = M2_CUTS,
+    spread_cuts: Sequence[float] = SPREAD_CUTS,
+) -> np.ndarray:
+    """``macro_inputs`` 재료로 일별 Macro 점수 ``clip(M2 + spread, −3, 3)``."""
+    out = np.zeros(size)
+    if "m2_yoy" in parts:
+        out += np.where(parts["m2_seen"], m2_score(parts["m2_yoy"], m2_cuts), 0.0)
+    if "spread" in parts:
+        out += spread_score(parts["spread"], spread_cuts)
+    return np.clip(out, -3, 3)
+
+
+def score(
+    df: pd.DataFrame,
+    *,
+    short: int = SHORT,
+    long: int = LONG,
+    momentum: int = MOMENTUM,
+    m2_cuts: Sequence[float] = M2_CUTS,
+    spread_cuts: Sequence[float] = SPREAD_CUTS,
+    assets: Mapping[str, str] = TREND_ASSETS,
+    release_lag: Mapping[str, pd.Timedelta] | None = None,
+) -> pd.DataFrame:
+    """패널 전체의 점수표 – 자산별 추세(+ ``Realty``)와 ``Macro`` 컬럼.
+
+    있는 자산 컬럼만 모아 (일자 × 자산) 배열 하나로 한 번에 계산합니다. ``release_lag`` 는
+    ``macro_inputs`` 로 넘깁니다 (백테스트용 발표 지연).
+    """
+    names = [name for name, col in assets.items() if col in df]
+    prices = df[[assets[name] for name in names]].to_numpy(dtype="float64")
+    out = pd.DataFrame(trend(prices, short, long, momentum), index=df.index, columns=names)
+    if "RTMS" in df:
+        out["Realty"] = realty_score(df["RTMS"].to_numpy(dtype="float64"))
+    out["Macro"] = macro(macro_inputs(df, release_lag=release_lag), len(df), m2_cuts, spread_cuts)
+    return out
+
+
+def final(scores: pd.DataFrame) -> pd.DataFrame:
+    """자산별 최종 점수 ``clip(trend + macro, −3, 3)``."""
+    assets = scores.drop(columns="Macro")
+    return assets.add(scores["Macro"], axis=0).clip(-3, 3)
+
+
+class SignalStore:
+    """전체 이력 점수표 – 데이터 버전마다 한 번 만들고, 구간은 위치 슬라이스로 복사 없이 꺼냅니다.
+
+    ``scores`` 는 ``score()`` 결과(자산별 추세·``Realty``·``Macro``), ``final`` 은 자산별
+    최종 점수입니다. 여러 세션이 같은 객체를 나눠 쓰므로 읽기만 합니다.
+    """
+
+    def __init__(self, df: pd.DataFrame, **params) -> None:
+        scores = score(df, **params)
+        self.index = scores.index
+        self.columns = list(scores.columns)
+        self.assets = [c for c in self.columns if c != "Macro"]
+        self._scores = scores.to_numpy(dtype="float64")
+        self._final = final(scores).to_numpy(dtype="float64")
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def _bounds(self, start, end) -> slice:
+        lo = 0 if start is None else self.index.searchsorted(pd.Timestamp(start), side="left")
+        hi = len(self.index) if end is None else self.index.searchsorted(pd.Timestamp(end), side="right")
+        return slice(lo, hi)
+
+    def window(self, start=None, end=None, *, final_only: bool = False) -> pd.DataFrame:
+        """``start``~``end`` 구간 점수표 – 내부 배열의 뷰라 복사하지 않습니다 (고치지 말 것)."""
+        rows = self._bounds(start, end)
+        data, columns = (self._final, self.assets) if final_only else (self._scores, self.columns)
+        return pd.DataFrame(data[rows], index=self.index[rows], columns=columns, copy=False)
+
+    def latest(self, at=None) -> dict:
+        """``at`` 시점(없으면 마지막 날)의 자산별 최종 점수 – 계산할 수 없는 자산은 뺍니다."""
+        pos = self._bounds(None, at).stop - 1
+        if pos < 0:
+            return {}
+        row = self._final[pos]
+        return {name: int(v) for name, v in zip(self.assets, row) if not np.isnan(v)}
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+storage.py  –  시리즈 저장소 (Parquet 우선, CSV 호환)
+─────────────────────────────────────────────
+✓ Parquet : float64 컬럼 + 네이티브 datetime 인덱스("date"), 행 그룹 단위 날짜 필터
+✓ CSV     : pyarrow 가 없거나 사람이 볼 파일이 필요할 때 (CSV_EXPORT)
+✓ 읽기    : 같은 이름의 .parquet 이 있으면 우선, 없으면 .csv
+✓ 쓰기    : 임시 파일 + 원자적 rename, BatchWriter 는 내용이 같은 출력을 건너뛰고
+            manifest.json(해시·행 수·마지막 날짜)과 선택적 묶음(zip)을 남김
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+import zipfile
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Mapping, Sequence
+
+import pandas as pd
+
+try:  # pragma: no cover - 선택 의존성
+    import pyarrow  # noqa: F401
+
+    HAS_PARQUET = True
+except ImportError:  # pragma: no cover - 선택 의존성
+    HAS_PARQUET = False
+
+FORMATS = ("parquet", "csv")
+DATA_FORMAT = os.getenv("DATA_FORMAT", "parquet" if HAS_PARQUET else "csv")
+# 기본 형식과 별도로 CSV 사본을 남길 이름 (콤마구분, "*" 는 전부)
+CSV_EXPORT = {n.strip() for n in os.getenv("CSV_EXPORT", "all_data").split(",") if n.strip()}
+ROW_GROUP_ROWS = 4096
+INDEX_NAME = "date"
+CSV_DATE_FORMAT = "%Y-%m-%d"
+MANIFEST = "manifest.json"
+
+
+def stem(path: Path) -> Path:
+    """확장자를 뗀 저장소 경로 (``data/all_data.csv`` → ``data/all_data``)."""
+    path = Path(path)
+    return path.with_suffix("") if path.suffix in {".csv", ".parquet"} else path
+
+
+def resolve(path: Path) -> Path | None:
+    """실제로 읽을 파일 – Parquet 을 우선하고, 없으면 CSV, 둘 다 없으면 None."""
+    base = stem(path)
+    candidates = [base.with_suffix(".parquet"), base.with_suffix(".csv")]
+    if not HAS_PARQUET:
+        candidates = candidates[1:]
+    return next((fp for fp in candidates if fp.exists()), None)
+
+
+def exists(path: Path) -> bool:
+    return resolve(path) is not None
+
+
+def wants_csv(name: str) -> bool:
+    """기본 형식과 별도로 CSV 사본을 남길 이름인지."""
+    return "*" in CSV_EXPORT or name in CSV_EXPORT
+
+
+def _as_frame(obj: pd.Series | pd.DataFrame) -> pd.DataFrame:
+    df = obj.to_frame() if isinstance(obj, pd.Series) else obj.copy()
+    df = df.rename_axis(INDEX_NAME)
+    df.columns = [str(c) for c in df.columns]
+    numeric = df.select_dtypes("number").columns
+    df[numeric] = df[numeric].astype("float64")
+    return df
+
+
+def content_hash(obj: pd.Series | pd.DataFrame) -> str:
+    """값·인덱스(프레임은 컬럼 이름 포함) 기준 내용 해시 – 이름·빈도 속성은 무시."""
+    h = hashlib.sha1()
+    if isinstance(obj, pd.DataFrame):
+        h.update(",".join(map(str, obj.columns)).encode("utf-8"))
+    if not obj.empty:
+        h.update(pd.util.hash_pandas_object(obj, index=True).values.tobytes())
+    return h.hexdigest()
+
+
+def atomic_write(fp: Path, write: Callable[[Path], object]) -> None:
+    """같은 폴더의 임시 파일에 쓴 뒤 rename – 읽는 쪽은 옛 파일이나 새 파일만 봅니다."""
+    tmp = fp.with_name(f".{fp.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        write(tmp)
+        os.replace(tmp, fp)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def write_frame(
+    path: Path,
+    obj: pd.Series | pd.DataFrame,
+    *,
+    fmt: str | None = None,
+    csv_export: bool = False,
+) -> list[Path]:
+    """``obj`` 를 원자적으로 저장하고, 쓴 파일 경로 목록을 반환합니다."""
+    fmt = fmt or DATA_FORMAT
+    if fmt not in FORMATS:
+        raise ValueError(f"Unsupported storage format: {fmt}")
+    if fmt == "parquet" and not HAS_PARQUET:
+        fmt = "csv"
+    base = stem(path)
+    df = _as_frame(obj)
+    written = []
+    if fmt == "parquet":
+        fp = base.with_suffix(".parquet")
+        atomic_write(fp, lambda tmp: df.to_parquet(tmp, row_group_size=ROW_GROUP_ROWS))
+        written.append(fp)
+    if fmt == "csv" or csv_export:
+        fp = base.with_suffix(".csv")
+        atomic_write(fp, obj.to_csv)
+        written.append(fp)
+    return written
+
+
+def read_manifest(root: Path) -> Dict:
+    """``root/manifest.json`` – 없거나 깨졌으면 빈 manifest."""
+    try:
+        manifest = json.loads((Path(root) / MANIFEST).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        manifest = {}
+    manifest.setdefault("series", {})
+    return manifest
+
+
+class BatchWriter:
+    """한 번의 실행에서 나오는 출력들을 모아 쓰는 변경 감지 저장기.
+
+    ``put()`` 은 내용 해시가 manifest 와 같고 파일이 그대로 있으면 쓰지 않으므로
+    바뀌지 않은 파일은 mtime 도 그대로입니다. ``commit()`` 은 바뀐 것이 있을 때만
+    manifest(시리즈별 해시·행 수·첫/마지막 날짜, 전체 ``version``)와 ``bundle``
+    zip 을 원자적으로 다시 씁니다.
+    """
+
+    def __init__(self, root: Path, *, fmt: str | None = None, bundle: Path | None = None) -> None:
+        self.root = Path(root)
+        self.fmt = fmt
+        self.bundle = Path(bundle) if bundle else None
+        self.manifest = read_manifest(self.root)
+        self.changed: list[str] = []
+        self._lock = threading.Lock()
+
+    def _current(self, name: str, digest: str, csv_export: bool) -> bool:
+        prev = self.manifest["series"].get(name)
+        if not prev or prev.get("hash") != digest:
+            return False
+        files = [self.root / f for f in prev.get("files", [])]
+        if csv_export and not any(f.suffix == ".csv" for f in files):
+            return False
+        return bool(files) and all(f.exists() for f in files)
+
+    def put(self, name: str, obj: pd.Series | pd.DataFrame, *, csv_export: bool = False) -> bool:
+        """``name`` 출력을 저장합니다. 실제로 썼으면 True, 내용이 같아 건너뛰었으면 False."""
+        digest = content_hash(obj)
+        with self._lock:
+            if self._current(name, digest, csv_export):
+                return False
+        written = write_frame(self.root / name, obj, fmt=self.fmt, csv_export=csv_export)
+        idx = obj.index
+        entry = {
+            "hash": digest,
+            "rows": int(len(obj)),
+            "first": idx.min().strftime(CSV_DATE_FORMAT) if len(idx) else None,
+            "last": idx.max().strftime(CSV_DATE_FORMAT) if len(idx) else None,
+            "files": sorted(fp.name for fp in written),
+            "updated": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        }
+        with self._lock:
+            self.manifest["series"][name] = entry
+            self.changed.append(name)
+        return True
+
+    def commit(self) -> Dict:
+        """manifest(와 묶음)를 갱신하고 manifest 를 반환합니다."""
+        fp = self.root / MANIFEST
+        if not self.changed and fp.exists():
+            return self.manifest
+        series = self.manifest["series"]
+        version = hashlib.sha1(
+            "|".join(f"{n}:{series[n]['hash']}" for n in sorted(series)).encode("utf-8")
+        ).hexdigest()
+        self.manifest["version"] = version
+        self.manifest["updated"] = time.strftime("%Y-%m-%dT%H:%M:%S")
+        text = json.dumps(self.manifest, indent=1, sort_keys=True, ensure_ascii=False)
+        atomic_write(fp, lambda tmp: tmp.write_text(text, encoding="utf-8"))
+        if self.bundle is not None:
+            self._write_bundle()
+        return self.manifest
+
+    def _write_bundle(self) -> None:
+        files = sorted({f for e in self.manifest["series"].values() for f in e.get("files", [])})
+
+        def _zip(tmp: Path) -> None:
+            # Parquet 은 이미 압축되어 있으므로 그대로 담는다.
+            with zipfile.ZipFile(tmp, "w", compression=zipfile.ZIP_STORED) as zf:
+                zf.write(self.root / MANIFEST, MANIFEST)
+                for name in files:
+                    if (self.root / name).exists():
+                        zf.write(self.root / name, name)
+
+        atomic_write(self.bundle, _zip)
+
+
+def read_frame(
+    path: Path,
+    *,
+    columns: Sequence[str] | None = None,
+    start: str | pd.Timestamp | None = None,
+    end: str | pd.Timestamp | None = None,
+    isin: Mapping[str, Iterable] | None = None,
+) -> pd.DataFrame:
+    """저장된 프레임을 읽습니다.
+
+    ``columns`` 는 필요한 컬럼만(없는 이름은 무시), ``start``/``end`` 는 날짜 구간만,
+    ``isin`` 은 ``{컬럼: 값 목록}`` 에 든 행만 읽습니다. Parquet 은 행 그룹 통계로
+    조건 밖 그룹을 건너뜁니다.
+    """
+    fp = resolve(path)
+    if fp is None:
+        raise FileNotFoundError(stem(path))
+    lo = pd.Timestamp(start) if start is not None else None
+    hi = pd.Timestamp(end) if end is not None else None
+
+    if fp.suffix == ".parquet":
+        index_only = False
+        if columns is not None:
+            names = _parquet_columns(fp)
+            columns = [c for c in columns if c in names]
+            if not columns and names:
+                # 인덱스만 필요해도 데이터 컬럼 하나는 함께 읽는다 – 데이터 컬럼 없이
+                # 읽으면 pyarrow 가 인터프리터 종료 시 중단되는 경우가 있다.
+                columns, index_only = names[:1], True
+        filters = []
+        if lo is not None:
+            filters.append((INDEX_NAME, ">=", lo))
+        if hi is not None:
+            filters.append((INDEX_NAME, "<=", hi))
+        for col, values in (isin or {}).items():
+            filters.append((col, "in", list(values)))
+        df = pd.read_parquet(fp, columns=columns, filters=filters or None)
+        if index_only:
+            df = df[[]]
+    else:
+        usecols = None
+        if columns is not None:
+            wanted = set(columns)
+            usecols = lambda c: c in wanted or c.startswith("Unnamed: 0") or c == INDEX_NAME  # noqa: E731
+        df = pd.read_csv(fp, index_col=0, usecols=usecols)
+        idx = pd.to_datetime(df.index, format=CSV_DATE_FORMAT, errors="coerce")
+        if idx.isna().any():  # 시각이 붙은 예전 파일 등 – 일반 파서로 재시도
+            idx = pd.to_datetime(df.index, errors="coerce")
+        df.index = idx
+        df = df[~df.index.isna()]
+        if lo is not None or hi is not None:
+            df = df.loc[lo:hi]
+        for col, values in (isin or {}).items():
+            df = df[df[col].isin(list(values))]
+    df.index.name = None
+    return df
+
+
+def _parquet_columns(fp: Path) -> list[str]:
+    """Parquet 파일의 데이터 컬럼 이름 (인덱스 제외, 저장 순서)."""
+    import pyarrow.parquet as pq
+
+    return [n for n in pq.read_schema(fp).names if n != INDEX_NAME and not n.startswith("__index_level_")]
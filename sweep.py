@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+sweep.py  –  시그널 파라미터 스윕 (프로세스 병렬)
+─────────────────────────────────────────────
+✓ 격자   : (단기 MA, 장기 MA, 모멘텀 기간) × M2 경계 × 스프레드 경계 – 모든 자산을 한 번에
+✓ 비용   : 이동평균은 누적합 차분이라 창 길이와 무관하게 O(n), Macro 는 워커마다 경계별 한 번
+✓ 병렬   : 추세 조합 하나가 작업 하나 – ProcessPoolExecutor 로 모든 코어에 나눔
+✓ 결과   : data/sweep.parquet (설정 × 자산 한 행) – 대시보드 "🔬 파라미터 스윕" 에서 읽음
+
+    python sweep.py                                  # 기본 격자 (768 설정 × 자산)
+    python sweep.py --short 5,10,20 --long 50,100,200 --momentum 21,63 \\
+        --m2 9/6/3 8/5/2 --spread 0.5/0 1/0 --rule scaled --cost 10 --workers 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+import backtest
+import panel
+import signals
+import storage
+
+DATA_DIR = Path("data")
+OUT = DATA_DIR / "sweep.parquet"
+START = pd.Timestamp("2008-01-01")
+# 스윕에 필요한 패널 컬럼 – 추세 자산 가격과 Macro 재료
+COLUMNS = (*signals.TREND_ASSETS.values(), "M2_D", "Spread5D", "Rate", "Bond10")
+PARAMS = ("short", "long", "momentum", "m2_cuts", "spread_cuts", "rule", "cost_bps")
+
+SHORTS = (5, 10, 20, 30)
+LONGS = (50, 100, 150, 200)
+MOMENTA = (21, 63, 126)
+M2_GRID = ((9.0, 6.0, 3.0), (8.0, 5.0, 2.0), (10.0, 7.0, 4.0), (12.0, 8.0, 4.0))
+SPREAD_GRID = ((0.5, 0.0), (0.25, 0.0), (1.0, 0.0), (0.5, -0.25))
+
+# 워커 프로세스마다 한 번 채우는 상태 (가격 배열·경계별 Macro 점수)
+_STATE: Dict = {}
+
+
+def cuts_label(cuts: Sequence[float]) -> str:
+    """``(9.0, 6.0, 3.0)`` -> ``"9/6/3"`` (결과 표와 명령줄에서 같은 표기)."""
+    return "/".join(f"{c:g}" for c in cuts)
+
+
+def parse_cuts(text: str) -> Tuple[float, ...]:
+    return tuple(float(c) for c in text.split("/"))
+
+
+def _init(df: pd.DataFrame, macro_grid: Sequence[Tuple[Tuple[float, ...], Tuple[float, ...]]], rule: str, cost_bps: float) -> None:
+    names = [name for name, col in signals.TREND_ASSETS.items() if col in df]
+    parts = signals.macro_inputs(df, release_lag=signals.RELEASE_LAG)
+    _STATE.update(
+        names=names,
+        prices=df[[signals.TREND_ASSETS[name] for name in names]].to_numpy(dtype="float64"),
+        macros=[(m2, sp, signals.macro(parts, len(df), m2, sp)) for m2, sp in macro_grid],
+        rule=rule,
+        cost_bps=cost_bps,
+    )
+
+
+def evaluate(windows: Tuple[int, int, int]) -> List[Dict]:
+    """추세 조합 하나 × 모든 Macro 경계 × 모든 자산의 백테스트 지표 행."""
+    short, long, momentum = windows
+    prices, names = _STATE["prices"], _STATE["names"]
+    trend = signals.trend(prices, short, long, momentum)
+    rows = []
+    for m2_cuts, spread_cuts, macro in _STATE["macros"]:
+        final = np.clip(trend + macro[:, None], -3, 3)
+        metrics = backtest.run(prices, final, rule=_STATE["rule"], cost_bps=_STATE["cost_bps"])
+        config = {
+            "short": short, "long": long, "momentum": momentum,
+            "m2_cuts": cuts_label(m2_cuts), "spread_cuts": cuts_label(spread_cuts),
+            "rule": _STATE["rule"], "cost_bps": _STATE["cost_bps"],
+        }
+        for i, name in enumerate(names):
+            rows.append({**config, "asset": name, **{m: float(metrics[m][i]) for m in backtest.METRICS}})
+    return rows
+
+
+def run(
+    df: pd.DataFrame,
+    *,
+    shorts: Sequence[int] = SHORTS,
+    longs: Sequence[int] = LONGS,
+    momenta: Sequence[int] = MOMENTA,
+    m2_grid: Sequence[Tuple[float, ...]] = M2_GRID,
+    spread_grid: Sequence[Tuple[float, ...]] = SPREAD_GRID,
+    rule: str = backtest.DEFAULT_RULE,
+    cost_bps: float = 0.0,
+    workers: int | None = None,
+) -> pd.DataFrame:
+    """격자 전체를 평가해 (설정 × 자산) 표를 돌려줍니다 (``short < long`` 인 조합만).
+
+    ``workers`` 가 1 이면 현재 프로세스에서, 아니면 그 수(기본: CPU 수)의 프로세스로 나눕니다.
+    """
+    backtest.positions(np.zeros((1, 1)), rule)  # 잘못된 규칙은 워커를 띄우기 전에 거른다
+    windows = [(s, lg, m) for s, lg, m in product(shorts, longs, momenta) if s < lg]
+    macro_grid = list(product(m2_grid, spread_grid))
+    workers = max(1, min(workers or os.cpu_count() or 1, len(windows) or 1))
+    if workers == 1:
+        _init(df, macro_grid, rule, cost_bps)
+        results = map(evaluate, windows)
+        rows = [row for chunk in results for row in chunk]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init, initargs=(df, macro_grid, rule, cost_bps)) as pool:
+            chunk = max(1, len(windows) // (workers * 4))
+            rows = [row for result in pool.map(evaluate, windows, chunksize=chunk) for row in result]
+    return pd.DataFrame(rows, columns=[*PARAMS, "asset", *backtest.METRICS])
+
+
+def save(table: pd.DataFrame, path: Path = OUT) -> Path:
+    """결과 표를 원자적으로 씁니다 (pyarrow 가 없으면 같은 이름의 CSV)."""
+    fp = Path(path) if storage.HAS_PARQUET else Path(path).with_suffix(".csv")
+    fp.parent.mkdir(parents=True, exist_ok=True)
+    if fp.suffix == ".parquet":
+        storage.atomic_write(fp, lambda tmp: table.to_parquet(tmp, index=False))
+    else:
+        storage.atomic_write(fp, lambda tmp: table.to_csv(tmp, index=False))
+    return fp
+
+
+def load(path: Path = OUT) -> pd.DataFrame | None:
+    """저장된 결과 표 – 없으면 ``None``."""
+    for fp in (Path(path), Path(path).with_suffix(".csv")):
+        if fp.exists():
+            return pd.read_parquet(fp) if fp.suffix == ".parquet" else pd.read_csv(fp)
+    return None
+
+
+def main(argv=None) -> None:
+    ints = lambda s: tuple(int(v) for v in s.split(","))  # noqa: E731
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--short", type=ints, default=SHORTS, help="단기 MA 창 (콤마구분)")
+    parser.add_argument("--long", type=ints, default=LONGS, help="장기 MA 창 (콤마구분)")
+    parser.add_argument("--momentum", type=ints, default=MOMENTA, help="모멘텀 기간 (콤마구분)")
+    parser.add_argument("--m2", nargs="+", type=parse_cuts, default=M2_GRID, metavar="HI/MID/LO", help="M2 YoY 경계 조합들")
+    parser.add_argument("--spread", nargs="+", type=parse_cuts, default=SPREAD_GRID, metavar="HI/LO", help="금리차 경계 조합들")
+    parser.add_argument("--rule", choices=list(backtest.RULES), default=backtest.DEFAULT_RULE)
+    parser.add_argument("--cost", type=float, default=10.0, help="편도 거래비용 (bp)")
+    parser.add_argument("--workers", type=int, help="프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--data", type=Path, default=DATA_DIR)
+    parser.add_argument("--out", type=Path, default=OUT)
+    args = parser.parse_args(argv)
+
+    df = panel.load_panel(args.data, columns=COLUMNS, start=START)
+    t0 = time.perf_counter()
+    table = run(
+        df, shorts=args.short, longs=args.long, momenta=args.momentum,
+        m2_grid=args.m2, spread_grid=args.spread, rule=args.rule, cost_bps=args.cost, workers=args.workers,
+    )
+    fp = save(table, args.out)
+    configs = len(table) // max(1, table["asset"].nunique())
+    print(f"▶ {configs} configs × {table['asset'].nunique()} assets in {time.perf_counter() - t0:.1f}s -> {fp}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import backtest
+import signals
+
+
+def test_positions_apply_next_day_and_pay_costs():
+    prices = np.array([[1.0, 1.0], [1.0, 1.0], [2.0, 2.0], [1.5, 1.5], [1.5, 1.5]])
+    # 첫 자산은 처음부터 매수 신호, 둘째 자산은 가격이 뛴 날에야 신호
+    final = np.array([[1, 0], [1, 0], [1, 1], [1, 1], [1, 1]], dtype=float)
+
+    out = backtest.run(prices, final, cost_bps=100, periods_per_year=4)
+
+    # 첫 자산: 1일에 진입(비용 1 %) → 2배 → −25 %, 4일(1년) 동안 0.99 × 2 × 0.75
+    assert out["CAGR"][0] == pytest.approx(0.99 * 2 * 0.75 - 1)
+    assert out["MaxDD"][0] == pytest.approx(-0.25)
+    assert out["HitRate"][0] == pytest.approx(0.5)
+    assert out["Turnover"][0] == pytest.approx(1.0)
+    # 둘째 자산: 신호 당일의 상승은 먹지 못하고 다음 날 하락만 맞는다
+    assert out["CAGR"][1] == pytest.approx(-0.25 - 0.01)  # 진입일 비용은 그날 수익에서 뺀다
+    assert out["BuyHold"][1] == pytest.approx(0.5)
+
+
+def test_vol_and_sharpe_use_trading_days_of_a_calendar_grid():
+    bdays = pd.bdate_range("2020-01-01", periods=520)
+    rng = np.random.default_rng(7)
+    close = pd.Series(100 * np.cumprod(1 + rng.normal(0.0005, 0.01, len(bdays))), index=bdays)
+    cal = close.reindex(pd.date_range(bdays[0], bdays[-1], freq="D")).ffill()
+
+    out = backtest.run(cal.to_numpy()[:, None], np.ones((len(cal), 1)))
+
+    # 첫날 종가에 진입해 모든 거래일 수익을 먹는다 – 주말 0 수익 행은 표준편차에 들어가지 않는다
+    r = close.pct_change().iloc[1:]
+    per_year = (len(bdays) - 1) / ((len(cal) - 1) / backtest.DAYS_PER_YEAR)
+    assert out["Vol"][0] == pytest.approx(r.std(ddof=0) * np.sqrt(per_year))
+    assert out["Sharpe"][0] == pytest.approx(r.mean() / r.std(ddof=0) * np.sqrt(per_year))
+
+
+def test_unknown_rule_is_rejected():
+    with pytest.raises(ValueError):
+        backtest.positions(np.zeros((2, 1)), "yolo")
+
+
+def test_report_covers_every_priced_asset():
+    idx = pd.date_range("2015-01-01", periods=1500, freq="D")
+    rng = np.random.default_rng(3)
+    df = pd.DataFrame({
+        "SP500": 2_000 * np.cumprod(1 + rng.normal(0, 0.01, len(idx))),
+        "Bitcoin": 300 * np.cumprod(1 + rng.normal(0, 0.04, len(idx))),
+        "Spread5D": 1.0,
+    }, index=idx)
+    df.loc[idx[:400], "Bitcoin"] = np.nan
+
+    tbl = backtest.report(df, signals.SignalStore(df, release_lag=signals.RELEASE_LAG), rule="scaled", cost_bps=10)
+
+    assert list(tbl.index) == ["SP500", "BTC"] and list(tbl.columns) == list(backtest.METRICS)
+    assert tbl.notna().all().all()
+    assert (tbl["Exposure"] <= 1).all() and (tbl["MaxDD"] <= 0).all()
@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+
+import decode
+
+
+def test_numbers_maps_missing_markers_to_nan():
+    out = decode.numbers(["1.5", ".", "", "-", "2", None, 3])
+
+    assert out.dtype == np.float64
+    assert np.isnan(out[[1, 2, 3, 5]]).all()
+    assert out[[0, 4, 6]].tolist() == [1.5, 2.0, 3.0]
+
+
+def test_series_drops_missing_and_keeps_last_duplicate():
+    records = [
+        {"date": "2024-01-02", "value": "1.0"},
+        {"date": "2024-01-03", "value": "."},
+        {"date": "2024-01-04", "value": "2.0"},
+        {"date": "2024-01-04", "value": "3.0"},
+    ]
+
+    ser = decode.series(records, date_key="date", value_key="value", fmt="%Y-%m-%d", name="DEXKOUS")
+
+    assert ser.name == "DEXKOUS"
+    assert list(ser.index) == [pd.Timestamp("2024-01-02"), pd.Timestamp("2024-01-04")]
+    assert ser.tolist() == [1.0, 3.0]
+
+
+def test_series_empty_payload():
+    ser = decode.series([], date_key="date", value_key="value", fmt="%Y-%m-%d", name="x")
+
+    assert ser.empty
+    assert ser.dtype == np.float64
+
+
+def test_payload_prefers_raw_body():
+    class Resp:
+        content = b'{"observations": []}'
+
+        def json(self):
+            raise AssertionError("should not fall back to resp.json()")
+
+    assert decode.payload(Resp()) == {"observations": []}
+
+
+def test_dates_fast_paths_match_pandas():
+    for values, fmt in ((["2024-01-31", "1999-12-01"], "%Y-%m-%d"), (["202401", "199912"], "%Y%m")):
+        expected = pd.DatetimeIndex(pd.to_datetime(values, format=fmt))
+        assert decode.dates(values, fmt).equals(expected)
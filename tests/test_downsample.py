@@ -0,0 +1,27 @@
+import numpy as np
+import pandas as pd
+
+import downsample
+
+
+def test_minmax_keeps_extremes_and_endpoints():
+    rng = np.random.default_rng(0)
+    ser = pd.Series(np.cumsum(rng.normal(size=6000)), index=pd.date_range("2008-01-01", periods=6000))
+    ser.iloc[:30] = np.nan
+
+    x, y = downsample.series(ser, 400)
+
+    assert len(x) <= 402
+    assert x[0] == ser.first_valid_index() and x[-1] == ser.index[-1]
+    assert y.max() == ser.max() and y.min() == ser.min()
+    assert x.is_monotonic_increasing and x.is_unique
+    np.testing.assert_array_equal(y, ser.loc[x].to_numpy())
+
+
+def test_short_series_are_returned_unchanged():
+    ser = pd.Series([1.0, np.nan, 3.0], index=pd.date_range("2024-01-01", periods=3))
+
+    x, y = downsample.series(ser, 400)
+
+    assert x.equals(ser.index)
+    np.testing.assert_array_equal(y, ser.to_numpy())
@@ -0,0 +1,81 @@
+import pandas as pd
+
+import fetch_data
+
+
+class FakeResponse:
+    def __init__(self, payload):
+        self._payload = payload
+
+    def json(self):
+        return self._payload
+
+
+class PagedEcos:
+    """list_total_count 만큼의 행을 페이지 단위로 돌려주는 가짜 ECOS."""
+
+    def __init__(self, total):
+        self.total = total
+        self.urls = []
+
+    def get(self, url, timeout=30, **kwargs):
+        self.urls.append(url)
+        parts = url.split("/")
+        first, last = int(parts[8]), int(parts[9])
+        rows = [
+            {"TIME": f"{2000 + (i - 1) // 12}{(i - 1) % 12 + 1:02d}", "DATA_VALUE": str(i)}
+            for i in range(first, min(last, self.total) + 1)
+        ]
+        return FakeResponse({"StatisticSearch": {"list_total_count": self.total, "row": rows}})
+
+    def invalidate(self, url, params=None):
+        pass
+
+
+def test_ecos_streams_every_page(monkeypatch):
+    fake = PagedEcos(total=25)
+    monkeypatch.setattr(fetch_data, "HTTP", fake)
+    monkeypatch.setattr(fetch_data, "ECOS_PAGE_SIZE", 10)
+
+    out = fetch_data.ecos("101Y003", ITEM_CODE1="BBHS00")
+
+    assert len(fake.urls) == 3
+    assert len(out) == 25
+    assert out.index[0] == pd.Timestamp("2000-01-01")
+    assert out.iloc[-1] == 25.0
+    assert all(u.endswith("/BBHS00") for u in fake.urls)
+
+
+def test_ecos_fills_skipped_item_codes(monkeypatch):
+    fake = PagedEcos(total=1)
+    monkeypatch.setattr(fetch_data, "HTTP", fake)
+
+    fetch_data.ecos("060Y002", ITEM_CODE2="X")
+
+    assert fake.urls[0].endswith("/?/X")
+
+
+def test_first_nonempty_stops_at_first_hit():
+    calls = []
+
+    def candidate(label, values):
+        def _fn():
+            calls.append(label)
+            if isinstance(values, Exception):
+                raise values
+            return pd.Series(values, dtype=float)
+        return _fn
+
+    out = fetch_data.first_nonempty(
+        [
+            candidate("a", RuntimeError("down")),
+            candidate("b", []),
+            candidate("c", [1.0]),
+            candidate("d", [2.0]),
+        ],
+        name="M2",
+    )
+
+    assert calls == ["a", "b", "c"]
+    assert out.name == "M2"
+    assert out.iloc[0] == 1.0
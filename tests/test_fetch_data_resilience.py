@@ -1,50 +1,17 @@
-import ast
-import io
-import re
-import html as html_lib
-import types
-from pathlib import Path
-
 import pandas as pd
 
-
-def load_fetch_data_functions():
-    src = Path("fetch_data.py").read_text(encoding="utf-8")
-    tree = ast.parse(src)
-    mod = types.ModuleType("fetch_data_partial")
-    mod.pd = pd
-    mod.io = io
-    mod.re = re
-    mod.html_lib = html_lib
-    mod.Path = Path
-    mod.DIR = Path("data")
-    for node in tree.body:
-        if isinstance(node, ast.FunctionDef) and node.name in {
-            "empty_series",
-            "to_datetime_index",
-            "safe_resample",
-            "load_cached_series",
-            "fetch_gold",
-            "fetch_buy_index",
-            "_extract_table_rows",
-        }:
-            code = ast.Module([node], [])
-            exec(compile(code, filename="fetch_data.py", mode="exec"), mod.__dict__)
-    return mod
+import fetch_data
 
 
 def test_safe_resample_handles_empty_rangeindex():
-    mod = load_fetch_data_functions()
     s = pd.Series(dtype=float, name="M2")
-    out = mod.safe_resample(s, "D", "linear", name="M2_D")
+    out = fetch_data.safe_resample(s, "D", "linear", name="M2_D")
     assert out.empty
     assert isinstance(out.index, pd.DatetimeIndex)
     assert out.name == "M2_D"
 
 
 def test_fetch_buy_index_falls_back_without_lxml(monkeypatch):
-    mod = load_fetch_data_functions()
-
     class DummyResponse:
         text = """
         <table>
@@ -56,24 +23,23 @@ def test_fetch_buy_index_falls_back_without_lxml(monkeypatch):
 
     class DummyRequests:
         @staticmethod
-        def get(url, timeout=30):
+        def get(url, timeout=30, **kwargs):
             return DummyResponse()
 
     def fake_read_html(*args, **kwargs):
         raise ImportError("Missing optional dependency 'lxml'.")
 
-    mod.requests = DummyRequests()
+    monkeypatch.setattr(fetch_data, "HTTP", DummyRequests())
     monkeypatch.setattr(pd, "read_html", fake_read_html)
 
-    out = mod.fetch_buy_index()
+    out = fetch_data.fetch_buy_index()
     assert list(out.index) == [pd.Timestamp("2024-01-01"), pd.Timestamp("2024-01-08")]
     assert out.name == "BuyIndex"
     assert out.iloc[-1] == 101.2
 
 
-def test_fetch_gold_falls_back_to_cached_all_data(tmp_path):
-    mod = load_fetch_data_functions()
-    mod.DIR = tmp_path
+def test_fetch_gold_falls_back_to_cached_all_data(tmp_path, monkeypatch):
+    monkeypatch.setattr(fetch_data, "DIR", tmp_path)
 
     cached = pd.DataFrame(
         {"Gold": [101.5, 102.25]},
@@ -84,17 +50,15 @@ def test_fetch_gold_falls_back_to_cached_all_data(tmp_path):
     def fake_fetch_adj_close(*args, **kwargs):
         raise RuntimeError("upstream unavailable")
 
-    mod.fetch_adj_close = fake_fetch_adj_close
+    monkeypatch.setattr(fetch_data, "fetch_adj_close", fake_fetch_adj_close)
 
-    out = mod.fetch_gold()
+    out = fetch_data.fetch_gold()
     assert list(out.index) == [pd.Timestamp("2026-03-01"), pd.Timestamp("2026-03-02")]
     assert out.name == "Gold"
     assert out.iloc[-1] == 102.25
 
 
-def test_fetch_gold_preserves_older_cached_history():
-    mod = load_fetch_data_functions()
-
+def test_fetch_gold_preserves_older_cached_history(monkeypatch):
     cached = pd.Series(
         [99.0, 101.0],
         index=pd.to_datetime(["2007-12-31", "2008-01-02"]),
@@ -106,10 +70,10 @@ def test_fetch_gold_preserves_older_cached_history():
         name="GC=F",
     )
 
-    mod.load_cached_series = lambda column, path=None: cached
-    mod.fetch_adj_close = lambda ticker, start="2008-01-01": live
+    monkeypatch.setattr(fetch_data, "load_cached_series", lambda column, path=None: cached)
+    monkeypatch.setattr(fetch_data, "fetch_adj_close", lambda ticker, start="2008-01-01": live)
 
-    out = mod.fetch_gold()
+    out = fetch_data.fetch_gold()
     assert list(out.index) == [
         pd.Timestamp("2007-12-31"),
         pd.Timestamp("2008-01-02"),
@@ -0,0 +1,114 @@
+import pandas as pd
+import pytest
+
+import fetch_data
+
+
+def _write_store(tmp_path, frame):
+    frame.to_csv(tmp_path / "all_data.csv")
+
+
+def test_fetch_tail_requests_only_overlap_window(tmp_path, monkeypatch):
+    monkeypatch.setattr(fetch_data, "DIR", tmp_path)
+    idx = pd.date_range("2026-01-01", "2026-03-31", freq="D")
+    _write_store(tmp_path, pd.DataFrame({"FX": range(len(idx))}, index=idx, dtype=float))
+
+    seen = {}
+
+    def fake_fetch(start):
+        seen["start"] = start
+        live_idx = pd.date_range(start, "2026-04-02", freq="D")
+        return pd.Series(1000.0, index=live_idx, name="DEXKOUS")
+
+    out = fetch_data.fetch_tail("FX", fake_fetch, start="2008-01-01", incremental=True)
+
+    assert seen["start"] == "2026-03-17"
+    assert out.name == "FX"
+    assert out.index.min() == pd.Timestamp("2026-01-01")
+    assert out.index.max() == pd.Timestamp("2026-04-02")
+    assert out.loc["2026-03-16"] == 74.0
+    assert (out.loc["2026-03-17":] == 1000.0).all()
+
+
+def test_fetch_tail_restores_monthly_history_from_daily_store(tmp_path, monkeypatch):
+    monkeypatch.setattr(fetch_data, "DIR", tmp_path)
+    idx = pd.date_range("2025-01-01", "2025-12-31", freq="D")
+    cpi = pd.Series(range(len(idx)), index=idx, dtype=float)
+    _write_store(tmp_path, pd.DataFrame({"CPI_D": cpi}))
+
+    seen = {}
+
+    def fake_fetch(start):
+        seen["start"] = start
+        return pd.Series([1.0, 2.0], index=pd.to_datetime(["2025-12-01", "2026-01-01"]))
+
+    out = fetch_data.fetch_tail("CPI", fake_fetch, start="2000-01-01", freq="m", incremental=True)
+
+    assert seen["start"] == "2025-06-01"
+    assert list(out.index[:2]) == [pd.Timestamp("2025-01-01"), pd.Timestamp("2025-02-01")]
+    assert out.index.is_monotonic_increasing
+    assert out.loc["2025-05-01"] == cpi.loc["2025-05-01"]
+    assert "2025-06-01" not in out.index
+    assert out.iloc[-1] == 2.0
+
+
+def test_stored_history_trims_ffilled_tail_but_keeps_repeated_months(tmp_path, monkeypatch):
+    monkeypatch.setattr(fetch_data, "DIR", tmp_path)
+    # 6월 CPI 는 5월과 같은 값으로 발표됐고, 8월 이후는 파일 끝까지 ffill 로 채워진 꼬리다.
+    months = pd.to_datetime(["2011-04-01", "2011-05-01", "2011-06-01", "2011-07-01"])
+    cpi = pd.Series([224.1, 224.8, 224.8, 225.4], index=months)
+    idx = pd.date_range("2011-04-01", "2011-10-15", freq="D")
+    _write_store(tmp_path, pd.DataFrame({"CPI_D": cpi.reindex(idx).ffill()}))
+
+    out = fetch_data.stored_history("CPI", freq="m")
+
+    assert list(out.index) == list(months)
+    assert out.name == "CPI"
+
+
+def test_stored_history_keeps_repeated_trading_days_and_drops_filled_weekends(tmp_path, monkeypatch):
+    monkeypatch.setattr(fetch_data, "DIR", tmp_path)
+    days = pd.to_datetime(["2008-01-09", "2008-01-10", "2008-01-11", "2008-01-14"])  # 수·목·금·월
+    fx = pd.Series([937.1, 937.2, 937.2, 937.0], index=days)
+    btc = pd.Series([10.0, 11.0, 12.0], index=pd.to_datetime(["2008-01-11", "2008-01-12", "2008-01-14"]))
+    idx = pd.date_range("2008-01-09", "2008-01-20", freq="D")
+    _write_store(tmp_path, pd.DataFrame({"FX": fx.reindex(idx).ffill(), "Bitcoin": btc.reindex(idx).ffill()}))
+
+    assert list(fetch_data.stored_history("FX").index) == list(days)
+    assert list(fetch_data.stored_history("Bitcoin").index) == list(btc.index)
+
+
+def test_gold_krw_uses_fx_as_of_each_gold_date():
+    gold = pd.Series([891.7, 896.1], index=pd.to_datetime(["2008-01-10", "2008-01-11"]))
+    fx = pd.Series([937.2], index=pd.to_datetime(["2008-01-10"]))  # 11일 환율은 없다
+
+    out = fetch_data.REGISTRY["Gold_KRWg"].build(gold, fx)
+
+    assert out.index.equals(gold.index)
+    assert out.iloc[-1] == pytest.approx(896.1 * 937.2 / 31.1035)
+
+
+def test_real_rate_uses_latest_policy_rate_for_each_cpi_month():
+    months = pd.date_range("2024-01-01", periods=14, freq="MS")
+    cpi = pd.Series(range(100, 114), index=months, dtype=float)
+    rate = pd.Series([3.0, 2.5], index=pd.to_datetime(["2023-12-01", "2025-02-01"]))  # 값이 바뀐 달만 남은 이력
+
+    out = fetch_data.REGISTRY["RealRate"].build(rate, cpi)
+
+    assert out.index.equals(months)
+    assert out.loc["2025-01-01"] == pytest.approx(3.0 - 12.0)
+    assert out.loc["2025-02-01"] == pytest.approx(2.5 - (113 / 101 - 1) * 100)
+
+
+def test_fetch_tail_full_history_when_not_incremental(tmp_path, monkeypatch):
+    monkeypatch.setattr(fetch_data, "DIR", tmp_path)
+    seen = {}
+
+    def fake_fetch(start):
+        seen["start"] = start
+        return pd.Series([1.0], index=pd.to_datetime(["2008-01-02"]))
+
+    out = fetch_data.fetch_tail("FX", fake_fetch, start="2008-01-01")
+
+    assert seen["start"] == "2008-01-01"
+    assert out.name == "FX"
@@ -0,0 +1,43 @@
+import threading
+import time
+
+import fetch_data
+
+
+def test_run_concurrent_overlaps_independent_hosts():
+    def slow(value):
+        def _fn():
+            time.sleep(0.2)
+            return value
+        return _fn
+
+    jobs = {f"job{i}": (f"host{i}.example", slow(i)) for i in range(4)}
+    t0 = time.perf_counter()
+    out = fetch_data.run_concurrent(jobs, max_workers=4)
+    elapsed = time.perf_counter() - t0
+
+    assert out == {"job0": 0, "job1": 1, "job2": 2, "job3": 3}
+    assert elapsed < 0.6
+
+
+def test_run_concurrent_respects_host_limit(monkeypatch):
+    monkeypatch.setitem(fetch_data.HOST_LIMITS, "limited.example", 1)
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def job():
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.05)
+        with lock:
+            active -= 1
+        return True
+
+    jobs = {f"job{i}": ("limited.example", job) for i in range(4)}
+    out = fetch_data.run_concurrent(jobs, max_workers=4)
+
+    assert all(out.values())
+    assert peak == 1
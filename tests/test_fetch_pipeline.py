@@ -0,0 +1,109 @@
+import pandas as pd
+import pytest
+
+import fetch_data
+from fetch_data import FetchContext, Node
+
+
+@pytest.fixture
+def mini_registry(tmp_path, monkeypatch):
+    """A(원천) → B(파생) → C(파생), D(원천) → C 로 이루어진 작은 레지스트리."""
+    monkeypatch.setattr(fetch_data, "DIR", tmp_path)
+    monkeypatch.setattr(fetch_data, "REGISTRY", {})
+    calls = {"A": 0, "D": 0, "B": 0, "C": 0}
+    idx = pd.date_range("2024-01-01", periods=3, freq="D")
+
+    def source(name, value):
+        def _build(ctx):
+            calls[name] += 1
+            return pd.Series(value, index=idx, name=name)
+        return _build
+
+    def derived(name, fn):
+        def _build(*args):
+            calls[name] += 1
+            return fn(*args).rename(name)
+        return _build
+
+    fetch_data.register(Node("A", source("A", 1.0), host="a.example", output="A_raw"))
+    fetch_data.register(Node("D", source("D", 10.0), host="d.example", output="D_raw"))
+    fetch_data.register(Node("B", derived("B", lambda a: a * 2), deps=("A",), output="B_out"))
+    fetch_data.register(Node("C", derived("C", lambda b, d: b + d), deps=("B", "D"), output="C_out"))
+    return calls
+
+
+def test_pipeline_builds_every_node_in_dependency_order(mini_registry, tmp_path):
+    values = fetch_data.run_pipeline(FetchContext())
+
+    assert values["C"].tolist() == [12.0, 12.0, 12.0]
+    assert mini_registry == {"A": 1, "D": 1, "B": 1, "C": 1}
+    assert {p.stem for p in tmp_path.glob("*.*") if p.suffix in {".csv", ".parquet"}} == {
+        "A_raw", "D_raw", "B_out", "C_out",
+    }
+
+
+def test_pipeline_skips_derived_nodes_with_unchanged_inputs(mini_registry):
+    fetch_data.run_pipeline(FetchContext())
+    values = fetch_data.run_pipeline(FetchContext())
+
+    assert mini_registry == {"A": 2, "D": 2, "B": 1, "C": 1}
+    assert values["C"].tolist() == [12.0, 12.0, 12.0]
+
+
+def test_only_rebuilds_selection_and_downstream(mini_registry):
+    fetch_data.run_pipeline(FetchContext())
+    fetch_data.run_pipeline(FetchContext(), only=["D"], force=True)
+
+    assert mini_registry == {"A": 1, "D": 2, "B": 1, "C": 2}
+
+
+def test_downstream_closure(mini_registry):
+    assert fetch_data.downstream(["A"]) == {"A", "B", "C"}
+    assert fetch_data.downstream(["D"]) == {"D", "C"}
+
+
+def test_register_rejects_unknown_dependency(mini_registry):
+    with pytest.raises(ValueError):
+        fetch_data.register(Node("X", lambda z: z, deps=("missing",)))
+
+
+def test_default_registry_is_complete(monkeypatch):
+    assert fetch_data.downstream(["CPI"]) == {"CPI", "RealRate", "native"}
+    assert "all_data" not in fetch_data.REGISTRY  # 일 빈도 출력은 DAILY_EXPORT=1 일 때만
+
+    monkeypatch.setattr(fetch_data, "REGISTRY", dict(fetch_data.REGISTRY))
+    fetch_data.register_daily_export()
+    assert fetch_data.downstream(["CPI"]) >= {"CPI", "CPI_D", "RealRate", "RealRate_D", "all_data", "native"}
+    assert fetch_data.REGISTRY["all_data"].deps[-3:] == ("SP500", "KODEX200", "Bitcoin")
+
+
+def test_unchanged_outputs_are_not_rewritten(mini_registry, tmp_path):
+    fetch_data.run_pipeline(FetchContext())
+    stamps = {p.name: p.stat().st_mtime_ns for p in tmp_path.glob("*_*.*") if p.suffix in {".csv", ".parquet"}}
+    manifest = (tmp_path / "manifest.json").read_text(encoding="utf-8")
+
+    fetch_data.run_pipeline(FetchContext(), force=True)
+
+    assert {p.name: p.stat().st_mtime_ns for p in tmp_path.glob("*_*.*") if p.suffix in {".csv", ".parquet"}} == stamps
+    assert (tmp_path / "manifest.json").read_text(encoding="utf-8") == manifest
+
+
+def test_replay_miss_stops_before_anything_is_written(mini_registry, tmp_path, monkeypatch):
+    adapter = fetch_data.replay.ReplayAdapter(fetch_data.replay.Fixtures(tmp_path / "fixtures"))
+    adapter.misses.append("https://a.example/series?id=A")
+    monkeypatch.setattr(fetch_data, "REPLAY", adapter)
+
+    with pytest.raises(fetch_data.replay.MissingFixture, match="a.example"):
+        fetch_data.run_pipeline(FetchContext())
+
+    assert mini_registry["B"] == 0
+    assert not list(tmp_path.glob("*_out.*"))
+
+
+def test_replay_pins_run_date_and_incremental_cutoff(monkeypatch):
+    monkeypatch.setattr(fetch_data, "RUN_DATE", pd.Timestamp("2026-03-10").date())
+    # 기록한 뒤에 저장소가 더 자랐어도 증분 시작일은 기록한 날 기준이다.
+    cached = pd.Series(1.0, index=pd.date_range("2026-01-01", "2026-04-30", freq="D"))
+
+    assert fetch_data.today() == pd.Timestamp("2026-03-10").date()
+    assert fetch_data.sync_start(cached, start="2008-01-01") == pd.Timestamp("2026-02-24")
@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+
+import fetch_data
+
+
+def fake_download(calls):
+    def _download(tickers, start=None, **kwargs):
+        calls.append((list(tickers), start))
+        idx = pd.date_range(start, periods=5, freq="B", tz="America/New_York")
+        cols = pd.MultiIndex.from_product([["Adj Close", "Close"], tickers], names=["Price", "Ticker"])
+        data = np.arange(len(idx) * len(cols), dtype=float).reshape(len(idx), len(cols))
+        return pd.DataFrame(data, index=idx, columns=cols)
+    return _download
+
+
+def test_fetch_prices_downloads_one_request_per_batch(monkeypatch, tmp_path):
+    monkeypatch.setattr(fetch_data, "DIR", tmp_path)
+    monkeypatch.setattr(fetch_data.HTTP_CACHE, "mode", "off")
+    calls = []
+    monkeypatch.setattr(fetch_data.yf, "download", fake_download(calls))
+    universe = pd.DataFrame(
+        [(f"T{i}", f"N{i}", "2024-01-01") for i in range(5)], columns=["ticker", "name", "start"]
+    )
+
+    out = fetch_data.fetch_prices(universe, batch_size=2)
+
+    assert len(calls) == 3
+    assert [c[0] for c in calls] == [["T0", "T1"], ["T2", "T3"], ["T4"]]
+    assert list(out.columns) == ["N0", "N1", "N2", "N3", "N4"]
+    assert out.index.tz is None
+    # Adj Close 블록에서 꺼냈는지: 첫 행의 N1 은 Adj Close 두 번째 컬럼 값
+    assert out["N1"].iloc[0] == 1.0
+
+
+def test_fetch_prices_falls_back_to_store_when_batch_fails(monkeypatch, tmp_path):
+    monkeypatch.setattr(fetch_data, "DIR", tmp_path)
+    idx = pd.date_range("2024-01-01", periods=3, freq="D")
+    pd.DataFrame({"SP500": [1.0, 2.0, 3.0]}, index=idx).to_csv(tmp_path / "all_data.csv")
+
+    def boom(*args, **kwargs):
+        raise RuntimeError("yahoo down")
+
+    monkeypatch.setattr(fetch_data, "fetch_adj_close_batch", boom)
+    universe = pd.DataFrame([("^GSPC", "SP500", "2008-01-01")], columns=["ticker", "name", "start"])
+
+    out = fetch_data.fetch_prices(universe)
+
+    assert out["SP500"].tolist() == [1.0, 2.0, 3.0]
+
+
+def test_load_universe_reads_config(tmp_path):
+    fp = tmp_path / "tickers.csv"
+    fp.write_text("# comment\nticker,name,start\n^GSPC,SP500,2008-01-01\nQQQ,,\n", encoding="utf-8")
+
+    uni = fetch_data.load_universe(fp)
+
+    assert uni.to_dict("records") == [
+        {"ticker": "^GSPC", "name": "SP500", "start": "2008-01-01"},
+        {"ticker": "QQQ", "name": "QQQ", "start": "2008-01-01"},
+    ]
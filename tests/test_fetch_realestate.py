@@ -0,0 +1,130 @@
+import json
+import threading
+import time
+
+import pandas as pd
+import requests
+
+import fetch_data
+
+
+def _response(payload):
+    resp = requests.Response()
+    resp.status_code = 200
+    resp._content = json.dumps(payload).encode("utf-8")
+    return resp
+
+
+class PagedDataGo:
+    """totalCount 만큼의 월별 행을 pageNo/numOfRows 로 나눠 돌려주는 가짜 공공데이터 API."""
+
+    def __init__(self, total, *, value_key, date_key, delay=0.0, fail=()):
+        self.total = total
+        self.value_key = value_key
+        self.date_key = date_key
+        self.delay = delay
+        self.fail = set(fail)
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def get(self, url, *, params=None, timeout=30, ttl=None):
+        with self.lock:
+            self.calls.append(dict(params))
+        time.sleep(self.delay)
+        if params.get("areaCode") in self.fail:
+            raise requests.ConnectionError("down")
+        page, size = params["pageNo"], params["numOfRows"]
+        months = pd.date_range("2010-01-01", periods=self.total, freq="MS")
+        rows = [
+            {self.date_key: d.strftime("%Y%m"), self.value_key: str(i)}
+            for i, d in enumerate(months[(page - 1) * size: page * size])
+        ]
+        # 한 행이면 item 이 리스트가 아니라 객체로 오는 응답 형식도 흉내 낸다.
+        items = {"item": rows[0] if len(rows) == 1 else rows}
+        return _response({"response": {"body": {"items": items, "totalCount": self.total}}})
+
+
+def test_unsold_follows_total_count(monkeypatch):
+    fake = PagedDataGo(25, value_key="unsoldHouseCnt", date_key="ym")
+    monkeypatch.setattr(fetch_data, "HTTP", fake)
+    monkeypatch.setattr(fetch_data, "MOLIT_KEY", "k")
+    monkeypatch.setattr(fetch_data, "DATA_GO_PAGE_SIZE", 10)
+
+    ser = fetch_data.fetch_unsold_house_status()
+
+    assert [c["pageNo"] for c in fake.calls] == [1, 2, 3]
+    assert len(ser) == 25
+    assert ser.name == "Unsold"
+
+
+def test_rone_fans_out_area_by_kind(monkeypatch):
+    fake = PagedDataGo(12, value_key="idx", date_key="baseYm", delay=0.05, fail={"BAD"})
+    monkeypatch.setattr(fetch_data, "HTTP", fake)
+    monkeypatch.setattr(fetch_data, "RONE_KEY", "k")
+    areas = ["11", "26", "27", "BAD"]
+
+    t0 = time.perf_counter()
+    df = fetch_data.fetch_rone_price_index(areas)
+    elapsed = time.perf_counter() - t0
+
+    assert len(fake.calls) == 8
+    assert elapsed < 0.05 * 8 / 2
+    assert list(df.columns) == ["sale_11", "sale_26", "sale_27", "rent_11", "rent_26", "rent_27"]
+    assert len(df) == 12
+
+
+def test_load_areas_reads_file(monkeypatch, tmp_path):
+    fp = tmp_path / "areas.csv"
+    fp.write_text("# 지역 코드\ncode,name\n11,서울\n26,부산\n11,서울\n", encoding="utf-8")
+    monkeypatch.setattr(fetch_data, "RTMS_AREA", "")
+
+    assert fetch_data.load_areas(fp) == ["11", "26"]
+
+    monkeypatch.setattr(fetch_data, "RTMS_AREA", "41, 28")
+    assert fetch_data.load_areas(fp) == ["41", "28"]
+
+
+class WeeklyTrend:
+    """기준일마다 그 주 한 행짜리 표를 돌려주는 가짜 부동산원 주간동향 페이지."""
+
+    def __init__(self, fail=()):
+        self.fail = set(fail)
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def get(self, url, *, params=None, timeout=30, ttl=None):
+        week = params["baseDate"]
+        with self.lock:
+            self.calls.append(week)
+        if week in self.fail:
+            raise requests.ConnectionError("down")
+        day = f"{week[:4]}-{week[4:6]}-{week[6:]}"
+        resp = requests.Response()
+        resp.status_code = 200
+        resp._content = (
+            f"<table><tr><th>날짜</th><th>지수</th></tr><tr><td>{day}</td><td>{int(week) % 97}</td></tr></table>"
+        ).encode("utf-8")
+        resp.encoding = "utf-8"
+        return resp
+
+
+def test_buy_index_backfill_resumes_from_checkpoint(monkeypatch, tmp_path):
+    monkeypatch.setattr(fetch_data, "DIR", tmp_path)
+    stored = pd.Series([50.0], index=pd.to_datetime(["2024-01-15"]), name="BuyIndex")
+    fetch_data.storage.write_frame(tmp_path / "BuyIndex", stored)
+
+    flaky = WeeklyTrend(fail={"20240122"})
+    monkeypatch.setattr(fetch_data, "HTTP", flaky)
+    first = fetch_data.backfill_buy_index("2024-01-01", "2024-01-29")
+
+    assert sorted(flaky.calls) == ["20240101", "20240108", "20240122", "20240129"]
+    assert first.loc["2024-01-15"] == 50.0
+    assert pd.Timestamp("2024-01-22") not in first.index
+
+    healthy = WeeklyTrend()
+    monkeypatch.setattr(fetch_data, "HTTP", healthy)
+    second = fetch_data.backfill_buy_index("2024-01-01", "2024-01-29")
+
+    assert healthy.calls == ["20240122"]
+    assert list(second.index) == list(pd.date_range("2024-01-01", "2024-01-29", freq="W-MON"))
+    assert fetch_data.buy_index_history().equals(second)
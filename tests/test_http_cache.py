@@ -0,0 +1,108 @@
+import os
+import time
+
+import requests
+
+from http_cache import ResponseCache
+from http_client import HttpClient
+from tests.test_http_client import ScriptedAdapter
+
+
+def test_key_strips_api_keys_and_sorts_params(tmp_path):
+    cache = ResponseCache(tmp_path, secrets=["SECRET123"])
+
+    a = cache.normalize(
+        "https://ecos.bok.or.kr/api/StatisticSearch/SECRET123/json/kr/1/10000/060Y002/M/200801/202401"
+    )
+    assert "SECRET123" not in a
+
+    b = cache.key("https://api.stlouisfed.org/x?series_id=CPI&api_key=k1&file_type=json")
+    c = cache.key("https://api.stlouisfed.org/x?file_type=json&api_key=k2&series_id=CPI")
+    assert b == c
+
+
+def _client(tmp_path, adapter):
+    session = requests.Session()
+    session.mount("https://", adapter)
+    return HttpClient(session=session, cache=ResponseCache(tmp_path), sleep=lambda s: None)
+
+
+def test_fresh_entry_is_served_without_network(tmp_path):
+    adapter = ScriptedAdapter([200])
+    client = _client(tmp_path, adapter)
+
+    first = client.get("https://api.example.com/obs?id=1", ttl=3600)
+    second = client.get("https://api.example.com/obs?id=1", ttl=3600)
+
+    assert adapter.calls == 1
+    assert second.from_cache is True
+    assert second.json() == first.json()
+    assert client.stats()["cache_hits"] == 1
+
+
+def test_expired_entry_is_revalidated_with_etag(tmp_path):
+    adapter = ScriptedAdapter([200, 304], headers={"ETag": '"v1"'})
+    client = _client(tmp_path, adapter)
+
+    client.get("https://api.example.com/obs", ttl=0)
+    resp = client.get("https://api.example.com/obs", ttl=0)
+
+    assert adapter.calls == 2
+    assert resp.from_cache is True
+    assert resp.json() == {"ok": True}
+    assert client.stats()["cache_revalidated"] == 1
+
+
+def test_refresh_mode_skips_reads(tmp_path):
+    adapter = ScriptedAdapter([200])
+    client = _client(tmp_path, adapter)
+    client.get("https://api.example.com/obs", ttl=3600)
+
+    client.cache.mode = "refresh"
+    resp = client.get("https://api.example.com/obs", ttl=3600)
+
+    assert adapter.calls == 2
+    assert resp.from_cache is False
+
+
+def test_evict_removes_least_recently_used(tmp_path):
+    cache = ResponseCache(tmp_path, max_bytes=10)
+    cache.store("old", b"123456", {})
+    past = time.time() - 100
+    os.utime(tmp_path / "old.body", (past, past))
+
+    cache.store("new", b"abcdef", {})
+
+    assert not (tmp_path / "old.body").exists()
+    assert (tmp_path / "new.body").exists()
+
+
+def test_load_returns_entry_evicted_after_read(tmp_path, monkeypatch):
+    cache = ResponseCache(tmp_path)
+    cache.store("k", b"body", {"etag": "v1"})
+
+    def evicted(fp, *args):
+        raise FileNotFoundError(fp)
+
+    monkeypatch.setattr(os, "utime", evicted)
+    entry = cache.load("k")
+
+    assert entry.body == b"body"
+    assert entry.meta["etag"] == "v1"
+    assert not list(tmp_path.glob(".*"))
+
+
+def test_store_scans_the_folder_only_when_over_the_limit(tmp_path, monkeypatch):
+    cache = ResponseCache(tmp_path, max_bytes=20)
+    scans = []
+    evict = cache.evict
+    monkeypatch.setattr(cache, "evict", lambda: scans.append(1) or evict())
+
+    cache.store("a", b"12345", {})  # 처음 한 번 훑어 합계를 잡는다
+    cache.store("b", b"12345", {})
+    cache.store("a", b"1234567", {})  # 덮어쓰면 차이만 더한다
+    assert len(scans) == 1
+
+    cache.store("c", b"123456789", {})  # 7 + 5 + 9 > 20
+    assert len(scans) == 2
+    assert sum(fp.stat().st_size for fp in tmp_path.glob("*.body")) <= 20
@@ -0,0 +1,119 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+from requests.adapters import BaseAdapter
+
+from http_client import HttpClient, TokenBucket, parse_retry_after
+
+
+class ScriptedAdapter(BaseAdapter):
+    """미리 정해 둔 상태 코드 순서대로 응답하는 테스트용 어댑터."""
+
+    def __init__(self, statuses, headers=None):
+        super().__init__()
+        self.statuses = list(statuses)
+        self.headers = headers or {}
+        self.calls = 0
+
+    def send(self, request, **kwargs):
+        status = self.statuses[min(self.calls, len(self.statuses) - 1)]
+        self.calls += 1
+        resp = requests.Response()
+        resp.status_code = status
+        resp.headers.update(self.headers)
+        resp.url = request.url
+        resp._content = b'{"ok": true}'
+        return resp
+
+    def close(self):
+        pass
+
+
+def _client(adapter, **kwargs):
+    session = requests.Session()
+    session.mount("https://", adapter)
+    sleeps = []
+    client = HttpClient(session=session, sleep=sleeps.append, **kwargs)
+    return client, sleeps
+
+
+def test_get_retries_transient_errors_and_honours_retry_after():
+    adapter = ScriptedAdapter([503, 429, 200], headers={"Retry-After": "2"})
+    client, sleeps = _client(adapter)
+
+    resp = client.get("https://api.example.com/x")
+
+    assert resp.status_code == 200
+    assert adapter.calls == 3
+    assert sleeps == [2.0, 2.0]
+    stats = client.stats()
+    assert stats["requests"] == 3
+    assert stats["retries"] == 2
+
+
+def test_get_gives_up_after_configured_retries():
+    adapter = ScriptedAdapter([500])
+    client, sleeps = _client(adapter, retries=2, backoff=0.1)
+
+    resp = client.get("https://api.example.com/x")
+
+    assert resp.status_code == 500
+    assert adapter.calls == 3
+    assert len(sleeps) == 2
+    assert all(0 <= s <= 0.2 for s in sleeps)
+    assert client.stats()["failures"] == 1
+
+
+def test_token_bucket_waits_when_empty():
+    now = [0.0]
+    slept = []
+
+    def sleep(sec):
+        slept.append(sec)
+        now[0] += sec
+
+    bucket = TokenBucket(rate=2.0, capacity=2, clock=lambda: now[0], sleep=sleep)
+    assert bucket.acquire() == 0.0
+    assert bucket.acquire() == 0.0
+    assert bucket.acquire() == 0.5
+    assert slept == [0.5]
+
+
+def test_parse_retry_after_seconds_and_garbage():
+    assert parse_retry_after("7") == 7.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_stats_count_each_pooled_connection_once():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    client = HttpClient()
+    try:
+        host, port = server.server_address
+        client.get(f"http://{host}:{port}/a")
+        client.get(f"http://{host}:{port}/b")
+        stats = client.stats()
+    finally:
+        client.close()
+        server.shutdown()
+        server.server_close()
+
+    assert stats["requests"] == 2
+    assert stats["new_connections"] == 1
+    assert stats["reused_connections"] == 1
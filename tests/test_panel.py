@@ -0,0 +1,207 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import panel
+import signals
+import storage
+
+
+def _native():
+    rate = pd.Series([1.0, 1.5, 2.0], index=pd.to_datetime(["2023-11-01", "2023-12-01", "2024-01-01"]))
+    bond = pd.Series([3.0, 3.5, 4.0], index=rate.index)
+    m2 = pd.Series([100.0, 131.0, 162.0], index=rate.index)
+    # 서로 다른 거래일 달력 – 합쳐서 패딩하지 않고 각자 저장된다.
+    sp = pd.Series([10.0, 11.0], index=pd.to_datetime(["2023-12-29", "2024-01-02"]))
+    kospi = pd.Series([20.0, 21.0], index=pd.to_datetime(["2023-12-28", "2024-01-03"]))
+    return {"Rate": rate, "Bond10": bond, "M2": m2, "SP500": sp, "KODEX200": kospi}
+
+
+def test_long_roundtrip_keeps_native_indices():
+    native = _native()
+    long = panel.to_long(native)
+
+    assert len(long) == 13
+    back = panel.split_long(long)
+    assert list(back) == list(native)
+    assert back["SP500"].index.equals(native["SP500"].index)
+    assert back["KODEX200"].tolist() == [20.0, 21.0]
+
+
+def test_align_matches_daily_ffill_and_linear_resample():
+    native = _native()
+    grid = pd.date_range("2023-11-01", "2024-01-05", freq="D")
+
+    df = panel.align(native, grid)
+
+    expected_rate = native["Rate"].resample("D").ffill().reindex(grid).ffill()
+    expected_m2 = native["M2"].resample("D").interpolate("linear").reindex(grid).ffill()
+    assert np.allclose(df["Rate"], expected_rate)
+    assert np.allclose(df["M2_D"], expected_m2)
+    assert np.isnan(df.loc["2023-12-27", "SP500"])
+    assert df.loc["2023-12-31", "SP500"] == 10.0
+    spread = (df["Bond10"] - df["Rate"]).rolling(5).mean()
+    assert np.allclose(df["Spread5D"], spread, equal_nan=True)
+    assert list(df.columns) == ["Rate", "Bond10", "Spread5D", "M2_D", "SP500", "KODEX200"]
+
+
+@pytest.mark.skipif(not storage.HAS_PARQUET, reason="pyarrow not installed")
+def test_load_panel_reads_window_with_lookback(tmp_path):
+    storage.write_frame(tmp_path / panel.NATIVE, panel.to_long(_native()), fmt="parquet")
+
+    df = panel.load_panel(tmp_path, columns=["Rate", "SP500"], start="2023-12-15", end="2023-12-31")
+
+    assert list(df.columns) == ["Rate", "SP500"]
+    assert df.index[0] == pd.Timestamp("2023-12-15")
+    assert df.index[-1] == pd.Timestamp("2023-12-31")
+    assert (df["Rate"] == 1.5).all()  # 창 시작 전 12-01 관측치를 as-of 로 가져옴
+    assert panel.bounds(tmp_path) == (pd.Timestamp("2023-11-01"), pd.Timestamp("2024-01-03"))
+
+
+def test_spread5d_is_a_five_day_mean_whatever_the_grid():
+    months = pd.date_range("2023-01-01", periods=8, freq="MS")
+    native = {"Rate": pd.Series(1.0, index=months), "Bond10": pd.Series(np.arange(2.0, 10.0), index=months)}
+
+    daily = panel.align(native, pd.date_range("2023-05-01", "2023-08-31", freq="D"), ["Spread5D"])["Spread5D"]
+    weekly = panel.align(native, pd.date_range("2023-06-04", "2023-08-31", freq="W"), ["Spread5D"])["Spread5D"]
+
+    # 창이 5월 1일에 시작해도 4월 27~30일 값까지 넣어 평균한다 (예전 일 변환 결과와 같음).
+    assert daily.loc["2023-05-01"] == pytest.approx((4 * 4.0 + 5.0) / 5)
+    assert daily.loc["2023-05-31"] == 5.0
+    assert daily.iloc[-1] == 8.0  # 마지막 관측(8월 1일) 뒤에도 유지된 값으로 5일 평균
+    assert weekly.equals(daily.reindex(weekly.index))
+
+
+def test_align_keeps_requested_columns_without_observations():
+    grid = pd.date_range("2023-11-01", "2023-11-05", freq="D")
+
+    df = panel.align({"Rate": _native()["Rate"]}, grid, ["Rate", "M2_D", "Spread5D", "NoSuchSeries"])
+
+    assert list(df.columns) == ["Rate", "Spread5D", "M2_D"]
+    assert df["M2_D"].isna().all() and df["Spread5D"].isna().all()
+
+
+@pytest.mark.skipif(not storage.HAS_PARQUET, reason="pyarrow not installed")
+def test_native_and_legacy_stores_score_the_same(tmp_path):
+    days = pd.date_range("2022-08-01", "2023-12-29", freq="D")
+    trading = days[days.dayofweek < 5]
+    rng = np.random.default_rng(1)
+    sp = pd.Series(100 + rng.normal(0, 1, len(trading)).cumsum(), index=trading)
+    fx = pd.Series(1300 + rng.normal(0, 5, len(trading)).cumsum(), index=trading)
+    months = pd.date_range("2022-08-01", "2023-12-01", freq="MS")
+    rate = pd.Series(1.0, index=months)
+    bond = pd.Series(np.linspace(2.0, 2.6, len(months)), index=months)
+    (tmp_path / "native").mkdir()
+    (tmp_path / "legacy").mkdir()
+    # native 에는 관측치가 없는 M2 가 아예 없고, 예전 all_data 에는 빈 M2_D 컬럼이 있다.
+    storage.write_frame(tmp_path / "native" / panel.NATIVE, panel.to_long({"FX": fx, "Rate": rate, "Bond10": bond, "SP500": sp}))
+    legacy = pd.DataFrame({"FX": fx, "Rate": rate, "Bond10": bond, "M2_D": np.nan, "SP500": sp}, index=days).ffill()
+    legacy["Spread5D"] = (legacy["Bond10"] - legacy["Rate"]).rolling(5).mean()
+    storage.write_frame(tmp_path / "legacy" / panel.LEGACY, legacy, fmt="csv")
+
+    columns = ["FX", "Rate", "Bond10", "Spread5D", "M2_D", "SP500"]
+    new = panel.load_panel(tmp_path / "native", columns=columns, start="2023-01-01")
+    old = panel.load_panel(tmp_path / "legacy", columns=columns, start="2023-01-01")
+
+    assert list(new.columns) == columns and new["M2_D"].isna().all()
+    pd.testing.assert_frame_equal(signals.score(new), signals.score(old), check_freq=False, check_index_type=False)
+
+
+@pytest.mark.skipif(not storage.HAS_PARQUET, reason="pyarrow not installed")
+def test_load_panel_carries_in_observations_older_than_lookback(tmp_path):
+    # 값이 바뀐 날만 남은 정책금리 – 마지막 변경이 창 시작보다 1년 넘게 앞선다.
+    rate = pd.Series([1.25, 0.5], index=pd.to_datetime(["2019-06-01", "2024-03-04"]))
+    bond = pd.Series(np.linspace(2.0, 3.0, 40), index=pd.date_range("2021-01-01", periods=40, freq="MS"))
+    storage.write_frame(tmp_path / panel.NATIVE, panel.to_long({"Rate": rate, "Bond10": bond}), fmt="parquet")
+    columns = ["Rate", "Bond10", "Spread5D"]
+
+    full = panel.load_panel(tmp_path, columns=columns)
+    window = panel.load_panel(tmp_path, columns=columns, start="2024-03-02", end="2024-03-10")
+
+    assert window["Rate"].tolist()[:3] == [1.25, 1.25, 0.5]
+    pd.testing.assert_frame_equal(window, full.loc[window.index[0]:window.index[-1]], check_freq=False, check_index_type=False)
+
+
+def test_load_panel_falls_back_to_daily_all_data(tmp_path):
+    idx = pd.date_range("2024-01-01", periods=10, freq="D")
+    legacy = pd.DataFrame({"Rate": [1.0] + [np.nan] * 9, "FX": np.arange(10.0)}, index=idx)
+    storage.write_frame(tmp_path / panel.LEGACY, legacy, fmt="csv")
+
+    df = panel.load_panel(tmp_path, start="2024-01-05")
+
+    assert df.index[0] == pd.Timestamp("2024-01-05")
+    assert (df["Rate"] == 1.0).all()
+
+
+def test_legacy_all_data_is_prepared_once(tmp_path):
+    idx = pd.date_range("2023-01-01", periods=400, freq="D")
+    legacy = pd.DataFrame(
+        {"^GSPC": np.arange(400.0), "CPIAUCSL": [100.0] + [np.nan] * 399, "Rate": 2.0, "FX": 1000.0, "Gold": 31.1035},
+        index=idx,
+    )
+    storage.write_frame(tmp_path / panel.LEGACY, legacy, fmt="csv")
+
+    out = panel.load_panel(tmp_path, columns=["SP500", "CPI_D", "Gold_KRWg"], start="2023-06-01", end="2023-06-10")
+    assert list(out.columns) == ["SP500", "CPI_D", "Gold_KRWg"]
+    assert out.index[0] == pd.Timestamp("2023-06-01") and len(out) == 10
+    assert out["CPI_D"].eq(100.0).all()
+    assert out["Gold_KRWg"].eq(1000.0).all()
+
+    prepared = storage.resolve(tmp_path / panel.PREPARED)
+    stamp = prepared.stat().st_mtime_ns
+    again = panel.load_panel(tmp_path, columns=["SP500", "CPI_D", "Gold_KRWg"], start="2023-06-01", end="2023-06-10")
+    pd.testing.assert_frame_equal(again, out)
+    assert prepared.stat().st_mtime_ns == stamp
+
+    storage.write_frame(tmp_path / panel.LEGACY, legacy * 2, fmt="csv")
+    assert panel.load_panel(tmp_path, columns=["SP500"], start="2023-06-01")["SP500"].iloc[0] == 2 * 151.0
+
+
+def test_compact_panel_encodes_steps_and_downcasts():
+    idx = pd.date_range("2020-01-01", periods=400, freq="D")
+    rate = pd.Series(np.repeat([1.25, 1.5, np.nan, 0.75], 100), index=idx)
+    price = pd.Series(np.round(np.linspace(100, 200, 400), 2), index=idx)
+    noisy = pd.Series(np.random.default_rng(0).normal(70_000, 5_000, 400), index=idx)
+    df = pd.DataFrame({"Rate": rate, "SP500": price, "Bitcoin": noisy})
+
+    compact = panel.CompactPanel.from_frame(df)
+
+    assert compact.kinds() == {"Rate": "step", "SP500": "float32", "Bitcoin": "float64"}
+    assert compact.nbytes < df.memory_usage().sum() * 0.75
+    back = compact.frame()
+    assert back.dtypes.eq("float64").all()
+    assert np.allclose(back, df, atol=1e-4, equal_nan=True)
+    window = compact.frame(["Rate"], start="2020-04-05", end="2020-04-12")
+    assert list(window.columns) == ["Rate"]
+    assert window.index[0] == pd.Timestamp("2020-04-05")
+    assert window["Rate"].tolist() == rate.loc["2020-04-05":"2020-04-12"].tolist()
+
+
+def test_live_panel_appends_new_rows_and_reloads_on_revisions(tmp_path):
+    native = _native()
+    storage.write_frame(tmp_path / panel.NATIVE, panel.to_long(native))
+    live = panel.LivePanel(tmp_path, columns=["Rate", "SP500"], compact=True)
+    assert not live.refresh()
+    assert live.index[-1] == pd.Timestamp("2024-01-02")
+
+    native["SP500"] = pd.concat([native["SP500"], pd.Series([12.0], index=pd.to_datetime(["2024-01-05"]))])
+    storage.write_frame(tmp_path / panel.NATIVE, panel.to_long(native))
+    assert live.refresh()
+    assert live.stats == {"reloads": 1, "appends": 1}
+    fresh = panel.load_panel(tmp_path, columns=["Rate", "SP500"])
+    pd.testing.assert_frame_equal(live.frame(), fresh, check_freq=False)
+
+    native["Rate"] = native["Rate"].replace(1.5, 1.25)
+    storage.write_frame(tmp_path / panel.NATIVE, panel.to_long(native))
+    assert live.refresh()
+    assert live.stats == {"reloads": 2, "appends": 1}
+    assert live.frame(start="2023-12-01", end="2023-12-01")["Rate"].iloc[0] == 1.25
+
+
+def test_last_valid_reads_every_column_at_once():
+    idx = pd.date_range("2024-01-01", periods=4)
+    df = pd.DataFrame({"a": [1, np.nan, 3, np.nan], "b": np.nan, "c": [5, 6, 7, 8.0]}, index=idx)
+
+    assert panel.last_valid(df) == {"a": 3.0, "c": 8.0}
+    assert panel.last_valid(df, ["c", "missing"]) == {"c": 8.0}
+    assert panel.last_valid(df.iloc[:0]) == {}
@@ -0,0 +1,99 @@
+import datetime as dt
+
+import requests
+
+import replay
+from http_cache import ResponseCache
+from http_client import HttpClient
+
+
+def record_fixtures(root):
+    """실제 키로 기록한 것처럼 FRED 응답 하나와 yfinance 본문 하나를 남깁니다."""
+    fixtures = replay.Fixtures(root, normalize=ResponseCache(root, secrets=["real-key"]).normalize)
+    fixtures.add(
+        "https://api.stlouisfed.org/fred/series/observations?series_id=CPI&api_key=real-key",
+        None,
+        b'{"observations": []}',
+        headers={"Content-Type": "application/json", "Date": "Mon, 01 Jan 2024 00:00:00 GMT"},
+    )
+    fixtures.add("https://finance.yahoo.com/download", {"ticker": "GC=F"}, b"date,GC=F\n2024-01-02,1.0\n")
+    fixtures.today = dt.date(2024, 1, 2)
+    fixtures.save()
+    return replay.Fixtures(root)
+
+
+def replay_client(fixtures, chaos=None, **kwargs):
+    session = requests.Session()
+    session.mount("https://", replay.ReplayAdapter(fixtures, chaos))
+    client = HttpClient(session=session, sleep=lambda s: None, **kwargs)
+    client.replay = True
+    return client
+
+
+def test_replay_serves_recorded_responses_without_keys(tmp_path):
+    client = replay_client(record_fixtures(tmp_path))
+
+    url = "https://api.stlouisfed.org/fred/series/observations"
+    resp = client.get(url, params={"api_key": replay.PLACEHOLDER_KEY, "series_id": "CPI"})
+    assert resp.status_code == 200
+    assert resp.json() == {"observations": []}
+    assert resp.headers["Content-Type"] == "application/json"
+    assert "Date" not in resp.headers
+
+    assert client.get(url, params={"series_id": "GDP"}).status_code == 404
+    assert client.session.get_adapter(url).misses == [ResponseCache(tmp_path).normalize(url, {"series_id": "GDP"})]
+    assert replay.run_date(tmp_path) == dt.date(2024, 1, 2)
+    body = client.cached("https://finance.yahoo.com/download", {"ticker": "GC=F"}, 60, lambda: b"live!")
+    assert body.startswith(b"date,GC=F")
+
+
+def test_injected_failures_exercise_retries(tmp_path):
+    fixtures = record_fixtures(tmp_path)
+    url = "https://api.stlouisfed.org/fred/series/observations?series_id=CPI&api_key=x"
+
+    flaky = replay_client(fixtures, replay.Chaos(fail_rate=0.5, seed=1), retries=10)
+    assert flaky.get(url).status_code == 200
+    assert flaky.stats()["retries"] > 0
+
+    down = replay_client(fixtures, replay.Chaos(fail_rate=1.0, fail_status=None), retries=2)
+    try:
+        down.get(url)
+    except requests.ConnectionError:
+        pass
+    else:
+        raise AssertionError("expected an injected connection error")
+    assert down.stats()["failures"] == 1
+
+
+def test_localhost_server_with_forward_adapter(tmp_path):
+    slept = []
+    server = replay.serve(record_fixtures(tmp_path), chaos=replay.Chaos(latency=0.01, sleep=slept.append))
+    try:
+        host, port = server.server_address
+        session = requests.Session()
+        session.mount("https://", replay.ForwardAdapter(f"http://{host}:{port}"))
+        resp = session.get(
+            "https://api.stlouisfed.org/fred/series/observations",
+            params={"series_id": "CPI", "api_key": replay.PLACEHOLDER_KEY},
+        )
+        missing = session.get("https://api.stlouisfed.org/fred/series/observations", params={"series_id": "GDP"})
+        today = replay.run_date(f"http://{host}:{port}")
+    finally:
+        server.shutdown()
+    assert resp.status_code == 200
+    assert resp.content == b'{"observations": []}'
+    assert missing.status_code == 404
+    assert session.get_adapter("https://x").misses == [missing.headers[replay.MISS_HEADER]]
+    assert today == dt.date(2024, 1, 2)
+    assert slept == [0.01, 0.01]
+
+
+def test_record_hook_captures_non_http_sources(tmp_path):
+    fixtures = replay.Fixtures(tmp_path)
+    client = HttpClient()
+    client.record = fixtures.add
+
+    client.cached("https://finance.yahoo.com/download", {"ticker": "SPY"}, 60, lambda: b"csv")
+
+    meta, body = fixtures.get("https://finance.yahoo.com/download", {"ticker": "SPY"})
+    assert (meta["status"], body) == (200, b"csv")
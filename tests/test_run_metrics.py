@@ -0,0 +1,59 @@
+import json
+import threading
+
+import pytest
+
+from run_metrics import RunMetrics
+
+
+def test_http_events_are_attributed_to_the_thread_node():
+    metrics = RunMetrics()
+
+    def worker(name, nbytes):
+        with metrics.track(name, kind="source"):
+            metrics.on_http({"latency": 0.5, "bytes": nbytes, "requests": 2, "retries": 1, "cache": "miss"})
+            metrics.on_http({"latency": 0.0, "bytes": 10, "requests": 0, "retries": 0, "cache": "hit"})
+
+    threads = [threading.Thread(target=worker, args=(n, b)) for n, b in [("FX", 100), ("CPI", 200)]]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    fx = metrics.records["FX"]
+    assert fx["bytes"] == 110
+    assert fx["requests"] == 2
+    assert fx["retries"] == 1
+    assert (fx["cache_hits"], fx["cache_misses"]) == (1, 1)
+    assert fx["status"] == "ok"
+    assert metrics.records["CPI"]["bytes"] == 210
+
+
+def test_errors_and_fallbacks_are_recorded():
+    metrics = RunMetrics()
+    with pytest.raises(RuntimeError):
+        with metrics.track("M2"):
+            metrics.fallback("next candidate")
+            raise RuntimeError("ecos down")
+
+    rec = metrics.records["M2"]
+    assert rec["status"] == "error"
+    assert rec["fallbacks"] == 1
+    assert "ecos down" in rec["error"]
+
+
+def test_write_appends_ndjson_with_run_summary(tmp_path):
+    metrics = RunMetrics()
+    with metrics.track("FX"):
+        pass
+    metrics.set("FX", rows=3)
+
+    log = tmp_path / "run_log.ndjson"
+    metrics.write(log)
+    metrics.write(log)
+
+    lines = [json.loads(l) for l in log.read_text(encoding="utf-8").splitlines()]
+    assert [l["node"] for l in lines] == ["FX", "_run", "FX", "_run"]
+    assert lines[0]["rows"] == 3
+    assert lines[1]["run_id"] == metrics.run_id
+    assert "FX" in metrics.table()
@@ -0,0 +1,87 @@
+import numpy as np
+import pandas as pd
+
+import signals
+
+
+def test_rolling_mean_matches_pandas_with_gaps():
+    rng = np.random.default_rng(0)
+    a = rng.normal(100, 5, size=(300, 3))
+    a[:40, 1] = np.nan
+    a[150:153, 2] = np.nan
+
+    expected = pd.DataFrame(a).rolling(20).mean().to_numpy()
+    np.testing.assert_allclose(signals.rolling_mean(a, 20), expected, rtol=1e-10, equal_nan=True)
+
+
+def test_score_matches_per_series_rules():
+    idx = pd.date_range("2020-01-01", periods=900, freq="D")
+    rng = np.random.default_rng(1)
+    df = pd.DataFrame({
+        "Gold_KRWg": 80_000 * np.cumprod(1 + rng.normal(0, 0.01, len(idx))),
+        "FX": 1_200 * np.cumprod(1 + rng.normal(0, 0.003, len(idx))),
+        "M2_D": 3_000 * np.cumprod(np.full(len(idx), 1.0002)),
+        "Spread5D": np.linspace(-1, 1, len(idx)),
+    }, index=idx)
+    df.loc[idx[:30], "FX"] = np.nan
+
+    out = signals.score(df)
+
+    gold = df["Gold_KRWg"]
+    ref = (np.sign(gold.rolling(20).mean() - gold.rolling(50).mean()) + np.sign(gold.pct_change(21))).clip(-2, 2)
+    pd.testing.assert_series_equal(out["Gold"], ref, check_names=False)
+    assert out["USDKRW"].iloc[:79].isna().all() and out["USDKRW"].iloc[79:].notna().all()
+    assert list(out.columns) == ["Gold", "USDKRW", "Macro"]
+
+    # M2 는 연 7.6 % 안팎(→ 1), 스프레드는 음수 → 양수
+    assert out["Macro"].loc["2020-03-01"] == -2  # 첫 해: YoY 결측 −1, 스프레드 <0 → −1
+    assert out["Macro"].iloc[-1] == 2
+    final = signals.final(out)
+    assert final.columns.tolist() == ["Gold", "USDKRW"]
+    assert final.abs().max().max() <= 3
+
+
+def test_release_lag_keeps_later_releases_out_of_past_macro():
+    idx = pd.date_range("2020-01-01", "2022-12-31", freq="D")
+    months = pd.date_range("2020-01-01", "2022-12-01", freq="MS")
+
+    def panel(m2_last: float, bond_last: float) -> pd.DataFrame:
+        m2 = pd.Series(3_000 * 1.006 ** np.arange(len(months)), index=months)
+        bond = pd.Series(1.0, index=months)
+        m2.iloc[-1], bond.iloc[-1] = m2_last, bond_last  # 마지막 달(2022-12) 발표만 다르다
+        return pd.DataFrame({
+            "M2_D": m2.reindex(idx).interpolate(limit_area="inside"),
+            "Rate": 1.0,
+            "Bond10": bond.reindex(idx).ffill(),
+        }, index=idx)
+
+    low, high = panel(1.0, -5.0), panel(1e6, 5.0)
+    before = slice(None, "2022-12-15")  # 12월 관측치는 아직 발표 전
+
+    lagged = [signals.score(df, release_lag=signals.RELEASE_LAG)["Macro"] for df in (low, high)]
+    pd.testing.assert_series_equal(lagged[0][before], lagged[1][before])
+    # 대시보드 규칙은 보간한 11월 말 M2 와 12월 1일 금리에서 12월 발표를 미리 본다
+    plain = [signals.score(df)["Macro"] for df in (low, high)]
+    assert not plain[0][before].equals(plain[1][before])
+
+
+def test_classifiers_keep_boundary_rules():
+    np.testing.assert_array_equal(signals.m2_score([9.5, 9.0, 6.0, 3.0, 2.9, np.nan]), [2, 1, 1, -1, -2, -1])
+    np.testing.assert_array_equal(signals.spread_score([0.6, 0.5, 0.0, -0.1, np.nan]), [1, 0, 0, -1, 0])
+    np.testing.assert_array_equal(signals.realty_score([1.0, 1.0, 1.0, 1.05, 1.01, 1.0, 0.9]), [-2, -2, -2, 2, 1, -1, -2])
+
+
+def test_store_slices_without_copying_and_ignores_window_start():
+    idx = pd.date_range("2020-01-01", periods=400, freq="D")
+    prices = 100 * np.cumprod(1 + np.random.default_rng(2).normal(0, 0.01, len(idx)))
+    store = signals.SignalStore(pd.DataFrame({"SP500": prices, "Spread5D": 1.0}, index=idx))
+
+    win = store.window("2020-03-01", "2020-06-30")
+    assert (win.index[0], win.index[-1]) == (pd.Timestamp("2020-03-01"), pd.Timestamp("2020-06-30"))
+    assert np.shares_memory(win.to_numpy(), store._scores)
+    assert win["SP500"].notna().all()  # 창 앞부분에도 워밍업 NaN 이 없다
+
+    last = store.window(final_only=True)["SP500"].iloc[-1]
+    assert store.latest() == {"SP500": int(last)}
+    assert store.latest("2020-06-30") == {"SP500": int(store.window(end="2020-06-30", final_only=True)["SP500"].iloc[-1])}
+    assert store.latest("2019-12-31") == {}
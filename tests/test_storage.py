@@ -0,0 +1,83 @@
+import pandas as pd
+import pytest
+
+import storage
+
+
+def _frame():
+    idx = pd.date_range("2000-01-01", periods=10_000, freq="D")
+    return pd.DataFrame({"A": range(10_000), "B": 1.5}, index=idx)
+
+
+@pytest.mark.skipif(not storage.HAS_PARQUET, reason="pyarrow not installed")
+def test_parquet_roundtrip_keeps_types_and_filters(tmp_path):
+    storage.write_frame(tmp_path / "all_data", _frame(), fmt="parquet")
+
+    out = storage.read_frame(tmp_path / "all_data", columns=["B", "missing"], start="2020-01-01")
+
+    assert list(out.columns) == ["B"]
+    assert isinstance(out.index, pd.DatetimeIndex)
+    assert out.index.min() == pd.Timestamp("2020-01-01")
+    assert out["B"].dtype == "float64"
+    assert out.index.name is None
+
+
+@pytest.mark.skipif(not storage.HAS_PARQUET, reason="pyarrow not installed")
+def test_parquet_preferred_over_csv_export(tmp_path):
+    df = _frame()
+    written = storage.write_frame(tmp_path / "all_data", df, fmt="parquet", csv_export=True)
+
+    assert {p.suffix for p in written} == {".parquet", ".csv"}
+    assert storage.resolve(tmp_path / "all_data.csv").suffix == ".parquet"
+
+
+def test_csv_projection_and_date_window(tmp_path):
+    storage.write_frame(tmp_path / "x", _frame(), fmt="csv")
+
+    out = storage.read_frame(tmp_path / "x.csv", columns=["A"], start="2001-01-01", end="2001-01-31")
+
+    assert list(out.columns) == ["A"]
+    assert len(out) == 31
+    assert out.index[0] == pd.Timestamp("2001-01-01")
+
+
+def test_batch_writer_skips_unchanged_and_writes_manifest(tmp_path):
+    import json
+    import zipfile
+
+    ser = pd.Series([1.0, 2.0], index=pd.to_datetime(["2024-01-01", "2024-02-01"]), name="CPI")
+    writer = storage.BatchWriter(tmp_path, fmt="csv", bundle=tmp_path / "bundle.zip")
+    assert writer.put("CPI_month", ser)
+    manifest = writer.commit()
+
+    entry = manifest["series"]["CPI_month"]
+    assert entry["rows"] == 2
+    assert entry["last"] == "2024-02-01"
+    assert entry["files"] == ["CPI_month.csv"]
+    assert json.loads((tmp_path / "manifest.json").read_text())["version"] == manifest["version"]
+    assert set(zipfile.ZipFile(tmp_path / "bundle.zip").namelist()) == {"manifest.json", "CPI_month.csv"}
+
+    stamp = (tmp_path / "CPI_month.csv").stat().st_mtime_ns
+    again = storage.BatchWriter(tmp_path, fmt="csv")
+    assert not again.put("CPI_month", ser.rename("other"))
+    assert again.commit()["version"] == manifest["version"]
+    assert (tmp_path / "CPI_month.csv").stat().st_mtime_ns == stamp
+
+    changed = storage.BatchWriter(tmp_path, fmt="csv")
+    assert changed.put("CPI_month", ser * 2)
+    assert changed.commit()["version"] != manifest["version"]
+
+
+def test_atomic_write_keeps_old_file_on_failure(tmp_path):
+    fp = tmp_path / "all_data.csv"
+    fp.write_text("old", encoding="utf-8")
+
+    def boom(tmp):
+        tmp.write_text("partial", encoding="utf-8")
+        raise RuntimeError("disk full")
+
+    with pytest.raises(RuntimeError):
+        storage.atomic_write(fp, boom)
+
+    assert fp.read_text(encoding="utf-8") == "old"
+    assert [p.name for p in tmp_path.iterdir()] == ["all_data.csv"]
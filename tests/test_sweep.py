@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import backtest
+import signals
+import sweep
+
+
+@pytest.fixture
+def frame():
+    idx = pd.date_range("2012-01-01", periods=1200, freq="D")
+    rng = np.random.default_rng(4)
+    return pd.DataFrame({
+        "KODEX200": 10_000 * np.cumprod(1 + rng.normal(0, 0.01, len(idx))),
+        "SP500": 1_500 * np.cumprod(1 + rng.normal(0.0003, 0.01, len(idx))),
+        "M2_D": 2_000 * np.cumprod(1 + rng.normal(0.0002, 0.0005, len(idx))),
+        "Spread5D": np.sin(np.arange(len(idx)) / 90),
+    }, index=idx)
+
+
+def test_grid_rows_match_the_dashboard_backtest(frame, tmp_path):
+    table = sweep.run(
+        frame, shorts=(10, 20, 60), longs=(50,), momenta=(21,),
+        m2_grid=((9, 6, 3), (5, 3, 1)), spread_grid=((0.5, 0),), rule="scaled", cost_bps=5, workers=1,
+    )
+
+    assert len(table) == 2 * 2 * 2  # short<long 두 조합 × M2 경계 두 개 × 자산 두 개
+    assert set(table["short"]) == {10, 20}
+
+    row = table.query("short == 20 and m2_cuts == '9/6/3'").set_index("asset")
+    expected = backtest.report(frame, signals.SignalStore(frame, release_lag=signals.RELEASE_LAG), rule="scaled", cost_bps=5)
+    pd.testing.assert_frame_equal(row[list(backtest.METRICS)], expected, check_names=False)
+
+    fp = sweep.save(table, tmp_path / "sweep.parquet")
+    pd.testing.assert_frame_equal(sweep.load(fp), table)
+
+
+def test_bad_rule_fails_before_spawning_workers(frame):
+    with pytest.raises(ValueError):
+        sweep.run(frame, rule="nope", workers=4)
@@ -23,18 +23,17 @@ def load_functions():
 
 def test_scaler_constant_returns_zeros():
     mod = load_functions()
-    mod.scale_mode = "표준화"
     s = pd.Series([1, 1, 1])
-    result = mod.scaler(s)
+    result = mod.scaler(s, "표준화")
     assert isinstance(result, pd.Series)
     assert (result == 0).all()
 
 
-def test_add_monthly_guides_shape_count():
+def test_add_monthly_guides_uses_minor_gridlines():
     mod = load_functions()
     fig = go.Figure()
-    start = pd.Timestamp("2021-01-01")
-    end = pd.Timestamp("2021-04-30")
-    mod.add_monthly_guides(fig, start, end)
-    assert len(fig.layout.shapes) == 4
+    mod.add_monthly_guides(fig)
+    assert len(fig.layout.shapes) == 0
+    assert fig.layout.xaxis.minor.dtick == "M1"
+    assert fig.layout.xaxis.minor.showgrid
 